@@ -0,0 +1,121 @@
+"""Генераторы синтетических данных в форматах лабораторных 7 и 8 (с фиксированным seed)"""
+import json
+import os
+import random
+import string
+import struct
+import zlib
+
+from lab71 import generate_temperatures
+
+CSV_HEADER = 'ProjectName;Manager;TeamSize;Budget;Duration;Completed'
+PROJECT_WORDS = ('CRM', 'Mobile', 'Web', 'Data', 'Cloud', 'Payment', 'Analytics', 'Portal',
+                 'System', 'Application', 'Platform', 'Service', 'Migration', 'Development')
+MANAGERS = ('Ivanov A.S.', 'Petrova M.I.', 'Sidorov K.L.', 'Kuznetsova E.V.', 'Smirnov D.A.')
+SPECIALIZATIONS = ('technical', 'legal', 'medical', 'literary', 'business')
+LANGUAGES = ('English', 'German', 'French', 'Spanish', 'Chinese')
+NAMES = ('Elena', 'Mark', 'Sophie', 'Thomas', 'Anna', 'Ivan', 'Olga', 'Pierre', 'Li', 'Maria')
+REGIONS = ('Asia', 'Europe', 'Africa', 'Americas', 'Oceania')
+
+def write_projects_csv(path, count, seed=0):
+    """Файл проектов в формате 11.csv (разделитель ';', единицы длительности months/years)"""
+    rnd = random.Random(seed)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(CSV_HEADER + '\n')
+        for i in range(count):
+            if rnd.random() < 0.1:
+                duration = f"{rnd.randint(1, 3)} years"
+            else:
+                duration = f"{rnd.randint(3, 24)} months"
+            f.write(f"{rnd.choice(PROJECT_WORDS)} {rnd.choice(PROJECT_WORDS)} {i};"
+                    f"{rnd.choice(MANAGERS)};{rnd.randint(2, 40)};{rnd.randrange(100000, 20000000, 1000)};"
+                    f"{duration};{rnd.choice(('Yes', 'No'))}\n")
+    return path
+
+def write_translators_json(path, count, seed=0):
+    """Файл переводчиков в формате 11.json: {"translators": [...]}, по записи в строке"""
+    rnd = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{\n  "translators": [\n')
+        for i in range(count):
+            record = {
+                "translator_id": f"tr{i:07d}",
+                "name": rnd.choice(NAMES),
+                "specialization": rnd.choice(SPECIALIZATIONS),
+                "language": rnd.choice(LANGUAGES),
+                "rate": rnd.randint(15, 60),
+                "experience_years": rnd.randint(1, 30),
+                "completed_projects": rnd.randint(0, 200),
+            }
+            f.write('    ' + json.dumps(record, ensure_ascii=False) + (',\n' if i < count - 1 else '\n'))
+        f.write('  ]\n}\n')
+    return path
+
+def write_text(path, lines, seed=0, width=80):
+    """Текстовый файл input.txt: строки из латиницы и кириллицы в разных регистрах"""
+    rnd = random.Random(seed)
+    alphabet = string.ascii_letters + 'АБВГДЕЖЗИКЛМНОПРСТабвгдежзиклмнопрст' + '   ,.:<>'
+    with open(path, 'w', encoding='utf-8') as f:
+        block = []
+        for _ in range(lines):
+            block.append(''.join(rnd.choices(alphabet, k=rnd.randint(width // 2, width))))
+            if len(block) == 4096:
+                f.write('\n'.join(block) + '\n')
+                block.clear()
+        if block:
+            f.write('\n'.join(block) + '\n')
+    return path
+
+def cities_temp(count, years=50, seed=0):
+    """Словарь {город: {год: температура}} в формате cities_temp; count - число значений"""
+    return generate_temperatures(max(1, count // years), years, seed)
+
+def countries_payload(count, seed=0):
+    """JSON ответ restcountries (/region/...) с count странами"""
+    rnd = random.Random(seed)
+    countries = []
+    for i in range(count):
+        code = string.ascii_lowercase[i // 26 % 26] + string.ascii_lowercase[i % 26]
+        countries.append({
+            "name": {"common": f"Country {i}"},
+            "capital": [f"Capital {i}"],
+            "area": round(rnd.uniform(1e3, 1e7), 1),
+            "population": rnd.randint(100000, 1500000000),
+            "cca2": code.upper(),
+            "region": rnd.choice(REGIONS),
+        })
+    return json.dumps(countries).encode('utf-8')
+
+def flag_png(width=64, height=40, seed=0):
+    """Небольшое корректное PNG изображение (вместо флага с flagcdn)"""
+    rnd = random.Random(seed)
+    color = bytes(rnd.randrange(256) for _ in range(3))
+    raw = b''.join(b'\0' + color * width for _ in range(height))
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw))
+            + chunk(b'IEND', b''))
+
+DATASETS = {
+    'csv': ('11.csv', write_projects_csv),
+    'json': ('11.json', write_translators_json),
+    'text': ('input.txt', write_text),
+}
+
+def dataset(kind, count, directory, seed=0):
+    """
+    Путь к сгенерированному файлу kind ('csv', 'json', 'text') на count записей.
+    Файлы кэшируются в directory по имени, размеру и seed
+    """
+    name, generate = DATASETS[kind]
+    stem, ext = os.path.splitext(name)
+    path = os.path.join(directory, f"{stem}-{count}-{seed}{ext}")
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        generate(path + '.tmp', count, seed)
+        os.replace(path + '.tmp', path)
+    return path
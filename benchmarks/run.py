@@ -0,0 +1,434 @@
+"""
+Бенчмарки функций лабораторных 7 и 8 на синтетических данных.
+Каждый случай выполняется в отдельном процессе: записываются время (лучшее
+из повторов), пропускная способность и пиковая память. Пиковая память
+случая (peak_kb) измеряется через tracemalloc в отдельном прогоне без замера
+времени и не включает подготовку данных; пиковый RSS процесса (peak_rss_kb,
+вместе с подготовкой и рабочими процессами) записывается там, где есть
+модуль resource. Результаты добавляются в историю, а при наличии базовой
+линии отмечаются регрессии
+"""
+import argparse
+import contextlib
+import fnmatch
+import io
+import json
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import get_context
+
+try:
+    import resource
+except ImportError:
+    # нет на Windows: пиковый RSS не записывается
+    resource = None
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path[:0] = [BENCH_DIR, os.path.join(ROOT, 'lab07'), os.path.join(ROOT, 'lab08')]
+
+import generators
+
+DATA_DIR = os.path.join(BENCH_DIR, '.data')
+HISTORY_FILE = os.path.join(BENCH_DIR, 'history.json')
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+TOPLIST_FIXTURE = os.path.join(ROOT, 'lab08', 'fixtures', 'toplist_sample.html')
+DEFAULT_SIZES = ('1K', '10K', '100K')
+HTTP_MAX_SIZE = 100000
+
+CASES = {}
+
+def case(name, max_size=None):
+    """
+    Регистрация случая. Функция получает (size, data_dir, workdir, seed) и
+    возвращает (функция для замера, число записей, функция очистки или None)
+    """
+    def register(prepare):
+        CASES[name] = (prepare, max_size)
+        return prepare
+    return register
+
+class ReplayServer:
+    """
+    Локальный HTTP сервер, отдающий сохраненные ответы: routes - список
+    (префикс пути, тело ответа); строка запроса не учитывается
+    """
+
+    def __init__(self, routes):
+        routes = sorted(routes, key=lambda route: -len(route[0]))
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                path = self.path.split('?', 1)[0]
+                body = next((body for prefix, body in routes if path.startswith(prefix)), None)
+                self.send_response(200 if body is not None else 404)
+                body = body if body is not None else b'not found'
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@case('lab72.convert_to_lowercase')
+def _lab72_readlines(size, data_dir, workdir, seed):
+    import lab72
+    source = generators.dataset('text', size, data_dir, seed)
+    target = os.path.join(workdir, 'output.txt')
+    return lambda: lab72.convert_to_lowercase(source, target), size, None
+
+@case('lab72.lowercase_stream')
+def _lab72_stream(size, data_dir, workdir, seed):
+    import lab72
+    source = generators.dataset('text', size, data_dir, seed)
+    target = os.path.join(workdir, 'output.txt')
+    return lambda: lab72.lowercase_stream(source, target), size, None
+
+@case('lab72.lowercase_parallel')
+def _lab72_parallel(size, data_dir, workdir, seed):
+    import lab72
+    source = generators.dataset('text', size, data_dir, seed)
+    target = os.path.join(workdir, 'output.txt')
+    return lambda: lab72.lowercase_parallel([(source, target)]), size, None
+
+@case('lab73.read_csv_file')
+def _lab73_lists(size, data_dir, workdir, seed):
+    import lab73
+    source = generators.dataset('csv', size, data_dir, seed)
+
+    def run():
+        data = lab73.read_csv_file(source)
+        lab73.find_min_max_budget(data)
+        lab73.calculate_total_team_size(data)
+        lab73.calculate_avg_completed_duration(data)
+        lab73.count_projects_by_status(data)
+    return run, size, None
+
+@case('lab73.aggregate_stream')
+def _lab73_stream(size, data_dir, workdir, seed):
+    import lab73
+    source = generators.dataset('csv', size, data_dir, seed)
+    return lambda: lab73.aggregate_stream(lab73.iter_csv_rows(source)), size, None
+
+@case('lab73.aggregate_columns')
+def _lab73_columns(size, data_dir, workdir, seed):
+    import lab73
+    source = generators.dataset('csv', size, data_dir, seed)
+    return lambda: lab73.aggregate_columns(lab73.load_columns(source)), size, None
+
+@case('lab73.aggregate_parallel')
+def _lab73_parallel(size, data_dir, workdir, seed):
+    import lab73
+    source = generators.dataset('csv', size, data_dir, seed)
+    return lambda: lab73.aggregate_parallel(source), size, None
+
+@case('lab74.read_json_file')
+def _lab74_lists(size, data_dir, workdir, seed):
+    import lab74
+    source = generators.dataset('json', size, data_dir, seed)
+
+    def run():
+        data = lab74.read_json_file(source)
+        lab74.find_translators_by_language(data, 'English')
+        lab74.calculate_avg_rate_by_specialization(data)
+        lab74.calculate_avg_experience_by_language(data)
+    return run, size, None
+
+@case('lab74.analyze_stream')
+def _lab74_stream(size, data_dir, workdir, seed):
+    import lab74
+    source = generators.dataset('json', size, data_dir, seed)
+    target = os.path.join(workdir, 'out.json')
+    return lambda: lab74.analyze_stream(source, 'English', target), size, None
+
+@case('lab74.TranslatorStore')
+def _lab74_store(size, data_dir, workdir, seed):
+    import lab74
+    source = generators.dataset('json', size, data_dir, seed)
+    data = lab74.read_json_file(source)
+
+    def run():
+        store = lab74.TranslatorStore.from_data(data)
+        store.find_by_language('English')
+        store.avg_rates()
+        store.avg_experiences()
+    return run, size, None
+
+@case('lab71.TemperatureMatrix')
+def _lab71_matrix(size, data_dir, workdir, seed):
+    import lab71
+    data = generators.cities_temp(size, seed=seed)
+    years = next(iter(data.values()))
+
+    def run():
+        matrix = lab71.TemperatureMatrix.from_dict(data)
+        matrix.city_means()
+        matrix.max_years()
+        matrix.min_years()
+        matrix.year_diff(*list(years)[:2])
+    return run, size, None
+
+@case('lab71.RollingStats')
+def _lab71_rolling(size, data_dir, workdir, seed):
+    import lab71
+    matrix = lab71.TemperatureMatrix.from_dict(generators.cities_temp(size, seed=seed))
+    return lambda: lab71.RollingStats.from_matrix(matrix), size, None
+
+@case('lab71.pickle_load')
+def _lab71_pickle(size, data_dir, workdir, seed):
+    path = os.path.join(workdir, 'data.pickle')
+    with open(path, 'wb') as f:
+        pickle.dump(generators.cities_temp(size, seed=seed), f)
+
+    def run():
+        with open(path, 'rb') as f:
+            pickle.load(f)
+    return run, size, None
+
+@case('lab71.TemperatureFile')
+def _lab71_file(size, data_dir, workdir, seed):
+    import lab71
+    path = os.path.join(workdir, lab71.DATA_FILE)
+    lab71.save_temperatures(lab71.TemperatureMatrix.from_dict(generators.cities_temp(size, seed=seed)), path)
+
+    def run():
+        with lab71.TemperatureFile(path) as loaded:
+            loaded.to_matrix()
+    return run, size, None
+
+@case('lab81.get_countries', max_size=HTTP_MAX_SIZE)
+def _lab81_countries(size, data_dir, workdir, seed):
+    import lab81
+    per_region = max(1, size // len(lab81.REGIONS))
+    server = ReplayServer([('/region/', generators.countries_payload(per_region, seed))])
+    session = lab81.create_session()
+
+    def run():
+        countries = lab81.get_countries(lab81.REGIONS, 0, session=session, base_url=server.url)
+        lab81.calculate_population_density(countries)
+    return run, per_region * len(lab81.REGIONS), server.close
+
+@case('lab81.download_flags', max_size=HTTP_MAX_SIZE // 10)
+def _lab81_flags(size, data_dir, workdir, seed):
+    import lab81
+    server = ReplayServer([('/', generators.flag_png(seed=seed))])
+    countries = json.loads(generators.countries_payload(size, seed))
+    countries = [lab81._country_record(country) for country in countries]
+    flags_dir = os.path.join(workdir, 'country_flags')
+    os.makedirs(flags_dir)
+    session = lab81.create_session()
+    return (lambda: lab81.download_flags(countries, flags_dir, session, base_url=server.url),
+            size, server.close)
+
+@case('lab82.scrape_rows', max_size=HTTP_MAX_SIZE // 5)
+def _lab82_rows(size, data_dir, workdir, seed):
+    import lab82
+    with open(TOPLIST_FIXTURE, 'rb') as f:
+        page = f.read()
+    server = ReplayServer([('/', page)])
+    session = lab82.create_session()
+    pages = -(-size // 100)
+    return (lambda: lab82.scrape_rows('100-metres', 'men', 2024, session, base_url=server.url,
+                                      top_n=size, max_pages=pages),
+            size, server.close)
+
+def parse_size(value):
+    """'10K' -> 10000, '10M' -> 10000000"""
+    value = value.strip().upper()
+    scale = {'K': 1000, 'M': 1000000}.get(value[-1:], 1)
+    return int(float(value.rstrip('KM')) * scale)
+
+def _peak_rss_kb():
+    """Пиковый RSS процесса и его дочерних процессов в КБ (None без модуля resource)"""
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # на macOS ru_maxrss в байтах
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def _traced_peak_kb(run):
+    """
+    Пик памяти, выделенной за один вызов run() (tracemalloc, КБ).
+    Данные, подготовленные до вызова, не учитываются
+    """
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1] // 1024
+    finally:
+        tracemalloc.stop()
+
+def _measure(connection, name, size, data_dir, repeat, seed):
+    """Выполняется в дочернем процессе: подготовка, повторы и замер памяти"""
+    try:
+        prepare, _ = CASES[name]
+        with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()):
+            run, records, cleanup = prepare(size, data_dir, workdir, seed)
+            try:
+                rss_before = _peak_rss_kb()
+                best = float('inf')
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    run()
+                    best = min(best, time.perf_counter() - start)
+                peak_rss = _peak_rss_kb()
+                peak = _traced_peak_kb(run)
+            finally:
+                if cleanup is not None:
+                    cleanup()
+        connection.send({
+            'wall': best,
+            'records': records,
+            'throughput': records / best if best else None,
+            'peak_kb': peak,
+            'peak_rss_kb': peak_rss,
+            'rss_before_kb': rss_before,
+        })
+    except BaseException as e:
+        connection.send({'error': f"{type(e).__name__}: {e}"})
+    finally:
+        connection.close()
+
+def run_case(name, size, data_dir=DATA_DIR, repeat=3, seed=0):
+    """Замер одного случая в отдельном процессе (чтобы пиковая память не смешивалась)"""
+    context = get_context('spawn')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_measure, args=(sender, name, size, data_dir, repeat, seed))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = {'error': f"процесс завершился с кодом {process.exitcode}"}
+    process.join()
+    return result
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _save_json(path, data):
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(os.path.abspath(path)),
+                                     delete=False) as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(f.name, path)
+
+def find_regressions(results, baseline, tolerance=0.2):
+    """
+    Сравнение с базовой линией: регрессия, если время или пиковая память
+    случая (peak_kb) больше базовых более чем на tolerance (доля)
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base or 'error' in result:
+            continue
+        for metric in ('wall', 'peak_kb'):
+            if base.get(metric) and result.get(metric) and result[metric] > base[metric] * (1 + tolerance):
+                regressions.append((key, metric, base[metric], result[metric]))
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки лабораторных 7 и 8")
+    parser.add_argument('--cases', nargs='*', default=['*'],
+                        help="шаблоны имен случаев (по умолчанию все), см. --list")
+    parser.add_argument('--sizes', nargs='*', default=list(DEFAULT_SIZES),
+                        help="размеры в записях, допускаются суффиксы K и M (по умолчанию 1K 10K 100K)")
+    parser.add_argument('--repeat', type=int, default=3, help="число повторов (берется лучшее время)")
+    parser.add_argument('--seed', type=int, default=0, help="seed генераторов данных")
+    parser.add_argument('--data-dir', default=DATA_DIR, help="каталог для сгенерированных файлов")
+    parser.add_argument('--history', default=HISTORY_FILE,
+                        help="JSON файл истории запусков (по умолчанию benchmarks/history.json, не в git)")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="JSON файл базовой линии")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="записать результаты запуска как новую базовую линию")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="допустимое ухудшение относительно базовой линии (по умолчанию 0.2 = 20%%)")
+    parser.add_argument('--list', action='store_true', help="вывести список случаев и завершить работу")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.list:
+        for name, (_, max_size) in CASES.items():
+            print(name if max_size is None else f"{name} (до {max_size} записей)")
+        return 0
+
+    names = [name for name in CASES if any(fnmatch.fnmatch(name, pattern) for pattern in args.cases)]
+    sizes = [parse_size(size) for size in args.sizes]
+    results = {}
+    print(f"{'случай':<30} {'размер':>10} {'время, с':>10} {'записей/с':>12} {'память, МБ':>10} {'RSS, МБ':>9}")
+    for name in names:
+        max_size = CASES[name][1]
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                continue
+            key = f"{name}@{size}"
+            result = results[key] = run_case(name, size, args.data_dir, args.repeat, args.seed)
+            if 'error' in result:
+                print(f"{name:<30} {size:>10} ошибка: {result['error']}")
+            else:
+                rss = result['peak_rss_kb']
+                rss = f"{rss / 1024:>9.1f}" if rss is not None else f"{'н/д':>9}"
+                print(f"{name:<30} {size:>10} {result['wall']:>10.4f} {result['throughput']:>12.0f} "
+                      f"{result['peak_kb'] / 1024:>10.1f} {rss}")
+
+    history = _load_json(args.history, [])
+    history.append({
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'seed': args.seed,
+        'results': results,
+    })
+    _save_json(args.history, history)
+
+    if args.save_baseline:
+        baseline = _load_json(args.baseline, {})
+        baseline.update({key: result for key, result in results.items() if 'error' not in result})
+        _save_json(args.baseline, baseline)
+        print(f"\nБазовая линия сохранена в '{args.baseline}'")
+        return 0
+
+    regressions = find_regressions(results, _load_json(args.baseline, {}), args.tolerance)
+    if regressions:
+        print("\nРегрессии относительно базовой линии:")
+        for key, metric, base, value in regressions:
+            print(f"  {key}: {metric} {base:.4g} -> {value:.4g} ({value / base - 1:+.0%})")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+Прозрачное чтение и запись сжатых файлов (gzip, bz2, xz).
+Формат входного файла определяется по сигнатуре, распаковка идет
+в фоновом потоке крупными блоками, параллельно с разбором данных.
+Формат выходного файла задается явно или по расширению имени
+"""
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+import os
+import queue
+import tempfile
+import threading
+
+MAGIC = (
+    (b'\x1f\x8b', 'gz'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+)
+OPENERS = {
+    'gz': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+EXTENSIONS = {
+    '.gz': 'gz',
+    '.gzip': 'gz',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+}
+COMPRESSIONS = tuple(OPENERS)
+READ_CHUNK = 1024 * 1024
+QUEUE_DEPTH = 4
+
+def _read_umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+# umask читается один раз: os.umask меняет его для всего процесса
+UMASK = _read_umask()
+
+def default_permissions(filename):
+    """
+    Права как у файла, созданного через open(): 0o666 без битов umask.
+    mkstemp и NamedTemporaryFile создают файл с правами 0600, которые
+    сохраняются после os.replace
+    """
+    os.chmod(filename, 0o666 & ~UMASK)
+
+def detect_compression(filename):
+    """Формат сжатия по сигнатуре файла ('gz', 'bz2', 'xz') или None"""
+    with open(filename, 'rb') as file:
+        head = file.read(6)
+    for magic, compression in MAGIC:
+        if head.startswith(magic):
+            return compression
+    return None
+
+def compression_from_name(filename):
+    """Формат сжатия по расширению имени файла или None"""
+    return EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+
+def _resolve(filename, compression):
+    if compression == 'auto':
+        return compression_from_name(filename)
+    if compression is not None and compression not in OPENERS:
+        raise ValueError(f"неизвестный формат сжатия: {compression}")
+    return compression
+
+class ThreadedReader(io.RawIOBase):
+    """
+    Двоичный поток, который читает (и тем самым распаковывает) stream
+    блоками по chunk_size в фоновом потоке. Между потоками не более depth
+    готовых блоков, поэтому память ограничена. Распаковка zlib/bz2/lzma
+    отпускает GIL, так что она идет одновременно с разбором в основном потоке
+    """
+
+    def __init__(self, stream, chunk_size=READ_CHUNK, depth=QUEUE_DEPTH):
+        super().__init__()
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._queue = queue.Queue(depth)
+        self._stop = threading.Event()
+        self._block = b''
+        self._pos = 0
+        self._eof = False
+        self._thread = threading.Thread(target=self._pump, daemon=True)
+        self._thread.start()
+
+    def _pump(self):
+        try:
+            while not self._stop.is_set():
+                block = self._stream.read(self._chunk_size)
+                self._queue.put(block)
+                if not block:
+                    break
+        except BaseException as e:
+            self._queue.put(e)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while self._pos >= len(self._block):
+            if self._eof:
+                return 0
+            block = self._queue.get()
+            if isinstance(block, BaseException):
+                self._eof = True
+                raise block
+            if not block:
+                self._eof = True
+                return 0
+            self._block, self._pos = block, 0
+        size = min(len(buffer), len(self._block) - self._pos)
+        buffer[:size] = self._block[self._pos:self._pos + size]
+        self._pos += size
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._stop.set()
+            while self._thread.is_alive():
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    self._thread.join(0.01)
+            self._stream.close()
+        super().close()
+
+def open_input(filename, mode='r', encoding='utf-8', newline=None, threaded=True,
+               chunk_size=READ_CHUNK):
+    """
+    Открытие файла для чтения с автоматической распаковкой.
+    mode - 'r' (текст) или 'rb'; несжатый файл открывается обычным open
+    """
+    compression = detect_compression(filename)
+    binary = 'b' in mode
+    if compression is None:
+        if binary:
+            return open(filename, 'rb')
+        return open(filename, 'r', encoding=encoding, newline=newline)
+
+    stream = OPENERS[compression](filename, 'rb')
+    if threaded:
+        stream = io.BufferedReader(ThreadedReader(stream, chunk_size), chunk_size)
+    if binary:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding, newline=newline)
+
+def open_output(filename, mode='w', encoding='utf-8', newline=None, compression='auto'):
+    """
+    Открытие файла для записи; compression - None, 'gz', 'bz2', 'xz'
+    или 'auto' (по расширению имени файла)
+    """
+    compression = _resolve(filename, compression)
+    binary = 'b' in mode
+    if compression is None:
+        if binary:
+            return open(filename, mode)
+        return open(filename, mode, encoding=encoding, newline=newline)
+    if binary:
+        return OPENERS[compression](filename, mode)
+    return OPENERS[compression](filename, mode.replace('t', '') + 't', encoding=encoding, newline=newline)
+
+@contextlib.contextmanager
+def atomic_output(filename, mode='w', encoding='utf-8', newline=None, compression='auto'):
+    """
+    Запись во временный файл в каталоге filename (со сжатием, как open_output)
+    с атомарным переименованием при успешном завершении блока with
+    """
+    compression = _resolve(filename, compression)
+    directory = os.path.dirname(os.path.abspath(filename))
+    descriptor, temp_name = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    os.close(descriptor)
+    try:
+        with open_output(temp_name, mode, encoding, newline, compression) as file:
+            yield file
+        default_permissions(temp_name)
+        os.replace(temp_name, filename)
+    finally:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
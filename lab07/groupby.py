@@ -0,0 +1,279 @@
+"""
+Хеш-группировка потока записей (строки CSV из csv.DictReader или объекты
+из JSON) с агрегатами count/sum/mean/min/max, которые вычисляются за один
+проход без хранения списков значений: память зависит только от числа групп
+"""
+import operator
+import re
+
+AGGREGATES = ('count', 'sum', 'mean', 'min', 'max')
+
+OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+}
+
+CONDITION_RE = re.compile(r'^\s*([^\s=!<>]+)\s*(==|!=|>=|<=|>|<)\s*(.*?)\s*$')
+
+def parse_condition(text):
+    """
+    Разбор условия вида 'Completed == Yes' или 'experience_years > 5'
+    в кортеж (поле, оператор, значение); числа преобразуются в float
+    """
+    match = CONDITION_RE.match(text)
+    if not match:
+        raise ValueError(f"некорректное условие: {text!r}")
+    field, op, value = match.groups()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '\'"':
+        return field, op, value[1:-1]
+    try:
+        return field, op, float(value)
+    except ValueError:
+        return field, op, value
+
+def _normalize(value):
+    return str(value).strip().lower()
+
+def _compile_condition(condition):
+    """
+    Условие -> функция record -> bool. Числовое значение сравнивается
+    с полем, преобразованным в float (непреобразуемое поле не подходит),
+    строки сравниваются без учета регистра и пробелов по краям
+    """
+    if callable(condition):
+        return condition
+    if isinstance(condition, str):
+        condition = parse_condition(condition)
+    field, op, expected = condition
+    if op not in OPERATORS:
+        raise ValueError(f"неизвестный оператор: {op!r}")
+    compare = OPERATORS[op]
+
+    if isinstance(expected, (int, float)) and not isinstance(expected, bool):
+        def check(record):
+            try:
+                return compare(float(record.get(field)), expected)
+            except (ValueError, TypeError):
+                return False
+    else:
+        expected = _normalize(expected)
+
+        def check(record):
+            value = record.get(field)
+            return value is not None and compare(_normalize(value), expected)
+    return check
+
+def _compile_where(where):
+    if not where:
+        return None
+    if isinstance(where, (str, tuple)) or callable(where):
+        where = [where]
+    checks = [_compile_condition(condition) for condition in where]
+    if len(checks) == 1:
+        return checks[0]
+    return lambda record: all(check(record) for check in checks)
+
+def _field_getter(key):
+    if callable(key):
+        return key
+    return lambda record: record.get(key)
+
+def _compile_key(keys):
+    if not keys:
+        return lambda record: ()
+    getters = [_field_getter(key) for key in keys]
+    if len(getters) == 1:
+        return getters[0]
+    return lambda record: tuple(getter(record) for getter in getters)
+
+def _parse_spec(spec):
+    """'count' или (функция, поле[, преобразование]) -> (функция, поле, преобразование)"""
+    if isinstance(spec, str):
+        spec = (spec,)
+    func, field, *rest = tuple(spec) + (None,) * (2 - len(spec))
+    if func not in AGGREGATES:
+        raise ValueError(f"неизвестный агрегат: {func!r}")
+    if field is None and func != 'count':
+        raise ValueError(f"для агрегата {func!r} нужно указать поле")
+    convert = rest[0] if rest else (None if func == 'count' else float)
+    return func, field, convert
+
+class GroupBy:
+    """
+    Группировка по одному или нескольким ключам.
+    keys - имя поля, функция record -> значение или кортеж из них (() - одна группа);
+    aggregates - {имя результата: 'count' или (функция, поле[, преобразование])},
+    где функция - count/sum/mean/min/max, преобразование по умолчанию float
+    (значения, которые не удалось преобразовать, пропускаются);
+    where - условия ('поле > 5', (поле, оператор, значение) или функция),
+    проверяются до извлечения ключа и значений;
+    skip_empty_keys - не создавать группы с пустым (None, '') ключом.
+
+    Реализует протокол агрегатов lab73 (update/merge/result), поэтому
+    может использоваться в aggregate_stream и aggregate_parallel
+    """
+    name = 'group_by'
+
+    def __init__(self, keys, aggregates, where=(), skip_empty_keys=False):
+        if isinstance(keys, str) or callable(keys):
+            keys = (keys,)
+        self.keys = tuple(keys)
+        self.aggregates = {name: _parse_spec(spec) for name, spec in aggregates.items()}
+        self.where = where
+        self.skip_empty_keys = skip_empty_keys
+        self.groups = {}
+        self._compile()
+
+    def _compile(self):
+        self._key = _compile_key(self.keys)
+        self._where = _compile_where(self.where)
+        self._inputs = []
+        self._initial = []
+        for func, field, convert in self.aggregates.values():
+            self._inputs.append((func, len(self._initial), field, convert))
+            if func == 'mean':
+                self._initial += [0, 0]
+            elif func in ('min', 'max'):
+                self._initial.append(None)
+            else:
+                self._initial.append(0)
+        self.update = self._build_update()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ('_key', '_where', '_inputs', '_initial', 'update'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._compile()
+
+    def _build_update(self):
+        """
+        Функция update(record), собранная под конкретный запрос: поля и
+        состояние берутся из замыкания, а не из атрибутов объекта
+        """
+        groups = self.groups
+        where = self._where
+        key_field = self.keys[0] if len(self.keys) == 1 and not callable(self.keys[0]) else None
+        get_key = self._key
+        skip_empty_keys = self.skip_empty_keys
+        initial = self._initial
+        inputs = tuple(
+            (AGGREGATES.index(func), slot, field if not callable(field) else None,
+             field if callable(field) else None, convert)
+            for func, slot, field, convert in self._inputs
+        )
+
+        if (len(inputs) == 1 and inputs[0][0] == 2 and inputs[0][2] is not None and
+                key_field is not None and where is None):
+            # частый случай: среднее одного поля по одному ключу
+            _, _, field, _, convert = inputs[0]
+
+            def update_mean(record):
+                key = record.get(key_field)
+                if skip_empty_keys and (key is None or key == ''):
+                    return
+                value = record.get(field)
+                if value is None:
+                    return
+                try:
+                    value = convert(value) if convert is not None else value
+                except (ValueError, TypeError):
+                    return
+                state = groups.get(key)
+                if state is None:
+                    state = groups[key] = [0, 0]
+                state[0] += value
+                state[1] += 1
+            return update_mean
+
+        def update(record):
+            if where is not None and not where(record):
+                return
+            key = record.get(key_field) if key_field is not None else get_key(record)
+            if skip_empty_keys and (key is None or key == '' or
+                                    (key.__class__ is tuple and (None in key or '' in key))):
+                return
+
+            state = None
+            for func, slot, field, getter, convert in inputs:
+                if getter is not None:
+                    value = getter(record)
+                elif field is not None:
+                    value = record.get(field)
+                else:
+                    value = 1
+                if value is None:
+                    continue
+                if convert is not None:
+                    try:
+                        value = convert(value)
+                    except (ValueError, TypeError):
+                        continue
+                if state is None:
+                    state = groups.get(key)
+                    if state is None:
+                        state = groups[key] = initial.copy()
+                if func == 2:
+                    state[slot] += value
+                    state[slot + 1] += 1
+                elif func <= 1:
+                    state[slot] += 1 if func == 0 else value
+                elif func == 3:
+                    if state[slot] is None or value < state[slot]:
+                        state[slot] = value
+                elif state[slot] is None or value > state[slot]:
+                    state[slot] = value
+        return update
+
+    def run(self, records):
+        """Обработка всех записей; возвращает self"""
+        for _ in map(self.update, records):
+            pass
+        return self
+
+    def merge(self, other):
+        for key, other_state in other.groups.items():
+            state = self.groups.get(key)
+            if state is None:
+                self.groups[key] = list(other_state)
+                continue
+            for func, slot, _, _ in self._inputs:
+                if func in ('count', 'sum'):
+                    state[slot] += other_state[slot]
+                elif func == 'mean':
+                    state[slot] += other_state[slot]
+                    state[slot + 1] += other_state[slot + 1]
+                elif other_state[slot] is not None and (
+                        state[slot] is None or
+                        (other_state[slot] < state[slot] if func == 'min' else other_state[slot] > state[slot])):
+                    state[slot] = other_state[slot]
+
+    def _value(self, state, func, slot):
+        if func == 'mean':
+            return state[slot] / state[slot + 1] if state[slot + 1] else None
+        return state[slot]
+
+    def result(self):
+        """{ключ группы: {имя агрегата: значение}} в порядке появления групп"""
+        names = list(self.aggregates)
+        return {
+            key: {name: self._value(state, func, slot)
+                  for name, (func, slot, _, _) in zip(names, self._inputs)}
+            for key, state in self.groups.items()
+        }
+
+    def column(self, name):
+        """{ключ группы: значение одного агрегата}"""
+        func, slot, _, _ = self._inputs[list(self.aggregates).index(name)]
+        return {key: self._value(state, func, slot) for key, state in self.groups.items()}
+
+def group_by(records, keys, aggregates, where=(), skip_empty_keys=False):
+    """Однократный запрос: группировка записей и результат GroupBy.result()"""
+    return GroupBy(keys, aggregates, where, skip_empty_keys).run(records).result()
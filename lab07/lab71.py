@@ -1,4 +1,19 @@
+import argparse
+import bisect
+import json
+import math
+import mmap
+import os
 import pickle
+import random
+import struct
+import tempfile
+import time
+from collections import deque
+from array import array
+from itertools import filterfalse
+
+from compressed import default_permissions
 
 cities_temp = {
     "Москва": {"2017": 6.5, "2018": 7.2, "2019": 5.8, "2020": 7.9, "2021": 6.3, "2022": 7.1},
@@ -10,63 +25,540 @@ cities_temp = {
     "Краснодар": {"2017": 12.5, "2018": 12.9, "2019": 11.8, "2020": 13.2, "2021": 12.7, "2022": 13.1}
 }
 
-print("1. Список городов и средние температуры в них:")
-print("-" * 50)
-for city, temps in cities_temp.items():
-    avg_temp = sum(temps.values()) / len(temps)
-    print(f"{city}: средняя температура за 6 лет = {avg_temp:.2f}°C")
-print()
-
-print("2. Год с максимальной температурой для каждого города:")
-print("-" * 50)
-for city, temps in cities_temp.items():
-    max_temp_year = max(temps.items(), key=lambda x: x[1])
-    print(f"{city}: {max_temp_year[0]} год ({max_temp_year[1]}°C)")
-print()
-
-print("3. Города, где 2019 год был самым холодным:")
-print("-" * 50)
-coldest_2019_cities = []
-for city, temps in cities_temp.items():
-    coldest_year = min(temps.items(), key=lambda x: x[1])
-    if coldest_year[0] == "2019":
-        coldest_2019_cities.append(city)
-        print(f"{city}: минимальная температура в 2019 году = {coldest_year[1]}°C")
-print(f"Всего городов: {len(coldest_2019_cities)}")
-print()
-
-print("4. Города, где температура в 2017 году была выше, чем в 2018 более чем на 1 градус:")
-print("-" * 50)
-temp_diff_cities = []
-for city, temps in cities_temp.items():
-    if "2017" in temps and "2018" in temps:
-        diff = temps["2017"] - temps["2018"]
-        if diff > 1:
-            temp_diff_cities.append(city)
-            print(f"{city}: 2017 - {temps['2017']}°C, 2018 - {temps['2018']}°C, разница = {diff:.1f}°C")
-print(f"Всего городов: {len(temp_diff_cities)}")
-print()
-
-print("5. Сохранение данных в файл data.pickle...")
-try:
-    with open('data.pickle', 'wb') as f:
-        pickle.dump(cities_temp, f)
-    print("Данные успешно сохранены в файл 'data.pickle'")
-    
-    with open('data.pickle', 'rb') as f:
-        loaded_data = pickle.load(f)
-    print("Данные успешно загружены из файла (проверка)")
-    print(f"Загружено записей о городах: {len(loaded_data)}")
-    
-except Exception as e:
-    print(f"Ошибка при работе с файлом: {e}")
-
-print("\n" + "="*60)
-print("ПОЛНЫЙ ОБЗОР ДАННЫХ:")
-print("="*60)
-for city, temps in cities_temp.items():
-    print(f"\n{city}:")
-    for year, temp in sorted(temps.items()):
-        print(f"  {year}: {temp}°C")
-    avg = sum(temps.values()) / len(temps)
-    print(f"  Средняя за 6 лет: {avg:.2f}°C")
\ No newline at end of file
+class TemperatureMatrix:
+    """
+    Плотная матрица температур город × год: значения хранятся построчно
+    в одном массиве array('d'), отсутствующие значения - NaN.
+    Индексы city_index и year_index переводят название города и год
+    в номер строки и столбца
+    """
+
+    def __init__(self, cities, years):
+        self.cities = list(cities)
+        self.years = list(years)
+        self.city_index = {city: i for i, city in enumerate(self.cities)}
+        self.year_index = {year: j for j, year in enumerate(self.years)}
+        self.values = array('d', [math.nan]) * (len(self.cities) * len(self.years))
+
+    @classmethod
+    def from_dict(cls, cities_temp):
+        """Построение матрицы из словаря вида {город: {год: температура}}"""
+        years = {}
+        for temps in cities_temp.values():
+            years.update(dict.fromkeys(temps))
+        matrix = cls(cities_temp, years)
+        for city, temps in cities_temp.items():
+            for year, temp in temps.items():
+                matrix.set(city, year, temp)
+        return matrix
+
+    def to_dict(self):
+        """Обратное преобразование в словарь (без отсутствующих значений)"""
+        return {
+            city: {year: temp for year, temp in zip(self.years, self.row(i)) if not math.isnan(temp)}
+            for i, city in enumerate(self.cities)
+        }
+
+    def set(self, city, year, temp):
+        self.values[self.city_index[city] * len(self.years) + self.year_index[year]] = temp
+
+    def get(self, city, year):
+        return self.values[self.city_index[city] * len(self.years) + self.year_index[year]]
+
+    def add(self, city, year, temp):
+        """
+        Запись значения с расширением матрицы: новый город добавляется
+        последней строкой, новый год - столбцом на место по возрастанию,
+        чтобы ряды городов оставались упорядоченными по годам
+        """
+        if year not in self.year_index:
+            position = bisect.bisect([int(known) for known in self.years], int(year))
+            missing = array('d', [math.nan])
+            values = array('d')
+            for i in range(len(self.cities)):
+                row = self.row(i)
+                values.extend(row[:position])
+                values.extend(missing)
+                values.extend(row[position:])
+            self.values = values
+            self.years.insert(position, year)
+            self.year_index = {known: j for j, known in enumerate(self.years)}
+        if city not in self.city_index:
+            self.city_index[city] = len(self.cities)
+            self.cities.append(city)
+            self.values.extend(array('d', [math.nan]) * len(self.years))
+        self.set(city, year, temp)
+
+    def row(self, i):
+        """Температуры i-го города по всем годам"""
+        width = len(self.years)
+        return self.values[i * width:(i + 1) * width]
+
+    def column(self, j):
+        """Температуры всех городов за j-й год"""
+        return self.values[j::len(self.years)]
+
+    def _valid(self, row):
+        # сумма равна NaN только если в строке есть пропуски - один проход на C
+        if math.isnan(sum(row)):
+            return array('d', filterfalse(math.isnan, row))
+        return row
+
+    def city_means(self):
+        """Средняя температура каждого города"""
+        means = []
+        for i in range(len(self.cities)):
+            valid = self._valid(self.row(i))
+            means.append(sum(valid) / len(valid) if valid else math.nan)
+        return means
+
+    def _arg_extreme(self, reduce):
+        result = []
+        for i in range(len(self.cities)):
+            row = self.row(i)
+            valid = self._valid(row)
+            if not valid:
+                result.append((None, math.nan))
+                continue
+            value = reduce(valid)
+            result.append((self.years[row.index(value)], value))
+        return result
+
+    def max_years(self):
+        """(год, температура) с максимальной температурой для каждого города"""
+        return self._arg_extreme(max)
+
+    def min_years(self):
+        """(год, температура) с минимальной температурой для каждого города"""
+        return self._arg_extreme(min)
+
+    def year_diff(self, year_a, year_b):
+        """Разность температур year_a - year_b для каждого города (NaN, если нет данных)"""
+        a = self.column(self.year_index[year_a])
+        b = self.column(self.year_index[year_b])
+        return array('d', map(float.__sub__, a, b))
+
+class CityStats:
+    """Накопленные показатели одного города"""
+    __slots__ = ('total', 'count', 'max_year', 'max_temp', 'min_year', 'min_temp',
+                 'last_year', 'last_temp', 'delta', 'window', 'window_total')
+
+    def __init__(self, window):
+        self.total = 0.0
+        self.count = 0
+        self.max_year = self.min_year = self.last_year = None
+        self.max_temp = self.min_temp = self.last_temp = self.delta = math.nan
+        self.window = deque(maxlen=window)
+        self.window_total = 0.0
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def rolling_mean(self):
+        return self.window_total / len(self.window) if self.window else math.nan
+
+class RollingStats:
+    """
+    Инкрементальный расчет показателей по городам: сумма, количество,
+    год максимума и минимума, скользящее среднее за window лет и разница
+    с предыдущим годом обновляются за O(1) при добавлении показания.
+    Для запрошенных пар лет хранится отсортированный список разностей,
+    который пополняется вставкой, а порог проверяется бинарным поиском
+    """
+
+    def __init__(self, window=3):
+        self.window = window
+        self.cities = {}
+        self.by_year = {}
+        self._pairs = {}
+        self._order = {}
+
+    @classmethod
+    def from_matrix(cls, matrix, window=3, cities=None):
+        """Показатели по матрице; cities - только эти города (по умолчанию все)"""
+        stats = cls(window)
+        for city in matrix.cities if cities is None else cities:
+            i = matrix.city_index.get(city)
+            if i is None:
+                continue
+            for year, temp in zip(matrix.years, matrix.row(i)):
+                if not math.isnan(temp):
+                    stats.append(city, year, temp)
+        return stats
+
+    def append(self, city, year, temp):
+        """Добавление показания; годы одного города должны идти по возрастанию"""
+        stats = self.cities.get(city)
+        if stats is None:
+            stats = self.cities[city] = CityStats(self.window)
+            self._order[city] = len(self._order)
+        elif int(year) <= int(stats.last_year):
+            raise ValueError(f"{city}: год {year} не позже последнего ({stats.last_year})")
+
+        stats.total += temp
+        stats.count += 1
+        if not temp <= stats.max_temp:
+            stats.max_year, stats.max_temp = year, temp
+        if not temp >= stats.min_temp:
+            stats.min_year, stats.min_temp = year, temp
+        if len(stats.window) == stats.window.maxlen:
+            stats.window_total -= stats.window[0]
+        stats.window.append(temp)
+        stats.window_total += temp
+        stats.delta = temp - stats.last_temp
+        stats.last_year, stats.last_temp = year, temp
+
+        self.by_year.setdefault(year, {})[city] = temp
+        for (year_a, year_b), (diffs, names) in self._pairs.items():
+            if year == year_a:
+                other = self.by_year.get(year_b, {}).get(city)
+                diff = None if other is None else temp - other
+            elif year == year_b:
+                other = self.by_year.get(year_a, {}).get(city)
+                diff = None if other is None else other - temp
+            else:
+                continue
+            if diff is not None:
+                index = bisect.bisect_right(diffs, diff)
+                diffs.insert(index, diff)
+                names.insert(index, city)
+
+    def _pair(self, year_a, year_b):
+        pair = self._pairs.get((year_a, year_b))
+        if pair is None:
+            temps_a = self.by_year.get(year_a, {})
+            temps_b = self.by_year.get(year_b, {})
+            ordered = sorted((temp - temps_b[city], city) for city, temp in temps_a.items() if city in temps_b)
+            pair = self._pairs[(year_a, year_b)] = ([diff for diff, _ in ordered], [city for _, city in ordered])
+        return pair
+
+    def warmer_than(self, year_a, year_b, threshold=1):
+        """
+        Города, где в year_a было теплее, чем в year_b, более чем на threshold.
+        Возвращает список (город, разница) в порядке добавления городов
+        """
+        diffs, names = self._pair(year_a, year_b)
+        index = bisect.bisect_right(diffs, threshold)
+        return sorted(zip(names[index:], diffs[index:]), key=lambda item: self._order[item[0]])
+
+def print_averages(matrix):
+    print("1. Список городов и средние температуры в них:")
+    print("-" * 50)
+    for city, avg_temp in zip(matrix.cities, matrix.city_means()):
+        print(f"{city}: средняя температура за 6 лет = {avg_temp:.2f}°C")
+    print()
+
+def print_max_years(matrix):
+    print("2. Год с максимальной температурой для каждого города:")
+    print("-" * 50)
+    for city, (year, temp) in zip(matrix.cities, matrix.max_years()):
+        print(f"{city}: {year} год ({temp}°C)")
+    print()
+
+def print_coldest_year(matrix, target_year="2019"):
+    print(f"3. Города, где {target_year} год был самым холодным:")
+    print("-" * 50)
+    coldest_cities = []
+    for city, (year, temp) in zip(matrix.cities, matrix.min_years()):
+        if year == target_year:
+            coldest_cities.append(city)
+            print(f"{city}: минимальная температура в {target_year} году = {temp}°C")
+    print(f"Всего городов: {len(coldest_cities)}")
+    print()
+    return coldest_cities
+
+def print_year_diff(matrix, year_a="2017", year_b="2018", threshold=1):
+    print(f"4. Города, где температура в {year_a} году была выше, чем в {year_b} более чем на {threshold} градус:")
+    print("-" * 50)
+    temp_diff_cities = []
+    if year_a in matrix.year_index and year_b in matrix.year_index:
+        a = matrix.column(matrix.year_index[year_a])
+        b = matrix.column(matrix.year_index[year_b])
+        for city, temp_a, temp_b, diff in zip(matrix.cities, a, b, matrix.year_diff(year_a, year_b)):
+            if diff > threshold:
+                temp_diff_cities.append(city)
+                print(f"{city}: {year_a} - {temp_a}°C, {year_b} - {temp_b}°C, разница = {diff:.1f}°C")
+    print(f"Всего городов: {len(temp_diff_cities)}")
+    print()
+    return temp_diff_cities
+
+DATA_FILE = 'data.tmat'
+TEMPS_MAGIC = b'LAB71TMP'
+TEMPS_VERSION = 1
+TEMPS_ALIGN = 8
+
+def save_temperatures(matrix, path):
+    """
+    Запись матрицы в бинарный файл: сигнатура, длина заголовка, JSON
+    заголовок (годы, города и смещения строк) и выровненный блок float64,
+    по строке на город. Файл записывается во временный и атомарно
+    переименовывается
+    """
+    row_size = len(matrix.years) * matrix.values.itemsize
+    header = json.dumps({
+        'version': TEMPS_VERSION,
+        'years': matrix.years,
+        'cities': matrix.cities,
+        'offsets': [i * row_size for i in range(len(matrix.cities))],
+    }, ensure_ascii=False).encode('utf-8')
+    prefix = TEMPS_MAGIC + struct.pack('<I', len(header)) + header
+    prefix += b'\0' * (-len(prefix) % TEMPS_ALIGN)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) as file:
+        try:
+            file.write(prefix)
+            file.write(matrix.values)
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+    default_permissions(file.name)
+    os.replace(file.name, path)
+
+class TemperatureFile:
+    """
+    Файл температур, отображенный в память через mmap.
+    При открытии разбирается только заголовок; ряд одного города
+    читается по его смещению без разбора остальных данных
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            self._mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        mapped = self._mapped
+        if mapped[:len(TEMPS_MAGIC)] != TEMPS_MAGIC:
+            mapped.close()
+            raise ValueError(f"'{path}' не является файлом температур lab71")
+        start = len(TEMPS_MAGIC)
+        (header_length,) = struct.unpack_from('<I', mapped, start)
+        start += 4
+        header = json.loads(str(mapped[start:start + header_length], 'utf-8'))
+        if header.get('version') != TEMPS_VERSION:
+            mapped.close()
+            raise ValueError(f"неподдерживаемая версия файла: {header.get('version')}")
+        start += header_length
+        self._start = start + (-start % TEMPS_ALIGN)
+        self.years = header['years']
+        self.cities = header['cities']
+        self._offsets = dict(zip(self.cities, header['offsets']))
+        self._row_size = len(self.years) * 8
+
+    def __len__(self):
+        return len(self.cities)
+
+    def __contains__(self, city):
+        return city in self._offsets
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._mapped.close()
+
+    def series(self, city):
+        """Ряд температур города (array('d'), NaN - нет данных)"""
+        offset = self._start + self._offsets[city]
+        values = array('d')
+        values.frombytes(self._mapped[offset:offset + self._row_size])
+        return values
+
+    def city(self, city):
+        """Температуры города в виде словаря {год: температура}"""
+        return {year: temp for year, temp in zip(self.years, self.series(city)) if not math.isnan(temp)}
+
+    def to_matrix(self):
+        """Загрузка всех данных в TemperatureMatrix одним копированием"""
+        matrix = TemperatureMatrix(self.cities, self.years)
+        matrix.values = array('d')
+        matrix.values.frombytes(self._mapped[self._start:self._start + self._row_size * len(self.cities)])
+        return matrix
+
+def convert_pickle(pickle_path, path=DATA_FILE):
+    """Преобразование старого data.pickle в бинарный формат (pickle должен быть доверенным)"""
+    with open(pickle_path, 'rb') as f:
+        data = pickle.load(f)
+    matrix = TemperatureMatrix.from_dict(data)
+    save_temperatures(matrix, path)
+    return matrix
+
+def save_data(matrix, filename=DATA_FILE):
+    print(f"5. Сохранение данных в файл {filename}...")
+    try:
+        save_temperatures(matrix, filename)
+        print(f"Данные успешно сохранены в файл '{filename}'")
+        
+        with TemperatureFile(filename) as loaded_data:
+            print("Данные успешно загружены из файла (проверка)")
+            print(f"Загружено записей о городах: {len(loaded_data)}")
+        
+    except (OSError, ValueError) as e:
+        print(f"Ошибка при работе с файлом: {e}")
+
+def generate_temperatures(cities, years, seed=0):
+    """Синтетические данные {город: {год: температура}} для замеров"""
+    rnd = random.Random(seed)
+    year_names = [str(2022 - years + 1 + j) for j in range(years)]
+    return {
+        f"Город {i}": {year: round(rnd.uniform(-15.0, 25.0), 1) for year in year_names}
+        for i in range(cities)
+    }
+
+def benchmark_load(data, repeat=5):
+    """
+    Сравнение загрузки pickle и бинарного формата: полная загрузка
+    pickle.load, открытие файла с чтением одного города и полная
+    загрузка матрицы. Печатает лучшее время из repeat запусков
+    """
+    matrix = TemperatureMatrix.from_dict(data)
+    probe = matrix.cities[len(matrix.cities) // 2]
+    with tempfile.TemporaryDirectory() as directory:
+        pickle_path = os.path.join(directory, 'data.pickle')
+        temps_path = os.path.join(directory, DATA_FILE)
+        with open(pickle_path, 'wb') as f:
+            pickle.dump(data, f)
+        save_temperatures(matrix, temps_path)
+
+        def load_pickle():
+            with open(pickle_path, 'rb') as f:
+                return pickle.load(f)[probe]
+
+        def load_city():
+            with TemperatureFile(temps_path) as loaded:
+                return loaded.series(probe)
+
+        def load_matrix():
+            with TemperatureFile(temps_path) as loaded:
+                return loaded.to_matrix()
+
+        print(f"Городов: {len(matrix.cities)}, лет: {len(matrix.years)}")
+        print(f"Размер: pickle {os.path.getsize(pickle_path)} байт, {DATA_FILE} {os.path.getsize(temps_path)} байт")
+        results = {}
+        for name, func in (('pickle.load', load_pickle), ('mmap, один город', load_city), ('mmap, вся матрица', load_matrix)):
+            best = math.inf
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                best = min(best, time.perf_counter() - start)
+            results[name] = best
+            print(f"{name:<20} {best * 1000:10.3f} мс")
+    return results
+
+def print_overview(matrix):
+    print("\n" + "="*60)
+    print("ПОЛНЫЙ ОБЗОР ДАННЫХ:")
+    print("="*60)
+    for city, temps, avg in zip(matrix.cities, matrix.to_dict().values(), matrix.city_means()):
+        print(f"\n{city}:")
+        for year, temp in sorted(temps.items()):
+            print(f"  {year}: {temp}°C")
+        print(f"  Средняя за 6 лет: {avg:.2f}°C")
+
+def print_city_stats(stats, city):
+    city_stats = stats.cities[city]
+    print(f"{city}: лет {city_stats.count}, средняя {city_stats.mean:.2f}°C, "
+          f"максимум {city_stats.max_year} ({city_stats.max_temp}°C), "
+          f"минимум {city_stats.min_year} ({city_stats.min_temp}°C)")
+    line = f"  скользящая средняя за {len(city_stats.window)} лет: {city_stats.rolling_mean:.2f}°C"
+    # у первого показания города нет предыдущего, изменение не определено
+    if not math.isnan(city_stats.delta):
+        line += f", изменение за {city_stats.last_year} год: {city_stats.delta:+.1f}°C"
+    print(line)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Анализ температур городов")
+    parser.add_argument('--data', default=DATA_FILE,
+                        help=f"бинарный файл с данными (по умолчанию {DATA_FILE})")
+    parser.add_argument('--convert', metavar='PICKLE',
+                        help="преобразовать pickle файл в бинарный формат --data и завершить работу")
+    parser.add_argument('--city',
+                        help="вывести температуры одного города из файла --data")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="сравнить время загрузки pickle и бинарного формата")
+    parser.add_argument('--bench-cities', type=int, default=None,
+                        help="число синтетических городов для --benchmark (по умолчанию - данные скрипта)")
+    parser.add_argument('--bench-years', type=int, default=50,
+                        help="число лет для синтетических данных (по умолчанию 50)")
+    parser.add_argument('--add', nargs=3, action='append', metavar=('CITY', 'YEAR', 'TEMP'),
+                        help="добавить показание и вывести обновленные показатели города (можно повторять)")
+    parser.add_argument('--compare', nargs=2, metavar=('YEAR_A', 'YEAR_B'),
+                        help="города, где в YEAR_A было теплее, чем в YEAR_B, более чем на --threshold")
+    parser.add_argument('--threshold', type=float, default=1,
+                        help="порог для --compare в градусах (по умолчанию 1)")
+    parser.add_argument('--window', type=int, default=3,
+                        help="окно скользящего среднего в годах (по умолчанию 3)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.convert:
+        matrix = convert_pickle(args.convert, args.data)
+        print(f"Файл '{args.convert}' преобразован в '{args.data}' (городов: {len(matrix.cities)})")
+        return
+    if args.city:
+        try:
+            with TemperatureFile(args.data) as loaded:
+                if args.city not in loaded:
+                    print(f"Город '{args.city}' не найден в файле '{args.data}'")
+                    return
+                print(f"{args.city}:")
+                for year, temp in loaded.city(args.city).items():
+                    print(f"  {year}: {temp}°C")
+        except FileNotFoundError:
+            print(f"Файл '{args.data}' не найден; создайте его запуском без --city или через --convert")
+        except (OSError, ValueError) as e:
+            print(f"Ошибка при чтении файла '{args.data}': {e}")
+        return
+    if args.benchmark:
+        data = cities_temp
+        if args.bench_cities:
+            data = generate_temperatures(args.bench_cities, args.bench_years)
+        benchmark_load(data)
+        return
+
+    if args.add or args.compare:
+        if os.path.exists(args.data):
+            with TemperatureFile(args.data) as loaded:
+                matrix = loaded.to_matrix()
+        else:
+            matrix = TemperatureMatrix.from_dict(cities_temp)
+        added = list(dict.fromkeys(city for city, _, _ in args.add or ()))
+        # для --add достаточно рядов добавляемых городов, для --compare нужны все
+        stats = RollingStats.from_matrix(matrix, args.window, None if args.compare else added)
+        try:
+            for city, year, temp in args.add or ():
+                temp = float(temp)
+                stats.append(city, year, temp)
+                matrix.add(city, year, temp)
+        except ValueError as e:
+            print(f"Ошибка: {e}")
+            return
+        if args.add:
+            save_temperatures(matrix, args.data)
+            print(f"Показания сохранены в файл '{args.data}'")
+        for city in added:
+            print_city_stats(stats, city)
+        if args.compare:
+            year_a, year_b = args.compare
+            print(f"Города, где в {year_a} году было теплее, чем в {year_b}, более чем на {args.threshold:g}°C:")
+            found = stats.warmer_than(year_a, year_b, args.threshold)
+            for city, diff in found:
+                print(f"{city}: разница = {diff:.1f}°C")
+            print(f"Всего городов: {len(found)}")
+        return
+
+    matrix = TemperatureMatrix.from_dict(cities_temp)
+    print_averages(matrix)
+    print_max_years(matrix)
+    print_coldest_year(matrix)
+    print_year_diff(matrix)
+    save_data(matrix, args.data)
+    print_overview(matrix)
+
+if __name__ == "__main__":
+    main()
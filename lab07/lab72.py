@@ -1,10 +1,24 @@
+import argparse
+import contextlib
+import glob
+import io
+import mmap
+import os
+import tempfile
+import time
+
+from compressed import (atomic_output, compression_from_name, default_permissions, detect_compression,
+                        open_input, open_output)
+
+MAX_TAIL = 64 * 1024 * 1024
+
 def convert_to_lowercase(input_file, output_file):
     """
     Читает файл input_file, переводит все слова в каждой строке в нижний регистр
     и записывает результат в output_file
     """
     try:
-        with open(input_file, 'r', encoding='utf-8') as infile:
+        with open_input(input_file, encoding='utf-8') as infile:
             lines = infile.readlines()
         
         processed_lines = []
@@ -12,7 +26,7 @@ def convert_to_lowercase(input_file, output_file):
             lower_line = line.lower()
             processed_lines.append(lower_line)
         
-        with open(output_file, 'w', encoding='utf-8') as outfile:
+        with open_output(output_file, encoding='utf-8') as outfile:
             outfile.writelines(processed_lines)
         
         print(f"Обработка завершена! Результат записан в файл '{output_file}'")
@@ -25,26 +39,266 @@ def convert_to_lowercase(input_file, output_file):
     except Exception as e:
         print(f"Неожиданная ошибка: {e}")
 
-if __name__ == "__main__":
-    input_filename = "input.txt"
-    output_filename = "output.txt"
-    
-    convert_to_lowercase(input_filename, output_filename)
+def _split_point(text):
+    """
+    Позиция после последнего пробельного символа в text или -1.
+    Пробел или перевод строки разрывает контекст регистровых правил
+    (например, для конечной сигмы), поэтому часть до этой позиции можно
+    переводить в нижний регистр независимо от остального текста
+    """
+    cut = max(text.rfind('\n'), text.rfind(' '), text.rfind('\t'))
+    return cut + 1 if cut != -1 else -1
+
+def lowercase_stream(input_file, output_file, chunk_size=1024 * 1024):
+    """
+    Потоковый перевод файла в нижний регистр частями по chunk_size символов.
+    Декодирование UTF-8 на границах частей выполняет текстовый поток, а часть
+    режется по последнему пробельному символу, чтобы контекстные правила
+    (конечная сигма) и многосимвольные преобразования работали как для всего
+    файла целиком. Результат пишется во временный файл и атомарно
+    переименовывается. Сжатый вход (gz/bz2/xz) распаковывается на лету,
+    выход сжимается, если это задано расширением output_file.
+    Возвращает количество строк
+    """
+    newlines = 0
+    last_char = ''
+    tail = ''
+    with open_input(input_file, encoding='utf-8') as infile:
+        with atomic_output(output_file, encoding='utf-8') as outfile:
+            while True:
+                chunk = infile.read(chunk_size)
+                if not chunk:
+                    break
+                newlines += chunk.count('\n')
+                last_char = chunk[-1]
+                text = tail + chunk
+                cut = _split_point(text)
+                if cut == -1:
+                    if len(text) < max(16 * chunk_size, MAX_TAIL):
+                        tail = text
+                        continue
+                    cut = len(text)  # очень длинный текст без пробелов
+                outfile.write(text[:cut].lower())
+                tail = text[cut:]
+            outfile.write(tail.lower())
+    return newlines + (1 if last_char and last_char != '\n' else 0)
+
+def convert_to_lowercase_stream(input_file, output_file, chunk_size=1024 * 1024):
+    """Потоковый вариант convert_to_lowercase с постоянным расходом памяти"""
+    try:
+        lines = lowercase_stream(input_file, output_file, chunk_size)
+        print(f"Обработка завершена! Результат записан в файл '{output_file}'")
+        print(f"Обработано строк: {lines}")
+    except FileNotFoundError:
+        print(f"Ошибка: Файл '{input_file}' не найден!")
+    except IOError as e:
+        print(f"Ошибка ввода-вывода: {e}")
+    except Exception as e:
+        print(f"Неожиданная ошибка: {e}")
+
+def newline_ranges(mapped, chunk_size):
+    """Диапазоны байтов примерно по chunk_size, заканчивающиеся после b'\\n'"""
+    ranges = []
+    start = 0
+    size = len(mapped)
+    while start < size:
+        end = mapped.find(b'\n', min(start + chunk_size, size) - 1)
+        end = size if end == -1 else end + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+def _lower_range(task):
+    """
+    Перевод диапазона байтов файла в нижний регистр (в рабочем процессе).
+    Переводы строк нормализуются так же, как при чтении в текстовом режиме.
+    Возвращает (байты результата, количество переводов строк)
+    """
+    input_file, start, end = task
+    with open(input_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = str(mapped[start:end], 'utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text.lower().encode('utf-8'), text.count('\n')
+
+def _plan(input_file, chunk_size):
+    size = os.path.getsize(input_file)
+    if not size:
+        return size, []
+    with open(input_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            ranges = newline_ranges(mapped, chunk_size)
+            ends_with_newline = mapped[size - 1:size] in (b'\n', b'\r')
+    return (size, ends_with_newline), ranges
+
+def lowercase_parallel(pairs, workers=None, chunk_size=16 * 1024 * 1024):
+    """
+    Перевод в нижний регистр списка файлов (пар вход, выход) общим пулом
+    процессов. Каждый входной файл отображается в память и делится на части
+    по границам строк; части всех файлов обрабатываются параллельно, а
+    результаты по порядку записываются в выходной файл, заранее выделенный
+    под размер входного (затем обрезается до фактического размера).
+    Результат совпадает с последовательной обработкой. Сжатые файлы
+    (на входе или на выходе) отобразить в память нельзя, они обрабатываются
+    потоково через lowercase_stream.
+    Возвращает словарь выходной файл -> количество строк
+    """
+    plans = []
+    tasks = []
+    lines = {}
+    for input_file, output_file in pairs:
+        if detect_compression(input_file) or compression_from_name(output_file):
+            lines[output_file] = lowercase_stream(input_file, output_file)
+            continue
+        info, ranges = _plan(input_file, chunk_size)
+        plans.append((input_file, output_file, info, len(ranges)))
+        tasks.extend((input_file, start, end) for start, end in ranges)
+
+    if not plans:
+        return lines
+    # multiprocessing нужен только здесь, импорт не замедляет остальные режимы
+    from multiprocessing import Pool
+    with Pool(workers) as pool:
+        results = pool.imap(_lower_range, tasks)
+        for input_file, output_file, info, count in plans:
+            directory = os.path.dirname(os.path.abspath(output_file))
+            with tempfile.NamedTemporaryFile('wb', dir=directory, suffix='.tmp', delete=False) as out:
+                try:
+                    if info:
+                        out.truncate(info[0])
+                    newlines = 0
+                    for _ in range(count):
+                        data, chunk_newlines = next(results)
+                        out.write(data)
+                        newlines += chunk_newlines
+                    out.truncate()
+                except BaseException:
+                    out.close()
+                    os.unlink(out.name)
+                    raise
+            default_permissions(out.name)
+            os.replace(out.name, output_file)
+            lines[output_file] = newlines + (1 if info and not info[1] else 0)
+    return lines
+
+def expand_inputs(patterns):
+    """Список файлов по шаблонам glob и каталогам (файлы каталога без вложенных)"""
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = [os.path.join(pattern, name) for name in sorted(os.listdir(pattern))]
+        else:
+            matches = sorted(glob.glob(pattern))
+        files.extend(path for path in matches if os.path.isfile(path))
+    return files
+
+def batch_outputs(inputs, output_dir):
+    """
+    Пары (входной файл, выходной файл) для --batch. Путь результата строится
+    от общего каталога всех входных файлов, поэтому b1/a.txt и b2/a.txt
+    попадают в output_dir/b1/a.txt и output_dir/b2/a.txt. Один и тот же
+    файл, найденный по нескольким шаблонам, обрабатывается один раз
+    """
+    inputs = list(dict.fromkeys(os.path.abspath(path) for path in inputs))
+    if not inputs:
+        return []
+    root = os.path.commonpath([os.path.dirname(path) for path in inputs])
+    return [(path, os.path.join(output_dir, os.path.relpath(path, root))) for path in inputs]
+
+def benchmark(input_file, output_file, chunk_size=1024 * 1024, repeat=3):
+    """Сравнение пропускной способности (МБ/с) исходного, потокового и параллельного вариантов"""
+    size_mb = os.path.getsize(input_file) / (1024 * 1024)
+    def readlines_variant():
+        with contextlib.redirect_stdout(io.StringIO()):
+            convert_to_lowercase(input_file, output_file)
     
+    variants = {
+        'readlines': readlines_variant,
+        'stream': lambda: lowercase_stream(input_file, output_file, chunk_size),
+        'parallel': lambda: lowercase_parallel([(input_file, output_file)], chunk_size=chunk_size),
+    }
+    results = {}
+    for name, run in variants.items():
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        results[name] = size_mb / best if best else float('inf')
+    return results
+
+def print_file(title, filename):
     try:
         print("\n" + "="*50)
-        print("СОДЕРЖИМОЕ ВХОДНОГО ФАЙЛА:")
+        print(title)
         print("="*50)
-        with open(input_filename, 'r', encoding='utf-8') as f:
+        with open_input(filename, encoding='utf-8') as f:
             print(f.read())
     except:
         pass
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Перевод текста файла в нижний регистр")
+    parser.add_argument('input', nargs='?', default='input.txt',
+                        help="входной файл, возможно сжатый gz/bz2/xz (по умолчанию input.txt)")
+    parser.add_argument('output', nargs='?', default='output.txt',
+                        help="выходной файл; .gz/.bz2/.xz - со сжатием (по умолчанию output.txt)")
+    parser.add_argument('--stream', action='store_true',
+                        help="потоковая обработка частями с постоянным расходом памяти")
+    parser.add_argument('--chunk-size', type=int, default=1024 * 1024,
+                        help="размер части (символы для --stream, байты для --parallel/--batch; по умолчанию 1М)")
+    parser.add_argument('--parallel', action='store_true',
+                        help="обработка частей файла в пуле процессов через mmap")
+    parser.add_argument('--batch', nargs='+', metavar='PATH',
+                        help="обработать все файлы по шаблонам glob или из каталогов (вместе с --output-dir)")
+    parser.add_argument('--output-dir', help="каталог для результатов --batch")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="количество процессов (по умолчанию - число ядер)")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="сравнить скорость исходного, потокового и параллельного вариантов")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
     
-    try:
-        print("\n" + "="*50)
-        print("СОДЕРЖИМОЕ ВЫХОДНОГО ФАЙЛА:")
-        print("="*50)
-        with open(output_filename, 'r', encoding='utf-8') as f:
-            print(f.read())
-    except:
-        pass
\ No newline at end of file
+    if args.benchmark:
+        results = benchmark(args.input, args.output, args.chunk_size)
+        print("\nПропускная способность:")
+        for name, speed in results.items():
+            print(f"  {name}: {speed:.1f} МБ/с")
+        return
+    
+    if args.batch:
+        if not args.output_dir:
+            print("Ошибка: для --batch нужно указать --output-dir")
+            return
+        pairs = batch_outputs(expand_inputs(args.batch), args.output_dir)
+        for _, output_file in pairs:
+            os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        lines = lowercase_parallel(pairs, args.workers, args.chunk_size)
+        for output_file, count in lines.items():
+            print(f"{output_file}: обработано строк: {count}")
+        print(f"Обработано файлов: {len(lines)}")
+        return
+    
+    if args.parallel:
+        try:
+            lines = lowercase_parallel([(args.input, args.output)], args.workers, args.chunk_size)
+        except FileNotFoundError:
+            print(f"Ошибка: Файл '{args.input}' не найден!")
+            return
+        print(f"Обработка завершена! Результат записан в файл '{args.output}'")
+        print(f"Обработано строк: {lines[args.output]}")
+        return
+    
+    if args.stream:
+        convert_to_lowercase_stream(args.input, args.output, args.chunk_size)
+        return
+    
+    convert_to_lowercase(args.input, args.output)
+    print_file("СОДЕРЖИМОЕ ВХОДНОГО ФАЙЛА:", args.input)
+    print_file("СОДЕРЖИМОЕ ВЫХОДНОГО ФАЙЛА:", args.output)
+
+if __name__ == "__main__":
+    main()
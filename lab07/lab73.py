@@ -1,11 +1,25 @@
+import argparse
 import csv
-from collections import defaultdict
+import hashlib
+import io
+import json
+import math
+import mmap
+import os
+import struct
+from array import array
+from collections import Counter
+from itertools import chain, compress, filterfalse, islice
+from operator import indexOf, itemgetter
+
+from compressed import atomic_output, detect_compression, open_input
+from groupby import GroupBy
 
 def read_csv_file(filename):
     """Чтение CSV файла и возврат данных в виде списка словарей"""
     data = []
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
+        with open_input(filename, encoding='utf-8') as file:
             csv_reader = csv.DictReader(file, delimiter=';')
             for row in csv_reader:
                 data.append(row)
@@ -17,6 +31,224 @@ def read_csv_file(filename):
         print(f"Ошибка при чтении файла: {e}")
         return None
 
+DURATION_UNITS = {
+    'month': 1,
+    'months': 1,
+    'year': 12,
+    'years': 12,
+}
+
+def parse_duration(value):
+    """
+    Перевод продолжительности вида '12 months' или '2 years' в месяцы.
+    Число без единицы измерения считается месяцами.
+    Для некорректного значения генерирует ValueError
+    """
+    parts = str(value).split()
+    if not parts or len(parts) > 2:
+        raise ValueError(f"некорректная продолжительность: {value!r}")
+    amount = float(parts[0])
+    if len(parts) == 2:
+        unit = parts[1].lower()
+        if unit not in DURATION_UNITS:
+            raise ValueError(f"неизвестная единица измерения: {parts[1]!r}")
+        amount *= DURATION_UNITS[unit]
+    return amount
+
+def iter_csv_rows(filename):
+    """Построчное чтение CSV файла (возможно, сжатого) без загрузки всего файла в память"""
+    with open_input(filename, encoding='utf-8', newline='') as file:
+        csv_reader = csv.DictReader(file, delimiter=';')
+        for row in csv_reader:
+            yield row
+
+class MinMaxBudgetAggregate:
+    """Проекты с минимальным и максимальным бюджетом (как find_min_max_budget)"""
+    name = 'min_max_budget'
+
+    def __init__(self):
+        self.min_budget = float('inf')
+        self.max_budget = float('-inf')
+        self.min_project = None
+        self.max_project = None
+
+    def update(self, row):
+        try:
+            budget = float(row.get('Budget', 0))
+        except (ValueError, TypeError):
+            return
+        if budget < self.min_budget:
+            self.min_budget = budget
+            self.min_project = dict(row)
+        if budget > self.max_budget:
+            self.max_budget = budget
+            self.max_project = dict(row)
+
+    def merge(self, other):
+        if other.min_budget < self.min_budget:
+            self.min_budget = other.min_budget
+            self.min_project = other.min_project
+        if other.max_budget > self.max_budget:
+            self.max_budget = other.max_budget
+            self.max_project = other.max_project
+
+    def result(self):
+        return self.min_project, self.max_project
+
+class TotalTeamSizeAggregate:
+    """Общее количество сотрудников (как calculate_total_team_size)"""
+    name = 'total_team_size'
+
+    def __init__(self):
+        self.total = 0
+
+    def update(self, row):
+        try:
+            self.total += int(row.get('TeamSize', 0))
+        except (ValueError, TypeError):
+            pass
+
+    def merge(self, other):
+        self.total += other.total
+
+    def result(self):
+        return self.total
+
+class AvgCompletedDurationAggregate:
+    """Средняя продолжительность завершенных проектов (как calculate_avg_completed_duration)"""
+    name = 'avg_completed_duration'
+
+    def __init__(self):
+        self.total = 0.0
+        self.count = 0
+
+    def update(self, row):
+        if row.get('Completed', '').strip().lower() != 'yes':
+            return
+        try:
+            duration = parse_duration(row.get('Duration', 0))
+        except (ValueError, TypeError):
+            return
+        self.total += duration
+        self.count += 1
+
+    def merge(self, other):
+        self.total += other.total
+        self.count += other.count
+
+    def result(self):
+        if not self.count:
+            return 0
+        return self.total / self.count
+
+def project_status(row):
+    return row.get('Completed', 'Unknown').strip()
+
+class StatusCountAggregate(GroupBy):
+    """Количество проектов по статусам (как count_projects_by_status)"""
+    name = 'status_counts'
+
+    def __init__(self):
+        super().__init__(project_status, {'count': 'count'})
+
+    def result(self):
+        return self.column('count')
+
+DEFAULT_AGGREGATES = (
+    MinMaxBudgetAggregate,
+    TotalTeamSizeAggregate,
+    AvgCompletedDurationAggregate,
+    StatusCountAggregate,
+)
+
+def aggregate_stream(rows, aggregates=DEFAULT_AGGREGATES):
+    """
+    Вычисляет все агрегаты за один проход по строкам.
+    rows - любой итератор строк-словарей (например, iter_csv_rows),
+    aggregates - классы агрегатов с методами update(row), merge(other) и result().
+    Память не зависит от количества строк.
+    """
+    instances = _update_aggregates(rows, aggregates)
+    return {instance.name: instance.result() for instance in instances}
+
+def _update_aggregates(rows, aggregates):
+    instances = [aggregate() for aggregate in aggregates]
+    for row in rows:
+        for instance in instances:
+            instance.update(row)
+    return instances
+
+def find_chunk_ranges(filename, chunk_size):
+    """
+    Разбиение файла (без строки заголовка) на диапазоны байтов примерно
+    по chunk_size, каждый из которых заканчивается на границе строки.
+    Возвращает строку заголовка и список пар (start, end).
+    Поля с переводом строки внутри кавычек не поддерживаются
+    """
+    ranges = []
+    with open(filename, 'rb') as file:
+        header = file.readline()
+        size = os.fstat(file.fileno()).st_size
+        start = file.tell()
+        while start < size:
+            end = start + chunk_size
+            if end < size:
+                file.seek(end)
+                file.readline()
+                end = file.tell()
+            else:
+                end = size
+            ranges.append((start, end))
+            start = end
+    return header.decode('utf-8'), ranges
+
+def has_data_rows(filename):
+    """
+    Есть ли в файле (возможно, сжатом) что-то после строки заголовка.
+    Читаются только первые две строки, без разбиения файла на части
+    """
+    with open_input(filename, 'rb', threaded=False) as file:
+        file.readline()
+        return bool(file.readline())
+
+def _aggregate_chunk(task):
+    """Частичные агрегаты по одному диапазону байтов (выполняется в рабочем процессе)"""
+    filename, header, start, end, aggregates = task
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+    fieldnames = next(csv.reader([header], delimiter=';'))
+    rows = csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames, delimiter=';')
+    return _update_aggregates(rows, aggregates)
+
+def aggregate_parallel(filename, workers=None, chunk_size=64 * 1024 * 1024,
+                       aggregates=DEFAULT_AGGREGATES):
+    """
+    Вычисляет агрегаты, обрабатывая части файла в пуле процессов.
+    Частичные результаты объединяются в порядке частей файла, поэтому
+    результат совпадает с последовательным aggregate_stream.
+    Сжатый файл нельзя разделить на части по байтам, он обрабатывается
+    одним потоковым проходом
+    """
+    if detect_compression(filename):
+        return aggregate_stream(iter_csv_rows(filename), aggregates)
+    header, ranges = find_chunk_ranges(filename, chunk_size)
+    instances = [aggregate() for aggregate in aggregates]
+    tasks = [(filename, header, start, end, aggregates) for start, end in ranges]
+    # пул процессов нужен только здесь, импорт не замедляет остальные режимы
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial in executor.map(_aggregate_chunk, tasks):
+            for instance, other in zip(instances, partial):
+                instance.merge(other)
+    return {instance.name: instance.result() for instance in instances}
+
+def display_row(index, row):
+    """Вывод одной строки в формате 'Ключ → Значение'"""
+    print(f"\nПроект #{index}:")
+    for key, value in row.items():
+        print(f"  {key} → {value}")
+
 def display_data(data):
     """Вывод данных в формате 'Ключ → Значение'"""
     if not data:
@@ -27,9 +259,7 @@ def display_data(data):
     print("=" * 60)
     
     for i, row in enumerate(data, 1):
-        print(f"\nПроект #{i}:")
-        for key, value in row.items():
-            print(f"  {key} → {value}")
+        display_row(i, row)
 
 def find_min_max_budget(data):
     """Нахождение проекта с самым маленьким и самым большим бюджетом"""
@@ -78,49 +308,456 @@ def calculate_avg_completed_duration(data):
     if not data:
         return 0
     
-    completed_durations = []
-    for row in data:
-        if row.get('Completed', '').strip().lower() == 'yes':
+    query = GroupBy((), {'duration': ('mean', 'Duration', parse_duration)}, where='Completed == Yes')
+    return query.run(data).column('duration').get((), 0)
+
+def count_projects_by_status(data):
+    """Подсчет количества проектов по статусам завершения"""
+    if not data:
+        return {}
+    
+    return GroupBy(project_status, {'count': 'count'}).run(data).column('count')
+
+class ProjectColumns:
+    """
+    Данные проектов по колонкам: бюджет, размер команды и длительность
+    хранятся в компактных массивах array, статус - в виде кода; эти
+    колонки используются в расчетах. Исходный текст всех полей хранится
+    списками строк (повторяющиеся значения - одним объектом), поэтому
+    row() возвращает строку без изменений: "2 years", "N/A" и т.п.
+    Размеры команд, не помещающиеся в int64, хранятся в team_size как 0,
+    а их сумма - в team_size_overflow
+    """
+
+    def __init__(self, fieldnames):
+        self.fieldnames = list(fieldnames)
+        self.budget = array('d')
+        self.team_size = array('q')
+        self.team_size_overflow = 0
+        self.duration = array('d')
+        self.status = array('I')
+        self.statuses = []
+        self.text = {name: [] for name in self.fieldnames}
+
+    def __len__(self):
+        return len(self.status)
+
+    def row(self, index):
+        """Исходная строка в виде словаря (как у csv.DictReader)"""
+        return {name: self.text[name][index] for name in self.fieldnames}
+
+def _to_duration(value):
+    try:
+        return parse_duration(value)
+    except (ValueError, TypeError):
+        return math.nan
+
+def _parse_block(values, typecode, convert, default, overflow=None):
+    """
+    Быстрый разбор целой колонки блока; при ошибке - поэлементно.
+    Значение вне диапазона typecode заменяется на default и передается в overflow
+    """
+    try:
+        return array(typecode, map(convert, values))
+    except (ValueError, TypeError, OverflowError):
+        parsed = array(typecode)
+        for value in values:
             try:
-                duration = float(row.get('Duration', 0))
-                completed_durations.append(duration)
+                parsed.append(convert(value))
             except (ValueError, TypeError):
+                parsed.append(default)
+            except OverflowError:
+                parsed.append(default)
+                if overflow is not None:
+                    overflow(convert(value))
+        return parsed
+
+def _lookup_block(values, known, convert):
+    """Разбор колонки с повторяющимися значениями через словарь уже разобранных"""
+    for value in [value for value in dict.fromkeys(values) if value not in known]:
+        known[value] = convert(value)
+    return map(known.__getitem__, values)
+
+def fill_columns(columns, records, block_size=65536):
+    """
+    Разбор записей csv.reader (списков значений в порядке columns.fieldnames)
+    в типизированные колонки. Записи обрабатываются блоками: блок
+    транспонируется, и каждая колонка разбирается целиком
+    """
+    positions = {name: i for i, name in enumerate(columns.fieldnames)}
+    width = len(columns.fieldnames)
+
+    durations = {}
+    status_codes = {name: code for code, name in enumerate(columns.statuses)}
+    text_pools = {name: {} for name in columns.text}
+
+    def add_team_size_overflow(value):
+        columns.team_size_overflow += value
+
+    def status_code(value):
+        status = 'Unknown' if value is None else value.strip()
+        code = status_codes.get(status)
+        if code is None:
+            code = status_codes[status] = len(columns.statuses)
+            columns.statuses.append(status)
+        return code
+
+    records = iter(records)
+    while True:
+        block = list(islice(records, block_size))
+        if not block:
+            return columns
+        if set(map(len, block)) != {width}:
+            block = [(record + [None] * width)[:width] for record in block if record]
+            if not block:
                 continue
-    
-    if not completed_durations:
+
+        def column(name):
+            if name in positions:
+                return list(map(itemgetter(positions[name]), block))
+            return [None] * len(block)
+
+        columns.budget.extend(_parse_block(column('Budget'), 'd', float, math.nan))
+        columns.team_size.extend(_parse_block(column('TeamSize'), 'q', int, 0,
+                                               add_team_size_overflow))
+        columns.duration.extend(array('d', _lookup_block(column('Duration'), durations, _to_duration)))
+        columns.status.extend(array('I', _lookup_block(column('Completed'), {}, status_code)))
+        for name, values in columns.text.items():
+            texts = column(name)
+            values.extend(map(text_pools[name].setdefault, texts, texts))
+
+def load_columns(filename):
+    """Чтение CSV файла сразу в колонки ProjectColumns"""
+    with open_input(filename, encoding='utf-8', newline='') as file:
+        csv_reader = csv.reader(file, delimiter=';')
+        columns = ProjectColumns(next(csv_reader, []))
+        return fill_columns(columns, csv_reader)
+
+SNAPSHOT_MAGIC = b'LAB73SNP'
+SNAPSHOT_VERSION = 2
+SNAPSHOT_ALIGN = 8
+SNAPSHOT_ARRAYS = (('budget', 'd'), ('team_size', 'q'), ('duration', 'd'), ('status', 'I'))
+
+class _TextColumn:
+    """Строковая колонка снимка: строки декодируются только при обращении"""
+
+    def __init__(self, offsets, data):
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return str(self._data[start:end], 'utf-8')
+
+def snapshot_path(filename):
+    """Путь к файлу снимка для исходного CSV"""
+    return filename + '.snapshot'
+
+def _source_info(filename):
+    stat = os.stat(filename)
+    return {
+        'path': os.path.abspath(filename),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+
+def _file_hash(filename):
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def save_snapshot(columns, path, source):
+    """
+    Запись колонок в бинарный снимок: сигнатура, длина заголовка,
+    JSON заголовок и выровненные секции с сырыми данными массивов.
+    Файл записывается во временный и атомарно переименовывается
+    """
+    sections = [(name, array(typecode, getattr(columns, name))) for name, typecode in SNAPSHOT_ARRAYS]
+    for name, values in columns.text.items():
+        offsets = array('q', [0])
+        data = bytearray()
+        for value in values:
+            data += (value or '').encode('utf-8')
+            offsets.append(len(data))
+        sections.append((f'text:{name}:offsets', offsets))
+        sections.append((f'text:{name}:data', data))
+
+    layout = {}
+    position = 0
+    for name, values in sections:
+        typecode = values.typecode if isinstance(values, array) else 'B'
+        length = len(values) * (values.itemsize if isinstance(values, array) else 1)
+        layout[name] = {'typecode': typecode, 'offset': position, 'length': length}
+        position += -(-length // SNAPSHOT_ALIGN) * SNAPSHOT_ALIGN
+
+    header = json.dumps({
+        'version': SNAPSHOT_VERSION,
+        'source': source,
+        'fieldnames': columns.fieldnames,
+        'statuses': columns.statuses,
+        'team_size_overflow': columns.team_size_overflow,
+        'sections': layout,
+    }, ensure_ascii=False).encode('utf-8')
+    prefix = SNAPSHOT_MAGIC + struct.pack('<I', len(header)) + header
+    prefix += b'\0' * (-len(prefix) % SNAPSHOT_ALIGN)
+
+    with atomic_output(path, 'wb', compression=None) as file:
+        file.write(prefix)
+        for name, values in sections:
+            file.seek(len(prefix) + layout[name]['offset'])
+            file.write(values)
+        file.truncate(len(prefix) + position)
+
+def open_snapshot(path):
+    """
+    Открытие снимка через mmap без разбора данных.
+    Возвращает (заголовок, ProjectColumns); числовые колонки - memoryview
+    поверх отображенного файла, строковые декодируются по требованию.
+    Обрезанный или поврежденный снимок - ValueError
+    """
+    with open(path, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    start = len(SNAPSHOT_MAGIC)
+    if len(view) < start + 4 or view[:start] != SNAPSHOT_MAGIC:
+        raise ValueError(f"'{path}' не является снимком lab73")
+    (header_length,) = struct.unpack_from('<I', view, start)
+    start += 4
+    if start + header_length > len(view):
+        raise ValueError(f"снимок '{path}' обрезан")
+    header = json.loads(str(view[start:start + header_length], 'utf-8'))
+    if not isinstance(header, dict) or header.get('version') != SNAPSHOT_VERSION:
+        version = header.get('version') if isinstance(header, dict) else None
+        raise ValueError(f"неподдерживаемая версия снимка: {version}")
+    start += header_length
+    start += -start % SNAPSHOT_ALIGN
+
+    def section(name, count):
+        info = header['sections'][name]
+        offset = start + info['offset']
+        if offset + info['length'] > len(view):
+            raise ValueError(f"снимок '{path}' обрезан (секция {name})")
+        try:
+            values = view[offset:offset + info['length']].cast(info['typecode'])
+        except TypeError as e:
+            raise ValueError(f"секция {name} снимка '{path}' повреждена: {e}") from None
+        if count is not None and len(values) != count:
+            raise ValueError(f"секция {name} снимка '{path}' повреждена: {len(values)} значений вместо {count}")
+        return values
+
+    columns = ProjectColumns(header['fieldnames'])
+    columns.statuses = header['statuses']
+    columns.team_size_overflow = header.get('team_size_overflow', 0)
+    if not isinstance(columns.team_size_overflow, int):
+        raise ValueError(f"заголовок снимка '{path}' поврежден: team_size_overflow")
+    count = header['sections']['status']['length'] // array('I').itemsize
+    for name, _ in SNAPSHOT_ARRAYS:
+        setattr(columns, name, section(name, count))
+    for name in columns.text:
+        columns.text[name] = _TextColumn(section(f'text:{name}:offsets', count + 1),
+                                         section(f'text:{name}:data', None))
+    columns.snapshot = mapped
+    return header, columns
+
+def load_columns_cached(filename, rebuild=False):
+    """
+    Загрузка колонок через кэш-снимок рядом с исходным файлом.
+    Снимок используется, если совпадают путь, размер и время изменения
+    исходного файла, либо (если изменилось только время) хеш содержимого.
+    Иначе файл разбирается заново и снимок перезаписывается
+    """
+    path = snapshot_path(filename)
+    source = _source_info(filename)
+
+    if not rebuild and os.path.exists(path):
+        try:
+            header, columns = open_snapshot(path)
+            cached = header['source']
+        except (OSError, ValueError, KeyError, TypeError, struct.error) as e:
+            print(f"Снимок '{path}' поврежден и будет пересоздан: {e}")
+        else:
+            if all(cached.get(key) == source[key] for key in ('path', 'size', 'mtime_ns')):
+                return columns
+            if cached.get('size') == source['size']:
+                source['sha256'] = _file_hash(filename)
+                if cached.get('sha256') == source['sha256']:
+                    save_snapshot(columns, path, source)
+                    return columns
+
+    columns = load_columns(filename)
+    source.setdefault('sha256', _file_hash(filename))
+    save_snapshot(columns, path, source)
+    return columns
+
+def clear_snapshot(filename):
+    """Удаление снимка; возвращает True, если он существовал"""
+    try:
+        os.remove(snapshot_path(filename))
+        return True
+    except FileNotFoundError:
+        return False
+
+def _valid_budgets(columns):
+    budget = columns.budget
+    if not any(map(math.isnan, budget)):
+        return budget
+    return array('d', filterfalse(math.isnan, budget))
+
+def columnar_min_max_budget(columns):
+    """Индексы проектов с минимальным и максимальным бюджетом"""
+    valid = _valid_budgets(columns)
+    if not valid:
+        return None, None
+    budget = columns.budget
+    return indexOf(budget, min(valid)), indexOf(budget, max(valid))
+
+def columnar_total_team_size(columns):
+    """Общее количество сотрудников"""
+    return sum(columns.team_size) + columns.team_size_overflow
+
+def columnar_avg_completed_duration(columns):
+    """Средняя продолжительность завершенных проектов"""
+    completed = {code for code, name in enumerate(columns.statuses) if name.lower() == 'yes'}
+    durations = array('d', filterfalse(
+        math.isnan, compress(columns.duration, map(completed.__contains__, columns.status))))
+    if not durations:
         return 0
+    return sum(durations) / len(durations)
+
+def columnar_status_counts(columns):
+    """Количество проектов по статусам (в порядке первого появления)"""
+    counts = Counter(columns.status)
+    return {name: counts[code] for code, name in enumerate(columns.statuses)}
+
+def aggregate_columns(columns):
+    """Все показатели по колонкам в том же формате, что и aggregate_stream"""
+    min_index, max_index = columnar_min_max_budget(columns)
+    return {
+        'min_max_budget': (
+            columns.row(min_index) if min_index is not None else None,
+            columns.row(max_index) if max_index is not None else None,
+        ),
+        'total_team_size': columnar_total_team_size(columns),
+        'avg_completed_duration': columnar_avg_completed_duration(columns),
+        'status_counts': columnar_status_counts(columns),
+    }
+
+def print_header():
+    print("1. ЧТЕНИЕ И АНАЛИЗ СОДЕРЖИМОГО ФАЙЛА")
+    print("=" * 60)
+    print("=" * 60)
+    print("СОДЕРЖИМОЕ ФАЙЛА:")
+    print("=" * 60)
+
+def analyze_streaming(filename):
+    """Вывод строк и подсчет показателей за один потоковый проход"""
+    rows = iter_csv_rows(filename)
+    try:
+        first_row = next(rows, None)
+    except FileNotFoundError:
+        print(f"Ошибка: Файл '{filename}' не найден!")
+        first_row = None
+    
+    if not first_row:
+        return None
     
-    return sum(completed_durations) / len(completed_durations)
+    print_header()
+    
+    def displayed(rows):
+        for i, row in enumerate(rows, 1):
+            display_row(i, row)
+            yield row
+    
+    return aggregate_stream(displayed(chain([first_row], rows)))
 
-def count_projects_by_status(data):
-    """Подсчет количества проектов по статусам завершения"""
-    if not data:
-        return {}
+def analyze_columnar(filename, cache=False, rebuild_cache=False):
+    """Загрузка файла в типизированные колонки и подсчет показателей по ним"""
+    try:
+        if cache or rebuild_cache:
+            columns = load_columns_cached(filename, rebuild=rebuild_cache)
+        else:
+            columns = load_columns(filename)
+    except FileNotFoundError:
+        print(f"Ошибка: Файл '{filename}' не найден!")
+        return None
     
-    status_count = defaultdict(int)
-    for row in data:
-        status = row.get('Completed', 'Unknown').strip()
-        status_count[status] += 1
+    if not len(columns):
+        return None
     
-    return dict(status_count)
+    print_header()
+    for i in range(len(columns)):
+        display_row(i + 1, columns.row(i))
+    
+    return aggregate_columns(columns)
 
-def main():
-    filename = "11.csv"
-    data = read_csv_file(filename)
+def analyze_parallel(filename, workers=None, chunk_size=None):
+    """Подсчет показателей в пуле процессов (строки файла не выводятся)"""
+    try:
+        if not has_data_rows(filename):
+            return None
+    except FileNotFoundError:
+        print(f"Ошибка: Файл '{filename}' не найден!")
+        return None
     
-    if not data:
-        print("Не удалось прочитать данные из файла.")
+    print_header()
+    print("(вывод строк пропущен в параллельном режиме)")
+    
+    if chunk_size is None:
+        return aggregate_parallel(filename, workers)
+    return aggregate_parallel(filename, workers, chunk_size)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Анализ проектов из CSV файла")
+    parser.add_argument('filename', nargs='?', default='11.csv',
+                        help="CSV файл с разделителем ';', возможно сжатый gz/bz2/xz (по умолчанию 11.csv)")
+    parser.add_argument('--columnar', action='store_true',
+                        help="загрузить данные в типизированные колонки")
+    parser.add_argument('--cache', action='store_true',
+                        help="использовать бинарный снимок колонок (подразумевает --columnar)")
+    parser.add_argument('--rebuild-cache', action='store_true',
+                        help="разобрать файл заново и перезаписать снимок")
+    parser.add_argument('--clear-cache', action='store_true',
+                        help="удалить снимок и завершить работу")
+    parser.add_argument('--parallel', action='store_true',
+                        help="обрабатывать части файла в пуле процессов")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="количество рабочих процессов (по умолчанию - число ядер)")
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help="размер части файла в байтах для --parallel (по умолчанию 64 МБ)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.clear_cache:
+        if clear_snapshot(args.filename):
+            print(f"Снимок '{snapshot_path(args.filename)}' удален")
+        else:
+            print(f"Снимок '{snapshot_path(args.filename)}' не найден")
         return
     
-    print("1. ЧТЕНИЕ И АНАЛИЗ СОДЕРЖИМОГО ФАЙЛА")
-    print("=" * 60)
-    display_data(data)
+    if args.parallel:
+        results = analyze_parallel(args.filename, args.workers, args.chunk_size)
+    elif args.columnar or args.cache or args.rebuild_cache:
+        results = analyze_columnar(args.filename, args.cache, args.rebuild_cache)
+    else:
+        results = analyze_streaming(args.filename)
+    
+    if not results:
+        print("Не удалось прочитать данные из файла.")
+        return
     
     print("\n" + "=" * 60)
     print("2. ПРОЕКТЫ С МИНИМАЛЬНЫМ И МАКСИМАЛЬНЫМ БЮДЖЕТОМ")
     print("=" * 60)
     
-    min_project, max_project = find_min_max_budget(data)
+    min_project, max_project = results['min_max_budget']
     
     if min_project:
         print(f"\nПроект с минимальным бюджетом:")
@@ -142,25 +779,24 @@ def main():
     print("3. ОБЩЕЕ КОЛИЧЕСТВО СОТРУДНИКОВ")
     print("=" * 60)
     
-    total_team_size = calculate_total_team_size(data)
+    total_team_size = results['total_team_size']
     print(f"Общее количество сотрудников во всех проектах: {total_team_size}")
     
     print("\n" + "=" * 60)
     print("4. СРЕДНЯЯ ПРОДОЛЖИТЕЛЬНОСТЬ ЗАВЕРШЕННЫХ ПРОЕКТОВ")
     print("=" * 60)
     
-    avg_duration = calculate_avg_completed_duration(data)
+    avg_duration = results['avg_completed_duration']
     print(f"Средняя продолжительность завершенных проектов: {avg_duration:.2f}")
     
     print("\n" + "=" * 60)
     print("5. КОЛИЧЕСТВО ПРОЕКТОВ ПО СТАТУСАМ")
     print("=" * 60)
     
-    status_counts = count_projects_by_status(data)
+    status_counts = results['status_counts']
     print("Количество проектов по статусам завершения:")
     for status, count in status_counts.items():
         print(f"  Статус '{status}': {count} проект(ов)")
 
 if __name__ == "__main__":
-    import os
     main()
\ No newline at end of file
@@ -1,9 +1,15 @@
+import argparse
 import json
+import sys
+from collections import defaultdict
+
+from compressed import atomic_output, open_input
+from groupby import GroupBy
 
 def read_json_file(filename):
     """Чтение JSON файла"""
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
+        with open_input(filename, encoding='utf-8') as file:
             return json.load(file)
     except FileNotFoundError:
         print(f"Файл {filename} не найден")
@@ -12,105 +18,462 @@ def read_json_file(filename):
         print(f"Ошибка: {e}")
         return None
 
+class _JsonStreamReader:
+    """Буферизованное чтение JSON текста по частям для инкрементального разбора"""
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        if self.eof:
+            return False
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        chunk = self.file.read(max(self.chunk_size, len(self.buffer)))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def peek(self):
+        """Следующий значимый символ (пробелы пропускаются) или '' в конце файла"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, *chars):
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(f"ожидался один из символов {chars}, получено {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Разбор очередного JSON значения целиком"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+def iter_translators(filename, chunk_size=64 * 1024):
+    """
+    Потоковый разбор файла формата 11.json: элементы массива "translators"
+    возвращаются по одному, весь документ в память не загружается.
+    Файл открывается сразу при вызове, поэтому FileNotFoundError возникает
+    до начала разбора, а не при первой записи
+    """
+    return _parse_translators(open_input(filename, encoding='utf-8'), chunk_size)
+
+def _parse_translators(file, chunk_size):
+    with file:
+        reader = _JsonStreamReader(file, chunk_size)
+        reader.expect('{')
+        if reader.peek() == '}':
+            return
+        while True:
+            key = reader.value()
+            reader.expect(':')
+            if key == "translators" and reader.peek() == '[':
+                reader.expect('[')
+                if reader.peek() == ']':
+                    reader.expect(']')
+                else:
+                    while True:
+                        yield reader.value()
+                        if reader.expect(',', ']') == ']':
+                            break
+            else:
+                reader.value()
+            if reader.expect(',', '}') == '}':
+                return
+
+def _iter_translators(data):
+    """Переводчики из словаря формата 11.json или из итератора записей"""
+    if isinstance(data, dict):
+        return data.get("translators", [])
+    if data is None:
+        return []
+    return data
+
 def find_translators_by_language(data, language):
     """Поиск переводчиков по языку"""
     result = []
-    if isinstance(data, dict) and "translators" in data:
-        for translator in data["translators"]:
-            if translator.get("language", "").lower() == language.lower():
-                result.append(translator)
+    for translator in _iter_translators(data):
+        if translator.get("language", "").lower() == language.lower():
+            result.append(translator)
     return result
 
 def calculate_avg_rate_by_specialization(data):
     """Вычисление средней ставки по специализациям"""
-    rates = {}
-    if isinstance(data, dict) and "translators" in data:
-        for translator in data["translators"]:
-            spec = translator.get("specialization")
-            rate = translator.get("rate")
-            if spec and rate is not None:
-                try:
-                    rate_val = float(rate)
-                    if spec not in rates:
-                        rates[spec] = []
-                    rates[spec].append(rate_val)
-                except:
-                    continue
-    
-    avg_rates = {}
-    for spec, rate_list in rates.items():
-        if rate_list:
-            avg_rates[spec] = sum(rate_list) / len(rate_list)
-    
-    return avg_rates
+    query = GroupBy("specialization", {"rate": ("mean", "rate")}, skip_empty_keys=True)
+    return query.run(_iter_translators(data)).column("rate")
 
 def calculate_avg_experience_by_language(data):
     """Вычисление среднего опыта работы по языкам"""
-    experiences = {}
-    if isinstance(data, dict) and "translators" in data:
-        for translator in data["translators"]:
-            lang = translator.get("language")
-            exp = translator.get("experience_years")
-            if lang and exp is not None:
-                try:
-                    exp_val = float(exp)
-                    if lang not in experiences:
-                        experiences[lang] = []
-                    experiences[lang].append(exp_val)
-                except:
-                    continue
-    
-    avg_experiences = {}
-    for lang, exp_list in experiences.items():
-        if exp_list:
-            avg_experiences[lang] = sum(exp_list) / len(exp_list)
-    
-    return avg_experiences
+    query = GroupBy("language", {"experience": ("mean", "experience_years")}, skip_empty_keys=True)
+    return query.run(_iter_translators(data)).column("experience")
+
+OUTPUT_FORMATS = ('json', 'compact', 'ndjson')
+
+class JsonArrayWriter:
+    """
+    Потоковая запись документа {"<key>": [...]} по одной записи.
+    Формат 'json' совпадает байт в байт с json.dump(..., indent=2),
+    'compact' - с json.dump без отступов, 'ndjson' - одна запись на строку.
+    Данные пишутся во временный файл, который при успешном завершении
+    атомарно заменяет итоговый. compression - None, 'gz', 'bz2', 'xz'
+    или 'auto' (по расширению filename)
+    """
+
+    _encoders = {
+        'json': json.JSONEncoder(indent=2),
+        'compact': json.JSONEncoder(),
+        'ndjson': json.JSONEncoder(),
+    }
 
-def save_filtered_data(data, output_filename="out.json"):
-    """Сохранение отфильтрованных данных"""
+    def __init__(self, filename, key="translators", output_format='json', compression='auto'):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"неизвестный формат вывода: {output_format}")
+        self.filename = filename
+        self.key = key
+        self.output_format = output_format
+        self.compression = compression
+        self.count = 0
+        self._output = None
+        self._file = None
+        self._encode = self._encoders[output_format].encode
+
+    def __enter__(self):
+        self._output = atomic_output(self.filename, encoding='utf-8', compression=self.compression)
+        self._file = self._output.__enter__()
+        key = json.dumps(self.key)
+        if self.output_format == 'json':
+            self._file.write('{\n  ' + key + ': [')
+        elif self.output_format == 'compact':
+            self._file.write('{' + key + ': [')
+        return self
+
+    def write(self, record):
+        text = self._encode(record)
+        if self.output_format == 'json':
+            text = ('\n    ' if not self.count else ',\n    ') + text.replace('\n', '\n    ')
+        elif self.output_format == 'compact':
+            text = text if not self.count else ', ' + text
+        else:
+            text += '\n'
+        self._file.write(text)
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, traceback):
+        try:
+            if exc_type is None:
+                if self.output_format == 'json':
+                    self._file.write('\n  ]\n}' if self.count else ']\n}')
+                elif self.output_format == 'compact':
+                    self._file.write(']}')
+        except BaseException:
+            self._output.__exit__(*sys.exc_info())
+            raise
+        return self._output.__exit__(exc_type, exc, traceback)
+
+def save_filtered_data(data, output_filename="out.json", output_format='json', compression='auto'):
+    """
+    Сохранение отфильтрованных данных (записи пишутся по мере нахождения);
+    при имени вида out.json.gz (или явном compression) файл сжимается.
+    Перехватываются только ошибки записи (OSError); ошибки разбора входных
+    данных (ValueError) передаются вызывающему, прежний файл не изменяется
+    """
     try:
-        filtered = {"translators": []}
-        if isinstance(data, dict) and "translators" in data:
-            for translator in data["translators"]:
+        with JsonArrayWriter(output_filename, "translators", output_format, compression) as writer:
+            for translator in _iter_translators(data):
                 exp = translator.get("experience_years")
                 if exp is not None:
                     try:
                         if float(exp) > 5:
-                            filtered["translators"].append(translator)
+                            writer.write(translator)
                     except:
                         continue
-        
-        with open(output_filename, 'w', encoding='utf-8') as file:
-            json.dump(filtered, file, indent=2)
         return True
-    except Exception as e:
+    except OSError as e:
         print(f"Ошибка сохранения: {e}")
         return False
 
-def main():
-    data = read_json_file("11.json")
-    if not data:
-        return
+def normalize_key(value):
+    """Нормализация языка или специализации для поиска"""
+    return str(value).lower()
+
+def _to_float(value):
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+def _group_key(value):
+    """Ключ группы для средних при поиске; пустая группа не учитывается"""
+    return normalize_key(value) if value else value
+
+class RunningAverages:
+    """Суммы и количества значений по группам для вычисления средних"""
+
+    def __init__(self):
+        self._totals = {}
+
+    def add(self, group, value):
+        if group and value is not None:
+            total = self._totals.setdefault(group, [0.0, 0])
+            total[0] += value
+            total[1] += 1
+
+    def remove(self, group, value):
+        if group and value is not None:
+            total = self._totals[group]
+            total[0] -= value
+            total[1] -= 1
+            if not total[1]:
+                del self._totals[group]
+
+    def get(self, group):
+        """Среднее для группы или None"""
+        total = self._totals.get(group)
+        return total[0] / total[1] if total else None
+
+    def result(self):
+        """Средние по всем группам в порядке их первого появления"""
+        return {group: total[0] / total[1] for group, total in self._totals.items()}
+
+class TranslatorStore:
+    """
+    Хранилище переводчиков с хеш-индексами по нормализованному языку и
+    специализации. Суммы и количества для средних значений по группам
+    поддерживаются при каждой вставке и удалении, поэтому поиск и
+    средние вычисляются без просмотра всего списка
+    """
+
+    def __init__(self, translators=()):
+        self._translators = {}
+        self._by_language = defaultdict(dict)
+        self._by_specialization = defaultdict(dict)
+        # средние по исходным названиям (для отчета, как в calculate_avg_*)
+        # и по нормализованным (для поиска без учета регистра)
+        self._rates = RunningAverages()
+        self._experiences = RunningAverages()
+        self._rates_by_key = RunningAverages()
+        self._experiences_by_key = RunningAverages()
+        self._next_key = 0
+        for translator in translators:
+            self.insert(translator)
+
+    @classmethod
+    def from_data(cls, data):
+        """Построение хранилища из словаря формата 11.json"""
+        if isinstance(data, dict) and "translators" in data:
+            return cls(data["translators"])
+        return cls()
+
+    def __len__(self):
+        return len(self._translators)
+
+    def __iter__(self):
+        return iter(self._translators.values())
+
+    def _key(self, translator, replace):
+        key = translator.get("translator_id")
+        if key is None or (key in self._translators and not replace):
+            # запись без id или повтор id: хранится под отдельным ключом,
+            # как и в списке из файла, где повторы тоже учитываются
+            key = ("auto", self._next_key)
+            self._next_key += 1
+        return key
+
+    def insert(self, translator, replace=False):
+        """
+        Добавление переводчика. Возвращает ключ.
+        Запись с уже существующим translator_id добавляется как отдельная;
+        при replace=True она заменяет прежнюю запись с этим id
+        """
+        key = self._key(translator, replace)
+        if key in self._translators:
+            self.delete(key)
+        self._translators[key] = translator
+
+        language = translator.get("language", "")
+        specialization = translator.get("specialization")
+        self._by_language[normalize_key(language)][key] = translator
+        if specialization is not None:
+            self._by_specialization[normalize_key(specialization)][key] = translator
+
+        rate = _to_float(translator.get("rate"))
+        experience = _to_float(translator.get("experience_years"))
+        self._rates.add(specialization, rate)
+        self._experiences.add(language, experience)
+        self._rates_by_key.add(_group_key(specialization), rate)
+        self._experiences_by_key.add(_group_key(language), experience)
+        return key
+
+    def delete(self, key):
+        """Удаление переводчика по ключу (translator_id). Возвращает удаленную запись или None"""
+        translator = self._translators.pop(key, None)
+        if translator is None:
+            return None
+
+        language = translator.get("language", "")
+        specialization = translator.get("specialization")
+        self._discard(self._by_language, normalize_key(language), key)
+        if specialization is not None:
+            self._discard(self._by_specialization, normalize_key(specialization), key)
+
+        rate = _to_float(translator.get("rate"))
+        experience = _to_float(translator.get("experience_years"))
+        self._rates.remove(specialization, rate)
+        self._experiences.remove(language, experience)
+        self._rates_by_key.remove(_group_key(specialization), rate)
+        self._experiences_by_key.remove(_group_key(language), experience)
+        return translator
+
+    @staticmethod
+    def _discard(index, group, key):
+        members = index[group]
+        del members[key]
+        if not members:
+            del index[group]
+
+    def find_by_language(self, language):
+        """Переводчики с заданным языком (без учета регистра)"""
+        members = self._by_language.get(normalize_key(language))
+        return list(members.values()) if members else []
+
+    def count_by_language(self, language):
+        members = self._by_language.get(normalize_key(language))
+        return len(members) if members else 0
+
+    def find_by_specialization(self, specialization):
+        """Переводчики с заданной специализацией (без учета регистра)"""
+        members = self._by_specialization.get(normalize_key(specialization))
+        return list(members.values()) if members else []
+
+    def avg_rate(self, specialization):
+        """Средняя ставка для специализации (без учета регистра) или None"""
+        return self._rates_by_key.get(_group_key(specialization))
+
+    def avg_experience(self, language):
+        """Средний опыт работы для языка (без учета регистра) или None"""
+        return self._experiences_by_key.get(_group_key(language))
+
+    def avg_rates(self):
+        """Средние ставки по всем специализациям (как calculate_avg_rate_by_specialization)"""
+        return self._rates.result()
+
+    def avg_experiences(self):
+        """Средний опыт по всем языкам (как calculate_avg_experience_by_language)"""
+        return self._experiences.result()
+
+def analyze_stream(filename, language, output_filename="out.json", output_format='json'):
+    """
+    Один потоковый проход по файлу: каждая запись сразу учитывается в поиске
+    по языку и средних значениях и передается в фильтр save_filtered_data.
+    Возвращает словарь с результатами всех шагов
+    """
+    language = normalize_key(language)
+    results = {"language_count": 0}
+    rates = RunningAverages()
+    experiences = RunningAverages()
     
-    print("1. Поиск переводчиков по языку")
-    language = input("Введите язык: ").strip()
-    translators = find_translators_by_language(data, language)
-    print(f"Найдено: {len(translators)} переводчиков")
+    def observed(translators):
+        for translator in translators:
+            if normalize_key(translator.get("language", "")) == language:
+                results["language_count"] += 1
+            rates.add(translator.get("specialization"), _to_float(translator.get("rate")))
+            experiences.add(translator.get("language"), _to_float(translator.get("experience_years")))
+            yield translator
+    
+    results["saved"] = save_filtered_data(observed(iter_translators(filename)), output_filename, output_format)
+    results["avg_rates"] = rates.result()
+    results["avg_experiences"] = experiences.result()
+    return results
+
+def print_results(language_count, avg_rates, avg_exp):
+    print(f"Найдено: {language_count} переводчиков")
     
     print("\n2. Средняя ставка по специализациям")
-    avg_rates = calculate_avg_rate_by_specialization(data)
     for spec, rate in avg_rates.items():
         print(f"{spec}: {rate:.1f}")
     
     print("\n3. Средний опыт работы по языкам")
-    avg_exp = calculate_avg_experience_by_language(data)
     for lang, exp in avg_exp.items():
         print(f"{lang}: {exp:.1f} лет")
     
     print("\n4. Сохранение отфильтрованных данных")
-    if save_filtered_data(data):
-        print("Данные сохранены в out.json")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Анализ переводчиков из JSON файла")
+    parser.add_argument('filename', nargs='?', default='11.json',
+                        help="JSON файл с массивом translators, возможно сжатый gz/bz2/xz (по умолчанию 11.json)")
+    parser.add_argument('-o', '--output', default='out.json',
+                        help="файл для отфильтрованных данных; .gz/.bz2/.xz - со сжатием (по умолчанию out.json)")
+    parser.add_argument('--stream', action='store_true',
+                        help="потоковый разбор файла без загрузки в память")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='json',
+                        help="формат отфильтрованных данных: json (с отступами), compact или ndjson")
+    parser.add_argument('-l', '--language',
+                        help="язык для поиска (если не указан, запрашивается с клавиатуры)")
+    return parser.parse_args(argv)
+
+def ask_language(language=None):
+    if language is not None:
+        print(f"Язык: {language}")
+        return language.strip()
+    return input("Введите язык: ").strip()
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    if args.stream:
+        print("1. Поиск переводчиков по языку")
+        language = ask_language(args.language)
+        try:
+            results = analyze_stream(args.filename, language, args.output, args.format)
+        except FileNotFoundError:
+            print(f"Файл {args.filename} не найден")
+            return
+        except (OSError, ValueError) as e:
+            print(f"Ошибка: {e}")
+            return
+        print_results(results["language_count"], results["avg_rates"], results["avg_experiences"])
+        if results["saved"]:
+            print(f"Данные сохранены в {args.output}")
+        return
+    
+    data = read_json_file(args.filename)
+    if not data:
+        return
+    store = TranslatorStore.from_data(data)
+    
+    print("1. Поиск переводчиков по языку")
+    language = ask_language(args.language)
+    print_results(store.count_by_language(language), store.avg_rates(), store.avg_experiences())
+    if save_filtered_data(data, args.output, args.format):
+        print(f"Данные сохранены в {args.output}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
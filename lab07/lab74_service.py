@@ -0,0 +1,319 @@
+"""
+Постоянно работающий сервис запросов к переводчикам (lab74).
+Файл загружается и индексируется (TranslatorStore) один раз, затем
+запросы принимаются по строковому протоколу через unix-сокет, TCP или
+stdin/stdout. При изменении файла данные перезагружаются в фоне.
+
+Протокол: одна команда в строке, ответ - одна строка JSON с полем "ok".
+    ping
+    language <язык>           переводчики с языком
+    count <язык>              количество переводчиков с языком
+    specialization <спец.>    переводчики со специализацией
+    avg_rate <спец.>          средняя ставка для специализации
+    avg_experience <язык>     средний опыт для языка
+    rates                     средние ставки по специализациям
+    experiences               средний опыт по языкам
+    stats                     состояние сервиса
+    quit                      закрыть соединение
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import time
+
+from lab74 import TranslatorStore, iter_translators
+
+DEFAULT_SOCKET = 'lab74.sock'
+
+def load_store(filename):
+    """Загрузка и индексация файла (выполняется в отдельном потоке)"""
+    return TranslatorStore(iter_translators(filename))
+
+class TranslatorService:
+    """
+    Состояние сервиса: текущее хранилище и сведения о загрузке.
+    Хранилище заменяется целиком после успешной перезагрузки, поэтому
+    запросы всегда видят согласованные данные
+    """
+
+    def __init__(self, filename, poll_interval=1.0):
+        self.filename = filename
+        self.poll_interval = poll_interval
+        self.store = None
+        self.mtime = None
+        self.loaded_at = None
+        self.reloads = 0
+        self.clients = 0
+        self.requests = 0
+        self.last_error = None
+
+    def _signature(self):
+        stat = os.stat(self.filename)
+        return stat.st_mtime_ns, stat.st_size
+
+    async def load(self):
+        import asyncio
+        signature = self._signature()
+        store = await asyncio.get_running_loop().run_in_executor(None, load_store, self.filename)
+        self.store = store
+        self.mtime = signature
+        self.loaded_at = time.time()
+        self.reloads += 1
+        self.last_error = None
+        log(f"Загружено переводчиков: {len(store)} из '{self.filename}'")
+
+    async def watch(self):
+        """Фоновая проверка изменения файла (mtime и размер) и перезагрузка"""
+        import asyncio
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                signature = self._signature()
+                if signature == self.mtime:
+                    continue
+                # сигнатура запоминается до загрузки: испорченный файл
+                # читается повторно только после следующего изменения
+                self.mtime = signature
+                await self.load()
+            except Exception as e:
+                # любая ошибка разбора (в том числе TypeError от записи с
+                # неподходящим translator_id) не останавливает наблюдение,
+                # остаются прежние данные
+                self.last_error = f"{type(e).__name__}: {e}"
+                log(f"Ошибка перезагрузки '{self.filename}': {self.last_error}")
+
+    def handle(self, line):
+        """Ответ (словарь) на одну строку протокола"""
+        self.requests += 1
+        command, _, argument = line.strip().partition(' ')
+        command = command.lower()
+        argument = argument.strip()
+        store = self.store
+
+        if command == 'ping':
+            return {'ok': True, 'result': 'pong'}
+        if command == 'stats':
+            return {'ok': True, 'result': {
+                'file': self.filename,
+                'translators': len(store),
+                'loaded_at': self.loaded_at,
+                'reloads': self.reloads,
+                'clients': self.clients,
+                'requests': self.requests,
+                'last_error': self.last_error,
+            }}
+        if command == 'rates':
+            return {'ok': True, 'result': store.avg_rates()}
+        if command == 'experiences':
+            return {'ok': True, 'result': store.avg_experiences()}
+        if command in QUERIES:
+            if not argument:
+                return {'ok': False, 'error': f"команде {command} нужен аргумент"}
+            return {'ok': True, 'result': QUERIES[command](store, argument)}
+        return {'ok': False, 'error': f"неизвестная команда: {command or '(пусто)'}"}
+
+QUERIES = {
+    'language': TranslatorStore.find_by_language,
+    'count': TranslatorStore.count_by_language,
+    'specialization': TranslatorStore.find_by_specialization,
+    'avg_rate': TranslatorStore.avg_rate,
+    'avg_experience': TranslatorStore.avg_experience,
+}
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+def encode(response):
+    return (json.dumps(response, ensure_ascii=False) + '\n').encode('utf-8')
+
+async def serve_client(service, reader, writer):
+    service.clients += 1
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            line = line.decode('utf-8', errors='replace')
+            if line.strip().lower() == 'quit':
+                break
+            if not line.strip():
+                continue
+            writer.write(encode(service.handle(line)))
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        service.clients -= 1
+        writer.close()
+
+async def serve_stdin(service):
+    """Протокол через stdin/stdout (одна сессия)"""
+    import asyncio
+    loop = asyncio.get_running_loop()
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line or line.strip().lower() == 'quit':
+            break
+        if line.strip():
+            sys.stdout.write(encode(service.handle(line)).decode('utf-8'))
+            sys.stdout.flush()
+
+async def run_service(filename, socket_path=None, host=None, port=None, stdin=False,
+                      poll_interval=1.0):
+    import asyncio
+    service = TranslatorService(filename, poll_interval)
+    await service.load()
+    watcher = asyncio.create_task(service.watch())
+    try:
+        if stdin:
+            await serve_stdin(service)
+            return
+
+        def handler(reader, writer):
+            return serve_client(service, reader, writer)
+
+        if port is not None:
+            server = await asyncio.start_server(handler, host or '127.0.0.1', port)
+            # при --port 0 порт выбирает система, в сообщении - фактический
+            address = server.sockets[0].getsockname()
+            log(f"Сервис слушает {address[0]}:{address[1]}")
+        else:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            server = await asyncio.start_unix_server(handler, socket_path)
+            log(f"Сервис слушает {socket_path}")
+        loop = asyncio.get_running_loop()
+        serving = asyncio.ensure_future(server.serve_forever())
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, serving.cancel)
+        try:
+            async with server:
+                await serving
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if port is None and os.path.exists(socket_path):
+                os.unlink(socket_path)
+    finally:
+        watcher.cancel()
+
+class Client:
+    """Синхронный клиент: несколько запросов через одно соединение"""
+
+    def __init__(self, socket_path=DEFAULT_SOCKET, host=None, port=None, timeout=10):
+        if port is not None:
+            self._socket = socket.create_connection((host or '127.0.0.1', port), timeout)
+        else:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(timeout)
+            self._socket.connect(socket_path)
+        self._file = self._socket.makefile('rwb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        try:
+            self._file.write(b'quit\n')
+            self._file.flush()
+        except OSError:
+            pass
+        self._file.close()
+        self._socket.close()
+
+    def request(self, command, argument=None):
+        """Отправка команды и ответ сервиса (словарь)"""
+        line = command if argument is None else f"{command} {argument}"
+        self._file.write(line.replace('\n', ' ').encode('utf-8') + b'\n')
+        self._file.flush()
+        response = self._file.readline()
+        if not response:
+            raise ConnectionError("сервис закрыл соединение")
+        return json.loads(response)
+
+def print_response(command, response):
+    if not response.get('ok'):
+        print(f"Ошибка: {response.get('error')}")
+        return
+    result = response['result']
+    if command in ('language', 'specialization'):
+        print(f"Найдено: {len(result)} переводчиков")
+        for translator in result:
+            print(f"  {translator.get('name')} ({translator.get('language')}, "
+                  f"{translator.get('specialization')}): ставка {translator.get('rate')}, "
+                  f"опыт {translator.get('experience_years')} лет")
+    elif command == 'rates':
+        for spec, rate in result.items():
+            print(f"{spec}: {rate:.1f}")
+    elif command == 'experiences':
+        for lang, exp in result.items():
+            print(f"{lang}: {exp:.1f} лет")
+    elif isinstance(result, dict):
+        for key, value in result.items():
+            print(f"{key}: {value}")
+    elif result is None:
+        print("Нет данных")
+    else:
+        print(result)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Сервис запросов к переводчикам")
+    subparsers = parser.add_subparsers(dest='mode', required=True)
+
+    def add_address(subparser):
+        subparser.add_argument('--socket', default=DEFAULT_SOCKET,
+                               help=f"путь к unix-сокету (по умолчанию {DEFAULT_SOCKET})")
+        subparser.add_argument('--host', default=None, help="адрес TCP (вместе с --port)")
+        subparser.add_argument('--port', type=int, default=None, help="порт TCP вместо unix-сокета")
+
+    serve = subparsers.add_parser('serve', help="запустить сервис")
+    serve.add_argument('filename', nargs='?', default='11.json',
+                       help="JSON файл с массивом translators (по умолчанию 11.json)")
+    add_address(serve)
+    serve.add_argument('--stdin', action='store_true',
+                       help="принимать команды из stdin и отвечать в stdout")
+    serve.add_argument('--poll', type=float, default=1.0,
+                       help="интервал проверки изменения файла в секундах (по умолчанию 1)")
+
+    query = subparsers.add_parser('query', help="выполнить запросы к запущенному сервису")
+    query.add_argument('command', help="команда протокола (language, count, rates, stats, ...)")
+    query.add_argument('argument', nargs='*', help="аргумент команды")
+    add_address(query)
+    query.add_argument('--json', action='store_true', help="вывести ответ как JSON")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.mode == 'serve':
+        # asyncio нужен только сервису; клиент query обходится без него
+        import asyncio
+        try:
+            asyncio.run(run_service(args.filename, args.socket, args.host, args.port,
+                                    args.stdin, args.poll))
+        except FileNotFoundError:
+            print(f"Файл {args.filename} не найден")
+        except KeyboardInterrupt:
+            pass
+        return
+
+    argument = ' '.join(args.argument) or None
+    try:
+        with Client(args.socket, args.host, args.port) as client:
+            response = client.request(args.command, argument)
+    except OSError as e:
+        print(f"Не удалось подключиться к сервису: {e}")
+        return 1
+    if args.json:
+        print(json.dumps(response, ensure_ascii=False, indent=2))
+    else:
+        print_response(args.command.lower(), response)
+    return 0 if response.get('ok') else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""Сравнение скорости извлечения результата из сохраненных страниц топ-листов"""
+import argparse
+import glob
+import os
+import time
+
+from lab82 import EXTRACTORS
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', '*.html')
+
+def benchmark(paths, repeat=20):
+    """Среднее время разбора одной страницы (мс) для каждого способа извлечения"""
+    pages = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+
+    timings = {}
+    for name, extract in EXTRACTORS.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for content in pages:
+                extract(content, '100-metres', 'men', 2024)
+        timings[name] = (time.perf_counter() - start) * 1000 / (repeat * len(pages))
+    return timings
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк разбора страниц топ-листов")
+    parser.add_argument('pages', nargs='*', help="HTML файлы (по умолчанию fixtures/*.html)")
+    parser.add_argument('--repeat', type=int, default=20, help="число повторов")
+    args = parser.parse_args(argv)
+
+    paths = args.pages or sorted(glob.glob(FIXTURES))
+    if not paths:
+        print("Нет страниц для разбора")
+        return
+
+    timings = benchmark(paths, args.repeat)
+    print(f"Страниц: {len(paths)}, повторов: {args.repeat}")
+    for name, ms in timings.items():
+        print(f"  {name}: {ms:.2f} мс на страницу")
+    if timings.get('fast'):
+        print(f"  Ускорение fast относительно bs4: {timings['bs4'] / timings['fast']:.1f}x")
+
+if __name__ == "__main__":
+    main()
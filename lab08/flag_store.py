@@ -0,0 +1,314 @@
+"""
+Хранилище флагов с адресацией по содержимому.
+Каждое изображение хранится один раз под своим хешем sha256
+(objects/ab/abcd....png), а manifest.json связывает имя с хешем.
+Файлы с именами вида Japan_flag.png - обычные копии объектов
+(перезаписываются только при изменении содержимого) или, при
+link_names=True, символические ссылки на объекты.
+Миниатюры (thumbs/w80/ab/abcd....png) тоже адресуются хешем исходного
+изображения, поэтому создаются только для новых или измененных флагов.
+Для миниатюр нужен Pillow; без него хранилище работает, но миниатюры
+не создаются
+"""
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+MANIFEST = 'manifest.json'
+MANIFEST_VERSION = 1
+OBJECTS_DIR = 'objects'
+THUMBS_DIR = 'thumbs'
+DEFAULT_SIZES = (40, 80, 160)
+EXTENSION = '.png'
+
+def _read_umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+FILE_MODE = 0o666 & ~_read_umask()
+
+@contextlib.contextmanager
+def atomic_file(filename, suffix=''):
+    """
+    Двоичный временный файл в папке filename (папка создается).
+    После выхода без ошибок получает права FILE_MODE и заменяет filename,
+    при ошибке удаляется. Общий помощник записи файлов для lab08
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(directory, exist_ok=True)
+    f = tempfile.NamedTemporaryFile('wb', dir=directory, suffix=suffix, delete=False)
+    try:
+        with f:
+            yield f
+        os.chmod(f.name, FILE_MODE)
+        os.replace(f.name, filename)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(f.name)
+        raise
+
+def write_atomic(filename, content):
+    """Атомарная запись байтов content в filename"""
+    with atomic_file(filename) as f:
+        f.write(content)
+
+def file_digest(filename):
+    """sha256 файла (hex)"""
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+_pil_image = None  # PIL.Image после первого вызова pil_image(); False - Pillow не установлен
+
+def pil_image():
+    """
+    Модуль PIL.Image или None, если Pillow не установлен.
+    Импортируется при первом вызове: без миниатюр Pillow не загружается
+    """
+    global _pil_image
+    if _pil_image is None:
+        try:
+            from PIL import Image as _pil_image
+        except ImportError:
+            _pil_image = False
+    return _pil_image or None
+
+def make_thumbnails(source, targets):
+    """
+    Миниатюры одного изображения: targets - список (ширина, путь).
+    Изображение декодируется один раз; выполняется в процессе пула
+    """
+    Image = pil_image()
+    with Image.open(source) as image:
+        image.load()
+        for width, target in targets:
+            height = max(1, round(image.height * width / image.width))
+            thumbnail = image.resize((width, height), Image.LANCZOS)
+            with atomic_file(target, suffix=EXTENSION) as f:
+                thumbnail.save(f, format='PNG', optimize=True)
+    return len(targets)
+
+class FlagStore:
+    """
+    Флаги в папке directory. put() сохраняет содержимое под его хешем
+    (одинаковые изображения хранятся один раз) и обновляет файл по имени
+    (копию или, при link_names=True, ссылку) и запись в манифесте;
+    save() записывает манифест. Методы put() можно вызывать из
+    нескольких потоков
+    """
+
+    def __init__(self, directory="country_flags", sizes=DEFAULT_SIZES, link_names=False):
+        self.directory = directory
+        self.sizes = tuple(sizes)
+        self.link_names = link_names
+        self.entries = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(directory, OBJECTS_DIR), exist_ok=True)
+        self._load()
+
+    def _load(self):
+        try:
+            with open(os.path.join(self.directory, MANIFEST), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        if manifest.get('version') == MANIFEST_VERSION:
+            self.entries = manifest.get('flags', {})
+
+    def save(self):
+        """Атомарная запись манифеста"""
+        with self._lock:
+            manifest = {'version': MANIFEST_VERSION, 'flags': dict(sorted(self.entries.items()))}
+        write_atomic(os.path.join(self.directory, MANIFEST),
+                      json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    def object_path(self, digest):
+        return os.path.join(self.directory, OBJECTS_DIR, digest[:2], digest + EXTENSION)
+
+    def thumbnail_path(self, digest, width):
+        return os.path.join(self.directory, THUMBS_DIR, f"w{width}", digest[:2], digest + EXTENSION)
+
+    def name_path(self, name):
+        return os.path.join(self.directory, name)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def digest(self, name):
+        """Хеш флага с именем name или None"""
+        entry = self.entries.get(name)
+        return entry['sha256'] if entry else None
+
+    def put(self, name, content, **attrs):
+        """
+        Сохранение содержимого под именем name (например Japan_flag.png).
+        Возвращает (путь по имени, изменилось ли что-то на диске)
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        path = self.object_path(digest)
+        changed = False
+        if not os.path.exists(path):
+            write_atomic(path, content)
+            changed = True
+        if self.link_names:
+            changed = self._link(name, path) or changed
+        else:
+            changed = self._copy(name, content, digest) or changed
+
+        with self._lock:
+            entry = self.entries.get(name)
+            if entry is None or entry['sha256'] != digest:
+                changed = True
+                self.entries[name] = {
+                    'sha256': digest,
+                    'bytes': len(content),
+                    'object': os.path.relpath(path, self.directory),
+                    'updated_at': time.time(),
+                    **attrs,
+                }
+        return self.name_path(name), changed
+
+    def _copy(self, name, content, digest):
+        """Обычный файл name с содержимым объекта; не перезаписывается, если не изменился"""
+        target = self.name_path(name)
+        if not os.path.islink(target) and os.path.isfile(target) and file_digest(target) == digest:
+            return False
+        write_atomic(target, content)
+        return True
+
+    def _link(self, name, path):
+        """Ссылка name -> объект; без поддержки символических ссылок - копия"""
+        link = self.name_path(name)
+        target = os.path.relpath(path, os.path.dirname(os.path.abspath(link)))
+        if os.path.islink(link) and os.readlink(link) == target:
+            return False
+        temp = f"{link}.{threading.get_ident()}.tmp"
+        try:
+            os.symlink(target, temp)
+            os.replace(temp, link)
+        except OSError:
+            if os.path.lexists(temp):
+                os.unlink(temp)
+            if not os.path.islink(link) and os.path.exists(link) and file_digest(link) == file_digest(path):
+                return False
+            with open(path, 'rb') as f:
+                write_atomic(link, f.read())
+        return True
+
+    def get(self, name):
+        """Содержимое флага по имени или None"""
+        digest = self.digest(name)
+        if digest is None:
+            return None
+        with open(self.object_path(digest), 'rb') as f:
+            return f.read()
+
+    def thumbnail(self, name, width):
+        """Путь к миниатюре флага шириной width или None, если ее нет"""
+        digest = self.digest(name)
+        if digest is None:
+            return None
+        path = self.thumbnail_path(digest, width)
+        return path if os.path.exists(path) else None
+
+    def pending_thumbnails(self):
+        """{хеш: [(ширина, путь)]} миниатюр, которых еще нет на диске"""
+        pending = {}
+        for entry in list(self.entries.values()):
+            digest = entry['sha256']
+            if digest in pending:
+                continue
+            targets = [(width, self.thumbnail_path(digest, width)) for width in self.sizes
+                       if not os.path.exists(self.thumbnail_path(digest, width))]
+            if targets:
+                pending[digest] = targets
+        return pending
+
+    def generate_thumbnails(self, max_workers=None):
+        """
+        Создание недостающих миниатюр в пуле процессов.
+        Возвращает число созданных файлов (None, если Pillow не установлен)
+        """
+        if pil_image() is None:
+            return None
+        pending = self.pending_thumbnails()
+        if not pending:
+            return 0
+        sources = [self.object_path(digest) for digest in pending]
+        targets = list(pending.values())
+        if len(pending) == 1 or max_workers == 1:
+            return sum(map(make_thumbnails, sources, targets))
+        from concurrent.futures import ProcessPoolExecutor
+        chunksize = max(1, len(pending) // ((max_workers or os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return sum(executor.map(make_thumbnails, sources, targets, chunksize=chunksize))
+
+    def verify(self, remove_corrupt=False):
+        """
+        Проверка целостности: хеш каждого объекта совпадает с его именем,
+        у каждой записи манифеста есть объект, файл по имени (копия или
+        ссылка) совпадает с объектом.
+        Возвращает словарь списков: corrupt, missing, bad_links.
+        При remove_corrupt поврежденные объекты удаляются (и будут скачаны заново)
+        """
+        problems = {'corrupt': [], 'missing': [], 'bad_links': []}
+        objects_dir = os.path.join(self.directory, OBJECTS_DIR)
+        for root, _, files in os.walk(objects_dir):
+            for filename in files:
+                path = os.path.join(root, filename)
+                if file_digest(path) != filename[:-len(EXTENSION)]:
+                    problems['corrupt'].append(path)
+                    if remove_corrupt:
+                        os.unlink(path)
+
+        for name, entry in sorted(self.entries.items()):
+            path = self.object_path(entry['sha256'])
+            if not os.path.exists(path):
+                problems['missing'].append(name)
+                continue
+            link = self.name_path(name)
+            if not os.path.exists(link) or (not os.path.samefile(link, path) and
+                                            file_digest(link) != entry['sha256']):
+                problems['bad_links'].append(name)
+        return problems
+
+    def gc(self):
+        """
+        Удаление объектов и миниатюр, на которые нет ссылок в манифесте
+        (например, прежних версий изменившихся флагов). Возвращает
+        (число удаленных файлов, освобожденные байты)
+        """
+        used = {entry['sha256'] for entry in self.entries.values()}
+        removed = freed = 0
+        for subdir in (OBJECTS_DIR, THUMBS_DIR):
+            for root, _, files in os.walk(os.path.join(self.directory, subdir)):
+                for filename in files:
+                    if filename[:-len(EXTENSION)] not in used:
+                        path = os.path.join(root, filename)
+                        freed += os.path.getsize(path)
+                        os.unlink(path)
+                        removed += 1
+        return removed, freed
+
+    def stats(self):
+        """Число имен, уникальных объектов и байты на диске (объекты и миниатюры)"""
+        objects = size = thumbs = 0
+        for subdir in (OBJECTS_DIR, THUMBS_DIR):
+            for root, _, files in os.walk(os.path.join(self.directory, subdir)):
+                for filename in files:
+                    size += os.path.getsize(os.path.join(root, filename))
+                    if subdir == OBJECTS_DIR:
+                        objects += 1
+                    else:
+                        thumbs += 1
+        return {'names': len(self.entries), 'objects': objects, 'thumbnails': thumbs, 'bytes': size}
@@ -0,0 +1,189 @@
+"""
+Необязательная трассировка этапов lab81/lab82: интервалы времени (span)
+со счетчиками байтов и строк и вывод сообщений через log().
+По умолчанию выключена: span() возвращает общий пустой объект, а log()
+работает как print, поэтому накладные расходы почти нулевые
+"""
+import functools
+import json
+import os
+import threading
+import time
+
+class _NullSpan:
+    """Пустой интервал для выключенной трассировки"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, name, value=1):
+        pass
+
+    def set(self, **attrs):
+        pass
+
+NULL_SPAN = _NullSpan()
+
+class Span:
+    """Интервал выполнения этапа: время, атрибуты и счетчики (bytes, rows, ...)"""
+    __slots__ = ('tracer', 'name', 'attrs', 'counters', 'start')
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.counters = {}
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        duration = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.attrs['error'] = f"{exc_type.__name__}: {exc}"
+        self.tracer._record({
+            'type': 'span',
+            'name': self.name,
+            'start': self.start - self.tracer.origin,
+            'duration': duration,
+            'thread': threading.get_ident(),
+            'attrs': self.attrs,
+            'counters': self.counters,
+        })
+        return False
+
+    def add(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+class Tracer:
+    """Сборщик интервалов и сообщений одного запуска"""
+
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+        self.events = []
+        self.origin = time.perf_counter()
+
+    def disable(self):
+        self.enabled = False
+
+    def _record(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def span(self, name, **attrs):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, attrs)
+
+    def log(self, *args, sep=' ', end='\n'):
+        """print с записью сообщения в трассировку (если она включена)"""
+        print(*args, sep=sep, end=end)
+        if self.enabled:
+            self._record({
+                'type': 'log',
+                'start': time.perf_counter() - self.origin,
+                'thread': threading.get_ident(),
+                'message': sep.join(map(str, args)),
+            })
+
+    def summary(self):
+        """Итоги по этапам: имя -> {count, seconds, счетчики}"""
+        totals = {}
+        for event in self.events:
+            if event['type'] != 'span':
+                continue
+            total = totals.setdefault(event['name'], {'count': 0, 'seconds': 0.0})
+            total['count'] += 1
+            total['seconds'] += event['duration']
+            for name, value in event['counters'].items():
+                total[name] = total.get(name, 0) + value
+        return totals
+
+    def write_trace(self, path):
+        """
+        Запись трассировки: для .json - формат Chrome trace (chrome://tracing,
+        Perfetto), иначе JSON lines (по событию в строке)
+        """
+        with self._lock:
+            events = list(self.events)
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith('.json'):
+                json.dump({'traceEvents': [_chrome_event(event) for event in events],
+                           'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+            else:
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False) + '\n')
+
+    def print_summary(self):
+        totals = self.summary()
+        if not totals:
+            return
+        print("\n" + "="*60)
+        print("ВРЕМЯ ПО ЭТАПАМ")
+        print("="*60)
+        for name, total in sorted(totals.items(), key=lambda item: -item[1]['seconds']):
+            counters = ', '.join(f"{key}={value:,}" for key, value in total.items()
+                                 if key not in ('count', 'seconds'))
+            print(f"{name:<28} {total['count']:>6} x {total['seconds']:>9.3f} с  {counters}")
+
+def _chrome_event(event):
+    chrome = {
+        'name': event.get('name', 'log'),
+        'pid': os.getpid(),
+        'tid': event['thread'],
+        'ts': round(event['start'] * 1e6, 3),
+    }
+    if event['type'] == 'span':
+        chrome.update(ph='X', dur=round(event['duration'] * 1e6, 3),
+                      args={**event['attrs'], **event['counters']})
+    else:
+        chrome.update(ph='i', s='t', args={'message': event['message']})
+    return chrome
+
+TRACER = Tracer()
+span = TRACER.span
+log = TRACER.log
+
+def enable():
+    TRACER.enable()
+
+def write_trace(path):
+    TRACER.write_trace(path)
+
+def print_summary():
+    TRACER.print_summary()
+
+def traced(name=None, rows=None):
+    """
+    Декоратор: выполнение функции как интервал name (по умолчанию - имя
+    функции); rows(result) - число строк результата для счетчика rows
+    """
+    def decorate(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with TRACER.span(label) as current:
+                result = func(*args, **kwargs)
+                if rows is not None and result is not None:
+                    current.add('rows', rows(result))
+                return result
+        return wrapper
+    return decorate
@@ -1,144 +1,499 @@
-import requests
+import argparse
+import hashlib
 import json
 import os
+import time
 
-def get_asian_countries():
-    """Получить данные об азиатских странах с численностью населения более 30 миллионов"""
-    url = "https://restcountries.com/v3.1/region/asia"
-    
-    try:
-        response = requests.get(url)
-        response.raise_for_status()  
+import instrument
+from flag_store import DEFAULT_SIZES, FlagStore, write_atomic
+from instrument import log, span, traced
+from lazy import LazyModule
+from ranking import METRIC_TITLES, CountryRanking, population_density, top_k
+
+# загружается при первом сетевом запросе
+requests = LazyModule('requests')
+
+REST_COUNTRIES_URL = "https://restcountries.com/v3.1"
+FLAG_CDN_URL = "https://flagcdn.com/w640"
+REGIONS = ('africa', 'americas', 'asia', 'europe', 'oceania')
+COUNTRY_FIELDS = 'name,capital,area,population,cca2,region'
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+def create_session(pool_size=10):
+    """Общая сессия с пулом соединений для всех запросов"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def fetch(session, url, timeout=10, retries=3, backoff=0.5, headers=None):
+    """
+    GET запрос с таймаутом и повторами с экспоненциальной задержкой
+    при ошибках соединения, таймаутах и статусах 429/5xx
+    """
+    for attempt in range(retries + 1):
+        try:
+            with span('http.get', url=url, attempt=attempt) as current:
+                response = session.get(url, timeout=timeout, headers=headers)
+                # elapsed - время до получения заголовков (DNS, соединение, ожидание ответа),
+                # остаток интервала - передача тела
+                current.set(status=response.status_code, headers_s=response.elapsed.total_seconds())
+                current.add('bytes', len(response.content))
+            if response.status_code in RETRY_STATUSES and attempt < retries:
+                raise requests.exceptions.HTTPError(
+                    f"{response.status_code} для {url}", response=response)
+            response.raise_for_status()
+            return response
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                requests.exceptions.HTTPError) as e:
+            status = e.response.status_code if e.response is not None else None
+            if attempt == retries or (status is not None and status not in RETRY_STATUSES):
+                raise
+            time.sleep(backoff * 2 ** attempt)
+
+class HttpCache:
+    """
+    Дисковый кэш HTTP ответов. Тело хранится вместе с ETag и Last-Modified,
+    повторные запросы отправляются как условные (If-None-Match /
+    If-Modified-Since) и при ответе 304 берутся из кэша.
+    Ответы моложе ttl секунд возвращаются без запроса; в режиме offline
+    используется только кэш
+    """
+
+    def __init__(self, directory=".http_cache", ttl=None, offline=False):
+        self.directory = directory
+        self.ttl = ttl
+        self.offline = offline
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + '.body', base + '.json'
+
+    def _load(self, url):
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                return meta, f.read()
+        except (OSError, ValueError):
+            return None, None
+
+    def _store(self, url, meta, body=None):
+        body_path, meta_path = self._paths(url)
+        if body is not None:
+            write_atomic(body_path, body)
+        write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def invalidate(self, url):
+        """Удаление ответа для url из кэша (например, если тело оказалось некорректным)"""
+        for path in self._paths(url):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def get(self, session, url, timeout=10, retries=3):
+        """Тело ответа для url из кэша или из сети"""
+        with span('cache.get', url=url) as current:
+            body = self._get(session, url, timeout, retries, current)
+            current.add('bytes', len(body))
+            return body
+
+    def _get(self, session, url, timeout, retries, current):
+        meta, body = self._load(url)
+        if meta is not None:
+            age = time.time() - meta.get('fetched_at', 0)
+            if self.offline or (self.ttl is not None and age < self.ttl):
+                current.set(source='cache')
+                return body
+        elif self.offline:
+            raise requests.exceptions.RequestException(f"нет в кэше (offline): {url}")
         
-        all_countries = response.json()
+        headers = {}
+        if meta is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
         
-        filtered_countries = []
-        for country in all_countries:
-            population = country.get('population', 0)
-            if population > 30000000:
-                country_data = {
-                    'name': country.get('name', {}).get('common', 'Unknown'),
-                    'capital': country.get('capital', ['Unknown'])[0] if country.get('capital') else 'Unknown',
-                    'area': country.get('area', 0),
-                    'population': population,
-                    'cca2': country.get('cca2', '').lower()  
-                }
-                filtered_countries.append(country_data)
+        response = fetch(session, url, timeout=timeout, retries=retries, headers=headers)
+        if response.status_code == 304 and meta is not None:
+            meta['fetched_at'] = time.time()
+            self._store(url, meta)
+            current.set(source='not-modified')
+            return body
         
-        return filtered_countries
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+        }
+        self._store(url, meta, response.content)
+        current.set(source='network')
+        return response.content
+
+def _get_content(session, url, cache=None, timeout=10, retries=3):
+    if cache is not None:
+        return cache.get(session, url, timeout=timeout, retries=retries)
+    return fetch(session, url, timeout=timeout, retries=retries).content
+
+def _country_record(country):
+    return {
+        'name': country.get('name', {}).get('common', 'Unknown'),
+        'capital': country.get('capital', ['Unknown'])[0] if country.get('capital') else 'Unknown',
+        'area': country.get('area', 0),
+        'population': country.get('population', 0),
+        'cca2': country.get('cca2', '').lower(),
+        'region': country.get('region', 'Unknown'),
+    }
+
+def get_countries(regions=('asia',), min_population=30000000, session=None,
+                  base_url=REST_COUNTRIES_URL, max_workers=5, timeout=10, retries=3, cache=None):
+    """
+    Получить страны заданных регионов с населением больше min_population.
+    Регионы запрашиваются параллельно через общую сессию
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    session = session or create_session(max_workers)
+    
+    def fetch_region(region):
+        url = f"{base_url}/region/{region}?fields={COUNTRY_FIELDS}"
+        content = _get_content(session, url, cache, timeout, retries)
+        with span('json.parse', region=region) as current:
+            try:
+                countries = json.loads(content)
+                if not isinstance(countries, list):
+                    raise ValueError(f"ожидался список стран, получен {type(countries).__name__}")
+            except ValueError as e:
+                # некорректный ответ не должен возвращаться из кэша при следующих запусках
+                if cache is not None:
+                    cache.invalidate(url)
+                raise ValueError(f"{url}: некорректный ответ ({e})") from None
+            current.add('bytes', len(content))
+            current.add('rows', len(countries))
+        return countries
+    
+    with span('get_countries', regions=list(regions)) as current:
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                payloads = list(executor.map(fetch_region, regions))
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError - ответ не JSON (например, HTML страница ошибки) или не список
+            log(f"Ошибка при получении данных: {e}")
+            return []
         
-    except requests.exceptions.RequestException as e:
-        print(f"Ошибка при получении данных: {e}")
-        return []
+        with span('filter', min_population=min_population) as filtering:
+            filtered_countries = []
+            for all_countries in payloads:
+                filtering.add('rows_in', len(all_countries))
+                for country in all_countries:
+                    if country.get('population', 0) > min_population:
+                        filtered_countries.append(_country_record(country))
+            filtering.add('rows', len(filtered_countries))
+        current.add('rows', len(filtered_countries))
+        return filtered_countries
+
+@traced(rows=len)
+def get_asian_countries(session=None, cache=None, min_population=30000000):
+    """Получить данные об азиатских странах с численностью населения более min_population (30 млн)"""
+    return get_countries(('asia',), min_population, session=session, cache=cache)
 
+@traced(rows=len)
 def calculate_population_density(countries):
     """Вычислить плотность населения для каждой страны"""
     for country in countries:
-        area = country['area']
-        population = country['population']
-        
-        if area > 0:
-            density = population / area
-            country['density'] = round(density, 2)
-        else:
-            country['density'] = 0
+        country['density'] = population_density(country)
     
     return countries
 
+# region нужен только для рейтингов по регионам и в results.json не попадает
+INTERNAL_FIELDS = ('region',)
+
 def save_to_json(data, filename='results.json'):
-    """Сохранить данные в JSON файл"""
+    """Сохранить данные в JSON файл (без служебных полей INTERNAL_FIELDS)"""
+    records = [{key: value for key, value in country.items() if key not in INTERNAL_FIELDS}
+               for country in data]
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"Данные сохранены в файл {filename}")
+        with span('save_to_json', filename=filename) as current, open(filename, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+            current.add('rows', len(data))
+            current.add('bytes', f.tell())
+        log(f"Данные сохранены в файл {filename}")
     except Exception as e:
-        print(f"Ошибка при сохранении в файл: {e}")
+        log(f"Ошибка при сохранении в файл: {e}")
 
-def print_top_5_by_density(countries):
+def print_top_5_by_density(countries, title="ТОП-5 АЗИАТСКИХ СТРАН ПО ПЛОТНОСТИ НАСЕЛЕНИЯ",
+                           subtitle="(с населением более 30 млн человек)"):
     """Вывести топ-5 стран по плотности населения"""
-    sorted_countries = sorted(countries, key=lambda x: x['density'], reverse=True)
-    top_5 = sorted_countries[:5]
+    top_5 = top_k(countries, lambda x: x['density'], 5)
     
-    print("\n" + "="*60)
-    print("ТОП-5 АЗИАТСКИХ СТРАН ПО ПЛОТНОСТИ НАСЕЛЕНИЯ")
-    print("(с населением более 30 млн человек)")
-    print("="*60)
+    log("\n" + "="*60)
+    log(title)
+    log(subtitle)
+    log("="*60)
     
     for i, country in enumerate(top_5, 1):
-        print(f"{i}. {country['name']}")
-        print(f"   Столица: {country['capital']}")
-        print(f"   Плотность населения: {country['density']:.2f} чел/км²")
-        print(f"   Население: {country['population']:,} чел")
-        print(f"   Площадь: {country['area']:,} км²")
-        print("-"*60)
+        log(f"{i}. {country['name']}")
+        log(f"   Столица: {country['capital']}")
+        log(f"   Плотность населения: {country['density']:.2f} чел/км²")
+        log(f"   Население: {country['population']:,} чел")
+        log(f"   Площадь: {country['area']:,} км²")
+        log("-"*60)
     
     return top_5
 
-def download_flags(top_countries):
-    """Скачать PNG флаги для топ-5 стран"""
-    flags_dir = "country_flags"
+def print_ranking_report(ranking, k=None):
+    """Вывести топ-K стран по каждому показателю для всех регионов вместе и каждого региона"""
+    k = ranking.k if k is None else k
+    for region in [None] + ranking.regions:
+        for metric in ranking.metrics:
+            title, unit = METRIC_TITLES[metric]
+            log("\n" + "="*60)
+            log(f"ТОП-{k} ПО {title.upper()}: {region or 'все регионы'}")
+            log("="*60)
+            for i, country in enumerate(ranking.top(metric, k, region), 1):
+                log(f"{i}. {country['name']} - {country[metric]:,} {unit}")
+
+def download_flag(session, country, flags_dir="country_flags", base_url=FLAG_CDN_URL,
+                  timeout=10, retries=3, cache=None, store=None):
+    """
+    Скачать флаг одной страны в хранилище флагов (FlagStore). Одинаковые
+    изображения хранятся один раз, файл по имени страны - их копия.
+    Возвращает (страна, имя файла или None, изменилось ли что-то, ошибка или None)
+    """
+    country_code = country.get('cca2', '').lower()
+    if not country_code:
+        return country, None, False, "не найден код страны"
+    
+    flag_url = f"{base_url}/{country_code}.png"
+    name = f"{country['name'].replace(' ', '_')}_flag.png"
+    try:
+        content = _get_content(session, flag_url, cache, timeout, retries)
+        own_store = store is None
+        if own_store:
+            store = FlagStore(flags_dir)
+        with span('write', filename=name) as current:
+            filename, written = store.put(name, content, country=country['name'], cca2=country_code)
+            current.set(written=written)
+            current.add('bytes', len(content))
+        if own_store:
+            store.save()
+        return country, filename, written, None
+    except (requests.exceptions.RequestException, OSError) as e:
+        return country, None, False, e
+
+@traced(rows=len)
+def download_flags(top_countries, flags_dir="country_flags", session=None, max_workers=8,
+                   base_url=FLAG_CDN_URL, timeout=10, retries=3, cache=None,
+                   thumb_sizes=DEFAULT_SIZES, link_names=False):
+    """
+    Скачать PNG флаги для стран параллельно (не более max_workers
+    одновременных загрузок) через общую сессию с пулом соединений,
+    затем создать недостающие миниатюры размеров thumb_sizes.
+    При link_names файлы по именам стран - символические ссылки на
+    объекты хранилища вместо копий
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
     if not os.path.exists(flags_dir):
         os.makedirs(flags_dir)
-        print(f"\nСоздана папка для флагов: {flags_dir}")
+        log(f"\nСоздана папка для флагов: {flags_dir}")
     
-    print("\n" + "="*60)
-    print("СОХРАНЕНИЕ ФЛАГОВ В ФОРМАТЕ PNG")
-    print("="*60)
+    log("\n" + "="*60)
+    log("СОХРАНЕНИЕ ФЛАГОВ В ФОРМАТЕ PNG")
+    log("="*60)
     
-    for country in top_countries:
-        country_code = country.get('cca2', '').lower()
-        country_name = country['name']
-        
-        if country_code:
-            flag_url = f"https://flagcdn.com/w640/{country_code}.png"
-            filename = f"{flags_dir}/{country_name.replace(' ', '_')}_flag.png"
-            
-            try:
-                response = requests.get(flag_url)
-                response.raise_for_status()
-                
-                with open(filename, 'wb') as f:
-                    f.write(response.content)
-                
-                print(f"✓ Флаг {country_name} сохранен как: {filename}")
-                
-            except requests.exceptions.RequestException as e:
-                print(f"✗ Ошибка при загрузке флага {country_name}: {e}")
-        else:
-            print(f"✗ Не найден код страны для {country_name}")
-
-def main():
+    session = session or create_session(max_workers)
+    
+    store = FlagStore(flags_dir, thumb_sizes, link_names)
+    
+    def download(country):
+        return download_flag(session, country, flags_dir, base_url, timeout, retries, cache, store)
+    
+    saved = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for country, filename, written, error in executor.map(download, top_countries):
+            country_name = country['name']
+            if filename:
+                saved.append(filename)
+                if written:
+                    log(f"✓ Флаг {country_name} сохранен как: {filename}")
+                else:
+                    log(f"✓ Флаг {country_name} не изменился: {filename}")
+            elif not country.get('cca2'):
+                log(f"✗ Не найден код страны для {country_name}")
+            else:
+                log(f"✗ Ошибка при загрузке флага {country_name}: {error}")
+    store.save()
+    
+    if thumb_sizes:
+        with span('thumbnails', sizes=list(thumb_sizes)) as current:
+            created = store.generate_thumbnails()
+            current.add('rows', created or 0)
+        if created is None:
+            log("Миниатюры не созданы: не установлен Pillow")
+        elif created:
+            log(f"Создано миниатюр: {created} ({', '.join(map(str, thumb_sizes))} px)")
+    return saved
+
+def verify_flags(flags_dir="country_flags", remove_corrupt=False):
+    """Проверить целостность хранилища флагов и вывести найденные проблемы"""
+    store = FlagStore(flags_dir)
+    problems = store.verify(remove_corrupt)
+    stats = store.stats()
+    log(f"Флагов: {stats['names']}, уникальных изображений: {stats['objects']}, "
+        f"миниатюр: {stats['thumbnails']}, на диске: {stats['bytes']:,} байт")
+    labels = {'corrupt': "Поврежденные объекты", 'missing': "Нет объекта для флага",
+              'bad_links': "Файл или ссылка не совпадает с объектом"}
+    for kind, items in problems.items():
+        for item in items:
+            log(f"✗ {labels[kind]}: {item}")
+    if not any(problems.values()):
+        log("✓ Хранилище флагов в порядке")
+    return problems
+
+def gc_flags(flags_dir="country_flags"):
+    """Удалить изображения и миниатюры, которые больше не используются ни одним флагом"""
+    removed, freed = FlagStore(flags_dir).gc()
+    log(f"Удалено неиспользуемых файлов: {removed}, освобождено: {freed:,} байт")
+    return removed, freed
+
+def parse_sizes(text):
+    try:
+        sizes = tuple(int(size) for size in text.split(',') if size.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"некорректный список размеров: {text!r}")
+    if any(size <= 0 for size in sizes):
+        raise argparse.ArgumentTypeError("размеры должны быть положительными")
+    return sizes
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Данные о странах и их флаги")
+    parser.add_argument('--region', action='append', choices=REGIONS + ('all',),
+                        help="регион (можно указать несколько раз; all - все регионы), по умолчанию asia")
+    parser.add_argument('--min-population', type=int, default=30000000,
+                        help="минимальная численность населения (по умолчанию 30 млн)")
+    parser.add_argument('--workers', type=int, default=8,
+                        help="максимальное число одновременных запросов")
+    parser.add_argument('--timeout', type=float, default=10,
+                        help="таймаут одного запроса в секундах")
+    parser.add_argument('--retries', type=int, default=3,
+                        help="число повторов при ошибке запроса")
+    parser.add_argument('--cache-dir', default='.http_cache',
+                        help="папка HTTP кэша (по умолчанию .http_cache)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="не использовать HTTP кэш")
+    parser.add_argument('--ttl', type=float, default=None,
+                        help="использовать кэшированные ответы моложе TTL секунд без запроса")
+    parser.add_argument('--offline', action='store_true',
+                        help="работать только с кэшем, без обращения к сети")
+    parser.add_argument('--api-url', default=REST_COUNTRIES_URL,
+                        help="базовый адрес RestCountries API")
+    parser.add_argument('--flags-url', default=FLAG_CDN_URL,
+                        help="базовый адрес сервера с флагами")
+    parser.add_argument('-o', '--output', default='results.json',
+                        help="файл для данных о странах (по умолчанию results.json)")
+    parser.add_argument('--flags-dir', default='country_flags',
+                        help="папка для флагов (по умолчанию country_flags)")
+    parser.add_argument('--thumb-sizes', type=parse_sizes, default=DEFAULT_SIZES,
+                        help="ширины миниатюр флагов через запятую (по умолчанию "
+                             f"{','.join(map(str, DEFAULT_SIZES))}; пустая строка - без миниатюр)")
+    parser.add_argument('--link-flags', action='store_true',
+                        help="файлы флагов - символические ссылки на объекты хранилища, а не копии")
+    parser.add_argument('--verify-flags', action='store_true',
+                        help="только проверить целостность сохраненных флагов")
+    parser.add_argument('--gc-flags', action='store_true',
+                        help="только удалить изображения и миниатюры, не используемые ни одним флагом")
+    parser.add_argument('--report', action='store_true',
+                        help="вывести рейтинги по плотности, населению и площади для каждого региона")
+    parser.add_argument('--top', type=int, default=5,
+                        help="размер рейтингов в отчете --report (по умолчанию 5)")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="записать трассировку этапов (.json - формат Chrome trace, иначе JSON lines)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Основная функция приложения"""
-    print("="*60)
-    print("ПОЛУЧЕНИЕ ДАННЫХ ОБ АЗИАТСКИХ СТРАНАХ")
-    print("="*60)
+    args = parse_args(argv)
+    if args.trace:
+        instrument.enable()
+    try:
+        run(args)
+    finally:
+        if args.trace:
+            instrument.write_trace(args.trace)
+            instrument.print_summary()
+
+def run(args):
+    """Этапы получения данных, расчета, сохранения и загрузки флагов"""
+    if args.verify_flags or args.gc_flags:
+        if args.verify_flags:
+            verify_flags(args.flags_dir)
+        if args.gc_flags:
+            gc_flags(args.flags_dir)
+        return
     
-    print("\n1. Получение данных с RestCountries API...")
-    countries = get_asian_countries()
+    regions = args.region or ['asia']
+    if 'all' in regions:
+        regions = list(REGIONS)
+    asia_only = regions == ['asia'] and args.min_population == 30000000
+    session = create_session(args.workers)
+    cache = None if args.no_cache else HttpCache(args.cache_dir, args.ttl, args.offline)
+    
+    log("="*60)
+    if asia_only:
+        log("ПОЛУЧЕНИЕ ДАННЫХ ОБ АЗИАТСКИХ СТРАНАХ")
+    else:
+        log(f"ПОЛУЧЕНИЕ ДАННЫХ О СТРАНАХ: {', '.join(regions)}")
+    log("="*60)
+    
+    log("\n1. Получение данных с RestCountries API...")
+    countries = get_countries(regions, args.min_population, session=session, base_url=args.api_url,
+                              max_workers=args.workers, timeout=args.timeout, retries=args.retries,
+                              cache=cache)
     
     if not countries:
-        print("Не удалось получить данные стран.")
+        log("Не удалось получить данные стран.")
         return
     
-    print(f"Найдено {len(countries)} азиатских стран с населением > 30 млн")
+    if asia_only:
+        log(f"Найдено {len(countries)} азиатских стран с населением > 30 млн")
+    else:
+        log(f"Найдено {len(countries)} стран с населением > {args.min_population:,}")
     
-    print("\n2. Вычисление плотности населения...")
+    log("\n2. Вычисление плотности населения...")
     countries = calculate_population_density(countries)
     
-    print("\n3. Сохранение данных в файл results.json...")
-    save_to_json(countries)
-    print("\n4. Поиск топ-5 стран по плотности населения...")
-    top_countries = print_top_5_by_density(countries)
-    print("\n5. Загрузка флагов...")
-    download_flags(top_countries)
-    
-    print("\n" + "="*60)
-    print("ВСЕ ОПЕРАЦИИ УСПЕШНО ВЫПОЛНЕНЫ!")
-    print("="*60)
-    print("\nСозданные файлы:")
-    print("1. results.json - полные данные о странах")
-    print("2. country_flags/ - папка с PNG флагами стран")
-    print("="*60)
+    log(f"\n3. Сохранение данных в файл {args.output}...")
+    save_to_json(countries, args.output)
+    log("\n4. Поиск топ-5 стран по плотности населения...")
+    if asia_only:
+        top_countries = print_top_5_by_density(countries)
+    else:
+        top_countries = print_top_5_by_density(
+            countries, "ТОП-5 СТРАН ПО ПЛОТНОСТИ НАСЕЛЕНИЯ",
+            f"(регионы: {', '.join(regions)}; население более {args.min_population:,} человек)")
+    if args.report:
+        print_ranking_report(CountryRanking(countries, k=args.top), args.top)
+    log("\n5. Загрузка флагов...")
+    download_flags(top_countries, args.flags_dir, session=session, max_workers=args.workers,
+                   base_url=args.flags_url, timeout=args.timeout, retries=args.retries, cache=cache,
+                   thumb_sizes=args.thumb_sizes, link_names=args.link_flags)
+    
+    log("\n" + "="*60)
+    log("ВСЕ ОПЕРАЦИИ УСПЕШНО ВЫПОЛНЕНЫ!")
+    log("="*60)
+    log("\nСозданные файлы:")
+    log(f"1. {args.output} - полные данные о странах")
+    log(f"2. {args.flags_dir}/ - папка с PNG флагами стран")
+    log("="*60)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
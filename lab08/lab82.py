@@ -1,8 +1,29 @@
-import requests
-from bs4 import BeautifulSoup
+from __future__ import annotations
+
+import argparse
+import codecs
+import json
+import os
+import sys
+import threading
 import csv
 import time
-from typing import List, Dict
+from html.parser import HTMLParser
+from itertools import product
+from typing import Dict, Iterable, List
+from urllib.parse import urlsplit
+
+import instrument
+from instrument import log, span, traced
+from lazy import LazyModule
+
+# чтение и запись сжатых файлов - общий модуль из папки lab07
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'lab07'))
+from compressed import compression_from_name, detect_compression, open_input, open_output
+
+# загружаются при первом сетевом запросе или разборе через bs4
+requests = LazyModule('requests')
+bs4 = LazyModule('bs4')
 
 DISCIPLINES = {
     '60-metres': '60m',
@@ -12,108 +33,649 @@ DISCIPLINES = {
 }
 GENDERS = ['men', 'women']
 YEARS = range(2024, 2025)  
+BASE_URL = "https://worldathletics.org/records/toplists/sprints"
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+class TokenBucket:
+    """Ограничитель частоты: в среднем rate запросов в секунду, не более capacity подряд"""
+
+    def __init__(self, rate: float, capacity: float = 1):
+        # при rate <= 0 или capacity < 1 acquire() никогда не дождался бы токена
+        if rate <= 0:
+            raise ValueError(f"частота запросов должна быть положительной: {rate}")
+        if capacity < 1:
+            raise ValueError(f"допустимое число запросов подряд должно быть не меньше 1: {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Дождаться свободного токена"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class HostRateLimiter:
+    """Отдельный TokenBucket для каждого хоста"""
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, url: str):
+        host = urlsplit(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(self.rate, self.capacity)
+        bucket.acquire()
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """Сессия с пулом keep-alive соединений"""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def construct_url(discipline: str, gender: str, year: int, base_url: str = BASE_URL,
+                  page: int = 1) -> str:
+    """Формирует URL страницы с топ-листами (page > 1 - следующие страницы списка)."""
+    url = f"{base_url}/{discipline}/all/{gender}/senior/{year}"
+    return url if page <= 1 else f"{url}?page={page}"
+
+def fetch_page(url: str, session: requests.Session = None, rate_limiter: HostRateLimiter = None,
+               timeout: float = 10) -> bytes:
+    """Загружает страницу (с учетом ограничения частоты запросов к хосту)."""
+    if rate_limiter is not None:
+        with span('rate_limit.wait'):
+            rate_limiter.acquire(url)
+    with span('http.get', url=url) as current:
+        if session is None:
+            response = requests.get(url, headers=HEADERS, timeout=timeout)
+        else:
+            response = session.get(url, timeout=timeout)
+        # elapsed - время до получения заголовков, остаток интервала - передача тела
+        current.set(status=response.status_code, headers_s=response.elapsed.total_seconds())
+        current.add('bytes', len(response.content))
+    response.raise_for_status()
+    return response.content
+
+def _column_index(headers: List[str], name: str, default: int) -> int:
+    """Индекс колонки по заголовку таблицы (без учета регистра) или default."""
+    name = name.lower()
+    for i, header in enumerate(headers):
+        if header.lower() == name:
+            return i
+    return default
+
+def _build_result(cells: List[str], competitor_span: str, headers: List[str],
+                  discipline: str, gender: str, year: int) -> Dict:
+    """Собирает словарь результата из текстов ячеек строки таблицы."""
+    mark = cells[_column_index(headers, 'Mark', 1)]
+    competitor_name = cells[_column_index(headers, 'Competitor', 3)]
+    country_code = competitor_span
+    if country_code:
+        competitor_name = competitor_name.replace(country_code, '').strip()
+    else:
+        nat = _column_index(headers, 'Nat', -1)
+        country_code = cells[nat] if 0 <= nat < len(cells) else ""
+
+    # последняя колонка таблицы - Results Score, поэтому место и дата идут перед ней
+    venue = cells[_column_index(headers, 'Venue', len(cells) - 3)]
+    date = cells[_column_index(headers, 'Date', len(cells) - 2)]
+
+    return {
+        'year': year,
+        'discipline': DISCIPLINES[discipline],
+        'gender': 'Men' if gender == 'men' else 'Women',
+        'athlete': competitor_name,
+        'country': country_code,
+        'result': mark,
+        'venue': venue,
+        'date': date,
+        'rank': cells[_column_index(headers, 'Rank', 0)]
+    }
+
+def extract_rows_bs4(content: bytes, discipline: str, gender: str, year: int,
+                     limit: int = None, rank_one: bool = False) -> List[Dict]:
+    """
+    Извлечение строк первой таблицы через полное дерево BeautifulSoup
+    (запасной вариант). limit - максимум строк, rank_one - только строка с рангом 1
+    """
+    soup = bs4.BeautifulSoup(content, 'html.parser')
+    table = soup.find('table')
+    if not table:
+        return []
+
+    headers = [th.get_text(strip=True) for th in table.find_all('th')]
+    competitor_index = _column_index(headers, 'Competitor', 3)
+    results = []
+    rows = table.find_all('tr')
+    for row in rows:
+        cells = row.find_all('td')
+        if len(cells) >= 8:
+            if rank_one and cells[0].get_text(strip=True) != '1':
+                continue
+            country_span = cells[competitor_index].find('span')
+            results.append(_build_result([cell.get_text(strip=True) for cell in cells],
+                                         country_span.get_text(strip=True) if country_span else "",
+                                         headers, discipline, gender, year))
+            if rank_one or (limit and len(results) >= limit):
+                break
+    return results
+
+def extract_top_bs4(content: bytes, discipline: str, gender: str, year: int) -> Dict:
+    """Строка с рангом 1 через BeautifulSoup."""
+    rows = extract_rows_bs4(content, discipline, gender, year, rank_one=True)
+    return rows[0] if rows else None
+
+class _StopParsing(Exception):
+    pass
+
+class _RowsParser(HTMLParser):
+    """
+    Потоковый разбор HTML без построения дерева: учитывается только первая
+    таблица, разбор останавливается после limit строк (или строки с рангом 1
+    при rank_one) либо в конце таблицы
+    """
+
+    def __init__(self, limit: int = None, rank_one: bool = False):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.rank_one = rank_one
+        self.headers = []
+        self.rows = []
+        self._table_depth = 0
+        self._table_done = False
+        self._row = None
+        self._cell = None
+        self._cell_is_header = False
+        self._span = None
+        self._spans = []
+        self._text = []
+
+    def _flush_text(self):
+        # текст узла может прийти несколькими частями, поэтому обрезаем пробелы
+        # только на границах тегов (как get_text(strip=True) в BeautifulSoup)
+        if not self._text:
+            return
+        text = ''.join(self._text).strip()
+        self._text = []
+        if self._cell is not None:
+            self._cell.append(text)
+            if self._span is not None:
+                self._span.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        if self._table_done:
+            return
+        self._flush_text()
+        if tag == 'table':
+            self._table_depth += 1
+        elif self._table_depth != 1:
+            return
+        elif tag == 'tr':
+            self._end_row()
+            self._row = []
+        elif tag in ('td', 'th'):
+            self._end_cell()
+            if self._row is None:
+                self._row = []
+            self._cell = []
+            self._cell_is_header = tag == 'th'
+            self._spans = []
+        elif tag == 'span' and self._cell is not None and self._span is None:
+            self._span = []
+
+    def handle_endtag(self, tag):
+        if self._table_done or not self._table_depth:
+            return
+        self._flush_text()
+        if tag == 'table':
+            self._table_depth -= 1
+            if not self._table_depth:
+                self._end_row()
+                self._table_done = True
+                raise _StopParsing
+        elif self._table_depth != 1:
+            return
+        elif tag == 'span' and self._span is not None:
+            self._spans.append(''.join(self._span))
+            self._span = None
+        elif tag in ('td', 'th'):
+            self._end_cell()
+        elif tag == 'tr':
+            self._end_row()
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._text.append(data)
+
+    def _end_cell(self):
+        if self._cell is None:
+            return
+        if self._span is not None:
+            self._spans.append(''.join(self._span))
+            self._span = None
+        self._row.append((''.join(self._cell), self._cell_is_header, self._spans))
+        self._cell = None
+
+    def _end_row(self):
+        self._end_cell()
+        row, self._row = self._row, None
+        if not row:
+            return
+        if all(is_header for _, is_header, _ in row):
+            self.headers.extend(text for text, _, _ in row)
+            return
+        cells = [(text, spans) for text, is_header, spans in row if not is_header]
+        if len(cells) < 8 or (self.rank_one and cells[0][0] != '1'):
+            return
+        self.rows.append(cells)
+        if self.rank_one or (self.limit and len(self.rows) >= self.limit):
+            raise _StopParsing
+
+def extract_rows_fast(content, discipline: str, gender: str, year: int, limit: int = None,
+                      rank_one: bool = False, chunk_size: int = 16 * 1024) -> List[Dict]:
+    """
+    Быстрое извлечение строк первой таблицы: HTML подается парсеру частями,
+    разбор прекращается сразу после нужных строк или конца таблицы.
+    content - байты страницы или итератор частей в байтах
+    """
+    if isinstance(content, (bytes, bytearray)):
+        view = memoryview(content)
+        chunks = (view[i:i + chunk_size] for i in range(0, len(view), chunk_size))
+    else:
+        chunks = content
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    parser = _RowsParser(limit, rank_one)
+    try:
+        for chunk in chunks:
+            parser.feed(decoder.decode(chunk))
+        parser.feed(decoder.decode(b'', final=True))
+        parser.close()
+    except _StopParsing:
+        pass
+
+    competitor_index = _column_index(parser.headers, 'Competitor', 3)
+    results = []
+    for cells in parser.rows:
+        spans = cells[min(competitor_index, len(cells) - 1)][1]
+        results.append(_build_result([text for text, _ in cells], spans[0] if spans else "",
+                                     parser.headers, discipline, gender, year))
+    return results
 
-def construct_url(discipline: str, gender: str, year: int) -> str:
-    """Формирует URL страницы с топ-листами."""
-    base_url = "https://worldathletics.org/records/toplists/sprints"
-    return f"{base_url}/{discipline}/all/{gender}/senior/{year}"
+def extract_top_fast(content, discipline: str, gender: str, year: int,
+                     chunk_size: int = 16 * 1024) -> Dict:
+    """Строка с рангом 1 потоковым разбором."""
+    rows = extract_rows_fast(content, discipline, gender, year, rank_one=True, chunk_size=chunk_size)
+    return rows[0] if rows else None
 
-def scrape_top_result(url: str, discipline: str, gender: str, year: int) -> Dict:
+EXTRACTORS = {
+    'fast': extract_top_fast,
+    'bs4': extract_top_bs4,
+}
+ROW_EXTRACTORS = {
+    'fast': extract_rows_fast,
+    'bs4': extract_rows_bs4,
+}
+
+def parse_top_result(content: bytes, discipline: str, gender: str, year: int,
+                     parser: str = 'fast') -> Dict:
+    """Извлекает лучший результат (1-е место) из HTML страницы; None, если его нет."""
+    with span('html.parse', parser=parser) as current:
+        result = EXTRACTORS[parser](content, discipline, gender, year)
+        current.add('bytes', len(content))
+        current.add('rows', 1 if result else 0)
+    return result
+
+@traced(rows=lambda result: 1)
+def scrape_top_result(url: str, discipline: str, gender: str, year: int,
+                      session: requests.Session = None, rate_limiter: HostRateLimiter = None,
+                      parser: str = 'fast') -> Dict:
     """Извлекает данные о лучшем результате (1-е место) с заданной страницы."""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        print(f"Загрузка: {url}")
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table')
-
-        if not table:
-            print(f"  Таблица с результатами не найдена.")
+        log(f"Загрузка: {url}")
+        content = fetch_page(url, session, rate_limiter)
+        result = parse_top_result(content, discipline, gender, year, parser)
+
+        if not result:
+            log(f"  Результат с 1-м местом не найден на странице.")
             return None
 
-        rows = table.find_all('tr')
-        for row in rows:
-            cells = row.find_all('td')
-            if len(cells) >= 8:
-                rank = cells[0].get_text(strip=True)
-                if rank == '1':
-                    mark = cells[1].get_text(strip=True)
-                    competitor_cell = cells[3]   
-                    competitor_name = competitor_cell.get_text(strip=True)
-                    country_code = ""
-                    country_span = competitor_cell.find('span')
-                    if country_span:
-                        country_code = country_span.get_text(strip=True)
-                        competitor_name = competitor_name.replace(country_code, '').strip()
-
-                    venue = cells[-2].get_text(strip=True)        
-                    date = cells[-1].get_text(strip=True)         
-
-                    result = {
-                        'year': year,
-                        'discipline': DISCIPLINES[discipline],
-                        'gender': 'Men' if gender == 'men' else 'Women',
-                        'athlete': competitor_name,
-                        'country': country_code,
-                        'result': mark,
-                        'venue': venue,
-                        'date': date
-                    }
-                    print(f"  Найден: {result['athlete']} - {result['result']}")
-                    return result
-
-        print(f"  Результат с 1-м местом не найден в таблице.")
-        return None
+        log(f"  Найден: {result['athlete']} - {result['result']}")
+        return result
 
     except requests.exceptions.RequestException as e:
-        print(f"  Ошибка загрузки страницы: {e}")
+        log(f"  Ошибка загрузки страницы: {e}")
         return None
     except Exception as e:
-        print(f"  Неожиданная ошибка: {e}")
+        log(f"  Неожиданная ошибка: {e}")
         return None
 
-def scrape_all_data() -> List[Dict]:
-    """Основная функция для сбора данных по всем заданным параметрам."""
-    all_results = []
-    total = len(DISCIPLINES) * len(GENDERS) * len(YEARS)
-    current = 0
-    print(f"Начинаем скрейпинг {total} страниц...\n")
+@traced(rows=len)
+def scrape_rows(discipline: str, gender: str, year: int, session: requests.Session = None,
+                rate_limiter: HostRateLimiter = None, base_url: str = BASE_URL, parser: str = 'fast',
+                top_n: int = 1, max_pages: int = 1) -> List[Dict]:
+    """
+    Строки топ-листа для одного набора параметров: при top_n=1 - только строка
+    с рангом 1, иначе первые top_n строк (0 - все) с переходом по страницам
+    списка, пока они не закончатся или не будет достигнуто max_pages
+    """
+    if top_n == 1:
+        content = fetch_page(construct_url(discipline, gender, year, base_url), session, rate_limiter)
+        result = parse_top_result(content, discipline, gender, year, parser)
+        return [result] if result else []
+
+    results = []
+    for page in range(1, max_pages + 1):
+        content = fetch_page(construct_url(discipline, gender, year, base_url, page), session, rate_limiter)
+        limit = top_n - len(results) if top_n else None
+        with span('html.parse', parser=parser, page=page) as current:
+            rows = ROW_EXTRACTORS[parser](content, discipline, gender, year, limit=limit)
+            current.add('bytes', len(content))
+            current.add('rows', len(rows))
+        if not rows:
+            break
+        results.extend(rows)
+        if top_n and len(results) >= top_n:
+            break
+    return results
+
+def _task_key(discipline: str, gender: str, year: int) -> str:
+    return f"{discipline}/{gender}/{year}"
+
+def load_progress(progress_file: str) -> Dict:
+    """Читает журнал уже обработанных страниц: ключ задачи -> число сохраненных строк."""
+    done = {}
+    if not progress_file or not os.path.exists(progress_file):
+        return done
+    with open(progress_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # недописанная строка после аварийного завершения
+            done[entry['key']] = entry.get('rows', 0)
+    return done
+
+@traced()
+def scrape_all_data(years=YEARS, disciplines=DISCIPLINES, genders=GENDERS, max_workers: int = 4,
+                    rate: float = 1.0, burst: float = 1, base_url: str = BASE_URL,
+                    progress_file: str = None, resume: bool = False, parser: str = 'fast',
+                    top_n: int = 1, max_pages: int = 1, sink=None) -> List[Dict]:
+    """
+    Основная функция для сбора данных по всем заданным параметрам.
+    Страницы загружаются параллельно (не более max_workers одновременно) через
+    общую сессию, частота запросов к каждому хосту ограничена rate в секунду.
+
+    Если задан sink (например, CsvResultWriter), строки передаются в него по мере
+    получения и в памяти не накапливаются; иначе возвращается список строк.
+    Строки передаются в sink в порядке задач (дисциплина, пол, год), независимо
+    от порядка завершения запросов.
+    Каждая обработанная страница записывается в progress_file (после сброса sink
+    на диск), и при resume=True уже обработанные страницы повторно не загружаются.
+    Если все страницы обработаны, журнал удаляется
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    tasks = list(product(disciplines, genders, years))
+    total = len(tasks)
+    done = load_progress(progress_file) if resume else {}
+    if progress_file and not resume and os.path.exists(progress_file):
+        os.remove(progress_file)
+
+    pending = [task for task in tasks if _task_key(*task) not in done]
+    log(f"Начинаем скрейпинг {total} страниц...")
+    if done:
+        log(f"Уже обработано ранее: {total - len(pending)}")
+    log()
+
+    session = create_session(max_workers)
+    rate_limiter = HostRateLimiter(rate, burst)
+    progress = open(progress_file, 'a', encoding='utf-8') if progress_file else None
+    current = total - len(pending)
+    collected = {}
+
+    def scrape(task):
+        discipline, gender, year = task
+        return scrape_rows(discipline, gender, year, session, rate_limiter, base_url,
+                           parser, top_n, max_pages)
+
+    # страницы загружаются в любом порядке, но строки и журнал пишутся в
+    # порядке задач: готовые страницы ждут, пока не будут готовы предыдущие
+    finished = {}
+    next_index = 0
+    failures = 0
+
+    def write_ready():
+        nonlocal next_index
+        while next_index in finished:
+            task, rows = finished.pop(next_index)
+            next_index += 1
+            if rows is None:
+                continue
+            if sink is not None:
+                with span('sink.write') as writing:
+                    for row in rows:
+                        sink.write(row)
+                    sink.flush()
+                    writing.add('rows', len(rows))
+            else:
+                collected[task] = rows
+            if progress:
+                progress.write(json.dumps({'key': _task_key(*task), 'rows': len(rows)}) + '\n')
+                progress.flush()
 
-    for discipline_key in DISCIPLINES.keys():
-        for gender in GENDERS:
-            for year in YEARS:
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(scrape, task): (index, task) for index, task in enumerate(pending)}
+            for future in as_completed(futures):
+                index, task = futures[future]
+                discipline, gender, year = task
                 current += 1
-                print(f"[{current}/{total}] {DISCIPLINES[discipline_key]} - {gender} - {year}:", end=' ')
+                label = f"[{current}/{total}] {disciplines[discipline]} - {gender} - {year}:"
+                rows = None
+                try:
+                    rows = future.result()
+                except requests.exceptions.RequestException as e:
+                    log(f"{label} Ошибка загрузки страницы: {e}")
+                except Exception as e:
+                    log(f"{label} Неожиданная ошибка: {e}")
+
+                if rows is None:
+                    failures += 1
+                elif not rows:
+                    log(f"{label} Результаты не найдены на странице.")
+                elif top_n == 1:
+                    log(f"{label} Найден: {rows[0]['athlete']} - {rows[0]['result']}")
+                else:
+                    log(f"{label} Получено строк: {len(rows)}")
+                finished[index] = (task, rows)
+                write_ready()
+    finally:
+        if progress:
+            progress.close()
+
+    if progress_file and os.path.exists(progress_file):
+        if failures:
+            log(f"\nНе загружено страниц: {failures}; повторите запуск с --resume")
+        else:
+            # все страницы сохранены, журнал больше не нужен
+            os.remove(progress_file)
+
+    return [row for task in tasks for row in collected.get(task, [])]
+
+def is_compressed_output(filename: str) -> bool:
+    """Будет ли итоговый файл сжат (по расширению .gz/.bz2/.xz)"""
+    return compression_from_name(filename) is not None
+
+FIELDNAMES = ['year', 'discipline', 'gender', 'athlete', 'country', 'result', 'venue', 'date', 'rank']
+
+class CsvResultWriter:
+    """
+    Потоковая запись результатов в CSV: строки пишутся по мере поступления,
+    буфер сбрасывается на диск каждые flush_every строк. В режиме append
+    строки дописываются в существующий файл (заголовок не повторяется).
+    Имя файла с расширением .gz/.bz2/.xz включает сжатие. Сжатый поток
+    попадает на диск целиком только при закрытии файла, поэтому flush()
+    не делает строки сохраненными, а дозапись в сжатый файл не
+    поддерживается (ValueError)
+    """
+
+    def __init__(self, filename: str, append: bool = False, flush_every: int = 100):
+        self.filename = filename
+        self.append = append
+        self.flush_every = flush_every
+        self.count = 0
+        self._file = None
+        self._writer = None
 
-                url = construct_url(discipline_key, gender, year)
-                result = scrape_top_result(url, discipline_key, gender, year)
+    def __enter__(self):
+        existing = self.append and os.path.exists(self.filename) and os.path.getsize(self.filename) > 0
+        if existing:
+            if is_compressed_output(self.filename) or detect_compression(self.filename):
+                raise ValueError(f"Дозапись в сжатый файл {self.filename} не поддерживается")
+            with open_input(self.filename, encoding='utf-8-sig', newline='') as f:
+                header = next(csv.reader(f), [])
+            if header != FIELDNAMES:
+                raise ValueError(f"Заголовок файла {self.filename} не совпадает с {FIELDNAMES}")
+            self._file = open_output(self.filename, 'a', encoding='utf-8', newline='', compression=None)
+        else:
+            self._file = open_output(self.filename, 'w', encoding='utf-8-sig', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=FIELDNAMES)
+        if not existing:
+            self._writer.writeheader()
+        return self
 
-                if result:
-                    all_results.append(result)
+    def write(self, result: Dict):
+        self._writer.writerow(result)
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.flush()
 
-                #time.sleep(1)
+    def flush(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
 
-    return all_results
+    def __exit__(self, exc_type, exc, traceback):
+        self._file.close()
+        return False
 
-def save_to_csv(results: List[Dict], filename: str = 'top_results.csv'):
-    """Сохраняет собранные данные в CSV файл."""
-    if not results:
-        print("\nНет данных для сохранения!")
+def save_to_csv(results: Iterable[Dict], filename: str = 'top_results.csv', append: bool = False):
+    """
+    Сохраняет собранные данные в CSV файл (результаты могут поступать итератором).
+    Для имени вида top_results.csv.gz файл сжимается.
+    """
+    results = iter(results)
+    first = next(results, None)
+    if first is None:
+        log("\nНет данных для сохранения!")
         return
 
-    fieldnames = ['year', 'discipline', 'gender', 'athlete', 'country', 'result', 'venue', 'date']
-    with open(filename, 'w', newline='', encoding='utf-8-sig') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
+    with span('save_to_csv', filename=filename) as current:
+        with CsvResultWriter(filename, append) as writer:
+            writer.write(first)
+            for result in results:
+                writer.write(result)
+        current.add('rows', writer.count)
 
-    print(f"\nДанные успешно сохранены в файл: {filename}")
-    print(f"Всего записей: {len(results)}")
+    log(f"\nДанные успешно сохранены в файл: {filename}")
+    log(f"Всего записей: {writer.count}")
+
+def parse_rate(text: str) -> float:
+    try:
+        rate = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"некорректное число: {text!r}")
+    if not rate > 0:
+        raise argparse.ArgumentTypeError("частота запросов должна быть положительной")
+    return rate
+
+def parse_burst(text: str) -> float:
+    try:
+        burst = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"некорректное число: {text!r}")
+    if not burst >= 1:
+        raise argparse.ArgumentTypeError("допускается не меньше 1 запроса подряд")
+    return burst
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Скрейпинг топ-листов World Athletics")
+    parser.add_argument('--from-year', type=int, default=YEARS.start, help="первый год")
+    parser.add_argument('--to-year', type=int, default=YEARS.stop - 1, help="последний год")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="максимальное число одновременных запросов")
+    parser.add_argument('--rate', type=parse_rate, default=1.0,
+                        help="запросов в секунду к одному хосту")
+    parser.add_argument('--burst', type=parse_burst, default=1,
+                        help="сколько запросов подряд допускается без ожидания")
+    parser.add_argument('--base-url', default=BASE_URL, help="базовый адрес топ-листов")
+    parser.add_argument('--progress', default=None,
+                        help="журнал обработанных страниц (по умолчанию рядом с -o: <output>.progress.jsonl)")
+    parser.add_argument('--resume', action='store_true',
+                        help="продолжить с места остановки по журналу")
+    parser.add_argument('--parser', choices=sorted(EXTRACTORS), default='fast',
+                        help="способ разбора HTML: fast (потоковый) или bs4 (BeautifulSoup)")
+    parser.add_argument('--top', type=int, default=1,
+                        help="сколько строк брать с каждой страницы (1 - только 1-е место, 0 - все)")
+    parser.add_argument('--max-pages', type=int, default=1,
+                        help="сколько страниц списка просматривать при --top больше 1")
+    parser.add_argument('-o', '--output', default='top_results.csv',
+                        help="итоговый CSV файл (.csv.gz, .csv.bz2, .csv.xz - со сжатием, "
+                             "без журнала и --resume)")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="записать трассировку этапов (.json - формат Chrome trace, иначе JSON lines)")
+    args = parser.parse_args(argv)
+    if is_compressed_output(args.output) and (args.resume or args.progress):
+        # строки сжатого файла сохраняются только при его закрытии: журнал
+        # отмечал бы страницы, которых после сбоя нет в файле
+        parser.error("--resume и --progress не поддерживаются для сжатого итогового файла")
+    return args
+
+def progress_path(output: str) -> str:
+    """Журнал обработанных страниц для итогового файла (лежит рядом с ним)"""
+    return output + '.progress.jsonl'
+
+def main(argv=None):
+    args = parse_args(argv)
+    progress_file = None
+    if not is_compressed_output(args.output):
+        progress_file = args.progress or progress_path(args.output)
+    if args.trace:
+        instrument.enable()
+    try:
+        with CsvResultWriter(args.output, append=args.resume) as writer:
+            scrape_all_data(range(args.from_year, args.to_year + 1), max_workers=args.workers,
+                            rate=args.rate, burst=args.burst, base_url=args.base_url,
+                            progress_file=progress_file, resume=args.resume, parser=args.parser,
+                            top_n=args.top, max_pages=args.max_pages, sink=writer)
+        log(f"\nДанные успешно сохранены в файл: {args.output}")
+        log(f"Записано строк: {writer.count}")
+    except ValueError as e:
+        # например, --resume для файла со старым набором колонок
+        log(f"Ошибка: {e}")
+        return 1
+    finally:
+        if args.trace:
+            instrument.write_trace(args.trace)
+            instrument.print_summary()
 
 if __name__ == "__main__":
-    scraped_data = scrape_all_data()
-    save_to_csv(scraped_data)
\ No newline at end of file
+    main()
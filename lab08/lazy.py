@@ -0,0 +1,25 @@
+"""
+Отложенный импорт тяжелых зависимостей (requests, bs4).
+Модуль загружается при первом обращении к его атрибуту, поэтому
+запуски без обращения к сети не тратят время на импорт
+"""
+import importlib
+
+class LazyModule:
+    """Заместитель модуля name: import выполняется при первом обращении к атрибуту"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = 'загружен' if self._module is not None else 'не загружен'
+        return f"<LazyModule {self._name} ({state})>"
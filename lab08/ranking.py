@@ -0,0 +1,171 @@
+"""
+Рейтинги стран lab81 по нескольким показателям (плотность, население,
+площадь) для каждого региона. Показатели вычисляются один раз за проход
+по данным; для каждой пары (регион, показатель) хранится куча лучших K
+стран и отсортированный индекс значений, по которому запросы с другим K
+или с порогом выполняются без полной сортировки
+"""
+import heapq
+import operator
+from bisect import bisect_left, bisect_right
+
+DEFAULT_K = 5
+
+def population_density(country):
+    """Плотность населения (чел/км²), округленная до 2 знаков; 0 при нулевой площади"""
+    area = country['area']
+    if area > 0:
+        return round(country['population'] / area, 2)
+    return 0
+
+METRICS = {
+    'density': population_density,
+    'population': operator.itemgetter('population'),
+    'area': operator.itemgetter('area'),
+}
+
+METRIC_TITLES = {
+    'density': ("плотности населения", "чел/км²"),
+    'population': ("населению", "чел"),
+    'area': ("площади", "км²"),
+}
+
+def top_k(countries, metric='density', k=DEFAULT_K):
+    """
+    K стран с наибольшим значением показателя за O(n log K); порядок как у
+    sorted(..., reverse=True)[:k] (при равенстве - в порядке появления)
+    """
+    value = METRICS[metric] if isinstance(metric, str) else metric
+    return heapq.nlargest(k, countries, key=value)
+
+class SortedIndex:
+    """Индексы стран по возрастанию значения показателя и сами значения"""
+    __slots__ = ('values', 'indexes')
+
+    def __init__(self, indexes, column):
+        # сортировка устойчивая, поэтому из обратного порядка при равных значениях
+        # более ранняя страна оказывается правее и при обходе с конца идет первой
+        self.indexes = sorted(reversed(indexes), key=column.__getitem__)
+        self.values = list(map(column.__getitem__, self.indexes))
+
+    def __len__(self):
+        return len(self.values)
+
+    def descending(self, start=0, stop=None):
+        """Индексы стран по убыванию значения среди позиций [start, stop)"""
+        stop = len(self.values) if stop is None else stop
+        return reversed(self.indexes[start:stop])
+
+    def span(self, low=None, high=None, inclusive=False):
+        """Позиции [start, stop) значений в промежутке от low до high"""
+        if low is None:
+            start = 0
+        else:
+            start = (bisect_left if inclusive else bisect_right)(self.values, low)
+        if high is None:
+            stop = len(self.values)
+        else:
+            stop = (bisect_right if inclusive else bisect_left)(self.values, high)
+        return start, max(start, stop)
+
+class CountryRanking:
+    """
+    Рейтинги по всем регионам (region=None - все страны вместе).
+    countries - записи lab81 (name, capital, area, population, region, ...);
+    плотность записывается в поле density, если его нет.
+    За один проход собираются столбцы значений показателей и состав
+    регионов, затем для каждой пары (регион, показатель) выбираются k
+    лучших стран кучей (heapq.nlargest). Отсортированный индекс пары
+    строится при первом запросе с порогом или с K больше k
+    """
+
+    def __init__(self, countries, metrics=tuple(METRICS), k=DEFAULT_K):
+        self.countries = list(countries)
+        self.metrics = tuple(metrics)
+        self.k = k
+        self.columns = {metric: [] for metric in self.metrics}
+        members = {}
+
+        functions = [(self.columns[metric], METRICS[metric]) for metric in self.metrics
+                     if metric != 'density']
+        density = self.columns.get('density')
+        for index, country in enumerate(self.countries):
+            if 'density' not in country:
+                country['density'] = population_density(country)
+            if density is not None:
+                density.append(country['density'])
+            for column, function in functions:
+                column.append(function(country))
+            region = country.get('region', 'Unknown')
+            indexes = members.get(region)
+            if indexes is None:
+                indexes = members[region] = []
+            indexes.append(index)
+
+        self.regions = list(members)
+        members[None] = range(len(self.countries))
+        self._members = members
+        self._top = {}
+        self._indexes = {}
+        for region, indexes in members.items():
+            for metric in self.metrics:
+                column = self.columns[metric]
+                self._top[(region, metric)] = heapq.nlargest(k, indexes, key=column.__getitem__)
+
+    def _index(self, metric, region):
+        if metric not in self.metrics:
+            raise ValueError(f"неизвестный показатель: {metric}")
+        index = self._indexes.get((region, metric))
+        if index is None:
+            index = self._indexes[(region, metric)] = SortedIndex(
+                self._members.get(region, ()), self.columns[metric])
+        return index
+
+    def _select(self, indexes):
+        return [self.countries[index] for index in indexes]
+
+    def top(self, metric='density', k=None, region=None, min_population=None):
+        """
+        K стран с наибольшим значением показателя в регионе (None - все регионы),
+        при необходимости только с населением больше min_population
+        """
+        k = self.k if k is None else k
+        if min_population is None and k <= self.k:
+            top = self._top.get((region, metric))
+            if top is not None:
+                return self._select(top[:k])
+
+        index = self._index(metric, region)
+        if min_population is None:
+            return self._select(list(index.descending(max(0, len(index) - k))))
+        result = []
+        for position in index.descending():
+            country = self.countries[position]
+            if country['population'] > min_population:
+                result.append(country)
+                if len(result) == k:
+                    break
+        return result
+
+    def above(self, metric, threshold, region=None, inclusive=False):
+        """Страны со значением показателя больше порога (>= при inclusive), по убыванию"""
+        index = self._index(metric, region)
+        start, stop = index.span(low=threshold, inclusive=inclusive)
+        return self._select(index.descending(start, stop))
+
+    def between(self, metric, low, high, region=None):
+        """Страны со значением показателя в промежутке [low, high], по убыванию"""
+        index = self._index(metric, region)
+        start, stop = index.span(low, high, inclusive=True)
+        return self._select(index.descending(start, stop))
+
+    def count_above(self, metric, threshold, region=None):
+        index = self._index(metric, region)
+        start, stop = index.span(low=threshold)
+        return stop - start
+
+    def report(self, k=None, regions=None):
+        """{регион: {показатель: список K лучших стран}} для всех регионов"""
+        regions = self.regions if regions is None else regions
+        return {region: {metric: self.top(metric, k, region) for metric in self.metrics}
+                for region in regions}
@@ -0,0 +1,137 @@
+"""
+Единая команда для лабораторных работ 7 и 8:
+
+    sl-labs [-C ПАПКА] <команда> [аргументы команды]
+
+Модуль лабораторной импортируется только для выбранной команды, а
+тяжелые зависимости (requests, bs4, Pillow, multiprocessing, asyncio)
+загружаются самими лабораторными при первом использовании.
+Команда selfcheck проверяет время импорта каждой лабораторной
+через python -X importtime и отсутствие тяжелых модулей при старте
+"""
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+COMMANDS = {
+    'lab71': ('lab07', 'lab71', "температуры городов: отчет, бинарный формат, скользящая статистика"),
+    'lab72': ('lab07', 'lab72', "перевод текста файла в нижний регистр"),
+    'lab73': ('lab07', 'lab73', "анализ проектов из CSV файла"),
+    'lab74': ('lab07', 'lab74', "анализ переводчиков из JSON файла"),
+    'lab74-service': ('lab07', 'lab74_service', "сервис запросов к переводчикам и клиент"),
+    'lab81': ('lab08', 'lab81', "страны RestCountries: плотность, рейтинги, флаги"),
+    'lab82': ('lab08', 'lab82', "результаты топ-листов World Athletics"),
+}
+
+# модули, которые не должны загружаться при импорте лабораторной
+HEAVY_MODULES = ('requests', 'urllib3', 'bs4', 'PIL', 'multiprocessing', 'asyncio')
+DEFAULT_BUDGET_MS = 50
+
+def lab_directory(package):
+    """Папка лабораторной (lab07, lab08) рядом с этим модулем"""
+    return os.path.join(ROOT, package)
+
+def load_command(command):
+    """Импорт модуля лабораторной для команды"""
+    package, module, _ = COMMANDS[command]
+    directory = lab_directory(package)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    return importlib.import_module(module)
+
+def run_command(command, argv):
+    # в справке и сообщениях argparse лабораторной - имя подкоманды
+    sys.argv[0] = f"sl-labs {command}"
+    return load_command(command).main(argv)
+
+def import_profile(command, python=sys.executable):
+    """
+    Импорт модуля команды в отдельном интерпретаторе с -X importtime.
+    Возвращает (время импорта модуля в мкс, множество загруженных модулей)
+    """
+    package, module, _ = COMMANDS[command]
+    code = (f"import sys; sys.path.insert(0, {lab_directory(package)!r}); import {module}; "
+            "print(*sys.modules, sep='\\n')")
+    # запись .pyc разрешена, иначе в измерение попадает компиляция исходников
+    env = {key: value for key, value in os.environ.items() if key != 'PYTHONDONTWRITEBYTECODE'}
+    result = subprocess.run([python, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True, env=env)
+    total = None
+    for line in result.stderr.splitlines():
+        fields = line[len('import time:'):].split('|')
+        if line.startswith('import time:') and len(fields) == 3 and fields[2].strip() == module:
+            total = int(fields[1])
+    # -X importtime показывает и неудачные попытки импорта, поэтому список
+    # загруженных модулей берется из sys.modules
+    return total, set(result.stdout.split())
+
+def selfcheck(commands=None, budget_ms=DEFAULT_BUDGET_MS, repeat=3):
+    """
+    Проверка времени старта: для каждой команды лучшее из repeat измерений
+    времени импорта не больше budget_ms и ни одного модуля из HEAVY_MODULES.
+    Первый импорт (с записью .pyc) не учитывается.
+    Возвращает True, если все команды укладываются в бюджет
+    """
+    ok = True
+    print(f"{'команда':<16} {'импорт, мс':>10}  результат")
+    for command in commands or COMMANDS:
+        import_profile(command)
+        best = None
+        heavy = set()
+        for _ in range(repeat):
+            total, loaded = import_profile(command)
+            best = total if best is None else min(best, total)
+            heavy |= {name for name in loaded if name.split('.')[0] in HEAVY_MODULES}
+        problems = []
+        if best / 1000 > budget_ms:
+            problems.append(f"больше бюджета {budget_ms} мс")
+        if heavy:
+            roots = sorted({name.split('.')[0] for name in heavy})
+            problems.append(f"загружены при старте: {', '.join(roots)}")
+        ok = ok and not problems
+        print(f"{command:<16} {best / 1000:>10.1f}  {'; '.join(problems) or 'OK'}")
+    return ok
+
+def parse_selfcheck_args(argv):
+    parser = argparse.ArgumentParser(prog='sl-labs selfcheck',
+                                     description="Проверка времени старта команд (python -X importtime)")
+    parser.add_argument('commands', nargs='*', metavar='команда',
+                        help="команды для проверки (по умолчанию все)")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"допустимое время импорта в мс (по умолчанию {DEFAULT_BUDGET_MS})")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="число измерений, берется лучшее (по умолчанию 3)")
+    args = parser.parse_args(argv)
+    unknown = [command for command in args.commands if command not in COMMANDS]
+    if unknown:
+        parser.error(f"неизвестные команды: {', '.join(unknown)}")
+    return args
+
+def parse_args(argv=None):
+    commands = '\n'.join(f"  {name:<15} {description}" for name, (_, _, description) in COMMANDS.items())
+    parser = argparse.ArgumentParser(
+        prog='sl-labs', description="Лабораторные работы 7 и 8",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"команды:\n{commands}\n  {'selfcheck':<15} проверка времени старта команд\n\n"
+               "Аргументы команды: sl-labs <команда> --help")
+    parser.add_argument('-C', '--directory', metavar='ПАПКА',
+                        help="перейти в папку перед запуском (пути к файлам по умолчанию считаются от нее)")
+    parser.add_argument('command', choices=list(COMMANDS) + ['selfcheck'], metavar='команда')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.directory:
+        os.chdir(args.directory)
+    if args.command == 'selfcheck':
+        options = parse_selfcheck_args(args.args)
+        return 0 if selfcheck(options.commands, options.budget, options.repeat) else 1
+    return run_command(args.command, args.args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+Общие настройки тестов: модули лабораторных импортируют друг друга
+напрямую, поэтому папки lab07 и lab08 добавляются в sys.path.
+Фикстура http_server - локальный HTTP сервер вместо restcountries,
+flagcdn и World Athletics
+"""
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for lab in ('lab07', 'lab08'):
+    path = os.path.join(ROOT, lab)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+class LocalServer:
+    """
+    Ответы по пути запроса (вместе со строкой запроса): routes[path] -
+    (статус, заголовки, тело); requests - список (путь, заголовки) запросов
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                status, headers, body = server.routes.get(self.path, (404, {}, b'not found'))
+                if callable(body):
+                    status, headers, body = body(self.headers)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def paths(self):
+        return [path for path, _ in self.requests]
+
+@pytest.fixture
+def http_server():
+    server = LocalServer()
+    thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
@@ -0,0 +1,21 @@
+"""lab71: бинарный файл температур и команды --city/--add"""
+import lab71
+
+def test_city_without_data_file(tmp_path, capsys):
+    lab71.main(['--data', str(tmp_path / 'missing.tmat'), '--city', 'Москва'])
+    assert 'не найден' in capsys.readouterr().out
+
+def test_add_first_reading_has_no_change(tmp_path, capsys):
+    data = str(tmp_path / 'data.tmat')
+    lab71.main(['--data', data, '--add', 'Казань', '2020', '5.5'])
+    out = capsys.readouterr().out
+    assert 'Казань: лет 1' in out and 'nan' not in out and 'изменение' not in out
+    lab71.main(['--data', data, '--add', 'Казань', '2021', '7'])
+    assert 'изменение за 2021 год: +1.5°C' in capsys.readouterr().out
+
+def test_generated_temperatures_round_trip(tmp_path):
+    data = lab71.generate_temperatures(3, 4, seed=1)
+    path = str(tmp_path / 'data.tmat')
+    lab71.save_temperatures(lab71.TemperatureMatrix.from_dict(data), path)
+    with lab71.TemperatureFile(path) as loaded:
+        assert loaded.to_matrix().to_dict() == data
@@ -0,0 +1,19 @@
+"""lab72: перевод в нижний регистр, пакетный режим"""
+import lab72
+
+def test_batch_keeps_files_with_same_name(tmp_path, capsys):
+    for directory, text in (('b1', 'ONE\n'), ('b2', 'TWO\n')):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / 'a.txt').write_text(text, encoding='utf-8')
+    out = tmp_path / 'out'
+
+    lab72.main(['--batch', str(tmp_path / 'b1'), str(tmp_path / 'b2'), '--output-dir', str(out),
+                '--workers', '1'])
+
+    assert (out / 'b1' / 'a.txt').read_text(encoding='utf-8') == 'one\n'
+    assert (out / 'b2' / 'a.txt').read_text(encoding='utf-8') == 'two\n'
+    assert "Обработано файлов: 2" in capsys.readouterr().out
+
+def test_batch_outputs_deduplicates_inputs(tmp_path):
+    path = str(tmp_path / 'a.txt')
+    assert lab72.batch_outputs([path, path], 'out') == [(path, 'out/a.txt')]
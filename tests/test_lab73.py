@@ -0,0 +1,42 @@
+"""lab73: колонки и бинарный снимок"""
+import os
+import stat
+
+import compressed
+import lab73
+
+CSV = """ProjectName;Manager;TeamSize;Budget;Duration;Completed
+CRM;Ivanov;12;5000000;12 months;Yes
+Site;Petrova;4;N/A;2 years;No
+App;Sidorov;7;300000;6 months;Yes
+"""
+
+def write_csv(tmp_path, text=CSV):
+    path = tmp_path / 'projects.csv'
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+def test_snapshot_round_trip(tmp_path):
+    filename = write_csv(tmp_path)
+    expected = lab73.aggregate_columns(lab73.load_columns(filename))
+    built = lab73.load_columns_cached(filename)
+    cached = lab73.load_columns_cached(filename)
+    assert lab73.aggregate_columns(built) == lab73.aggregate_columns(cached) == expected
+    assert cached.row(1)['Budget'] == 'N/A'
+
+def test_snapshot_has_default_permissions(tmp_path):
+    filename = write_csv(tmp_path)
+    lab73.load_columns_cached(filename)
+    mode = stat.S_IMODE(os.stat(lab73.snapshot_path(filename)).st_mode)
+    assert mode == 0o666 & ~compressed.UMASK
+    assert sorted(os.listdir(tmp_path)) == sorted(['projects.csv', os.path.basename(lab73.snapshot_path(filename))])
+
+def test_team_size_beyond_int64(tmp_path):
+    huge = 2 ** 70
+    filename = write_csv(tmp_path, CSV + f"Big;Orlov;{huge};1;1 month;No\n")
+    expected = lab73.calculate_total_team_size(lab73.read_csv_file(filename))
+    assert expected == 23 + huge
+    assert lab73.columnar_total_team_size(lab73.load_columns(filename)) == expected
+    lab73.load_columns_cached(filename)
+    assert lab73.columnar_total_team_size(lab73.load_columns_cached(filename)) == expected
+    assert lab73.aggregate_stream(lab73.iter_csv_rows(filename))['total_team_size'] == expected
@@ -0,0 +1,44 @@
+"""lab74: хранилище переводчиков и потоковый разбор"""
+import json
+
+import lab74
+
+DATA = {"translators": [
+    {"translator_id": 1, "name": "A", "language": "English", "specialization": "legal",
+     "rate": 10, "experience_years": 2},
+    {"translator_id": 1, "name": "B", "language": "english", "specialization": "Legal",
+     "rate": 30, "experience_years": 8},
+    {"translator_id": 2, "name": "C", "language": "German", "specialization": "medical",
+     "rate": 20, "experience_years": 6},
+]}
+
+def test_store_matches_list_functions():
+    store = lab74.TranslatorStore.from_data(DATA)
+    assert len(store) == 3
+    assert store.avg_rates() == lab74.calculate_avg_rate_by_specialization(DATA)
+    assert store.avg_experiences() == lab74.calculate_avg_experience_by_language(DATA)
+    assert store.count_by_language('ENGLISH') == len(lab74.find_translators_by_language(DATA, 'english'))
+
+def test_averages_ignore_case():
+    store = lab74.TranslatorStore.from_data(DATA)
+    assert store.avg_rate('LEGAL') == store.avg_rate('legal') == 20.0
+    assert store.avg_experience('english') == 5.0
+    assert store.avg_rate('unknown') is None
+
+def test_replace_and_delete_keep_averages():
+    store = lab74.TranslatorStore.from_data(DATA)
+    key = store.insert(dict(DATA["translators"][2], rate=40), replace=True)
+    assert key == 2 and len(store) == 3
+    assert store.avg_rate('Medical') == 40.0
+    store.delete(2)
+    assert store.avg_rate('medical') is None
+    assert store.find_by_specialization('medical') == []
+
+def test_iter_translators_streams_file(tmp_path):
+    path = tmp_path / 'data.json'
+    path.write_text(json.dumps(DATA), encoding='utf-8')
+    assert list(lab74.iter_translators(str(path), chunk_size=7)) == DATA["translators"]
+
+def test_stream_main_reports_os_errors(tmp_path, capsys):
+    lab74.main([str(tmp_path), '--stream', '--language', 'English'])
+    assert 'Ошибка:' in capsys.readouterr().out
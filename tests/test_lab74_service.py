@@ -0,0 +1,100 @@
+"""Сервис lab74_service: запуск на свободном порту, запросы, перезагрузка и ошибки"""
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+import pytest
+
+from conftest import ROOT
+from lab74_service import Client
+
+SERVICE = os.path.join(ROOT, 'lab07', 'lab74_service.py')
+
+def translator(translator_id, language, specialization, rate, experience):
+    return {"translator_id": translator_id, "name": f"T{translator_id}", "language": language,
+            "specialization": specialization, "rate": rate, "experience_years": experience}
+
+def write_translators(path, translators):
+    # новое содержимое с другим размером и временем изменения, чтобы сервис
+    # заметил изменение даже в пределах одного тика mtime
+    path.write_text(json.dumps({"translators": translators}), encoding='utf-8')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+def wait_for(predicate, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = predicate()
+        if result:
+            return result
+        time.sleep(0.05)
+    raise AssertionError("условие не выполнено за отведенное время")
+
+@pytest.fixture
+def service(tmp_path):
+    """Сервис на порту, выбранном системой; возвращает (файл данных, порт)"""
+    data = tmp_path / 'translators.json'
+    write_translators(data, [
+        translator(1, "English", "legal", 10, 2),
+        translator(2, "english", "Legal", 30, 8),
+        translator(3, "German", "medical", 20, 6),
+    ])
+    process = subprocess.Popen([sys.executable, SERVICE, 'serve', str(data), '--port', '0', '--poll', '0.1'],
+                               stderr=subprocess.PIPE, text=True, encoding='utf-8')
+    try:
+        port = None
+        for line in process.stderr:
+            match = re.search(r"слушает [\d.]+:(\d+)", line)
+            if match:
+                port = int(match.group(1))
+                break
+        assert port, "сервис не сообщил адрес"
+        yield data, port
+    finally:
+        process.terminate()
+        process.wait(10)
+        process.stderr.close()
+
+def test_queries(service):
+    _, port = service
+    with Client(port=port) as client:
+        assert client.request('ping') == {'ok': True, 'result': 'pong'}
+        assert client.request('count', 'ENGLISH')['result'] == 2
+        names = {t['name'] for t in client.request('language', 'english')['result']}
+        assert names == {'T1', 'T2'}
+        assert client.request('avg_rate', 'LEGAL')['result'] == 20.0
+        assert client.request('stats')['result']['translators'] == 3
+
+def test_errors(service):
+    _, port = service
+    with Client(port=port) as client:
+        response = client.request('frobnicate')
+        assert not response['ok'] and 'frobnicate' in response['error']
+        assert not client.request('count')['ok']
+        # соединение остается рабочим после ошибок
+        assert client.request('ping')['ok']
+
+def test_reload_and_broken_file(service):
+    data, port = service
+    with Client(port=port) as client:
+        write_translators(data, [translator(1, "French", "legal", 50, 3)])
+        wait_for(lambda: client.request('count', 'french')['result'] == 1)
+        reloads = client.request('stats')['result']['reloads']
+
+        # запись с несравнимым translator_id вызывает TypeError при индексации
+        write_translators(data, [translator(["x"], "Spanish", "legal", 1, 1)])
+        stats = wait_for(lambda: client.request('stats')['result']['last_error'] and
+                         client.request('stats')['result'])
+        assert 'TypeError' in stats['last_error']
+        assert stats['reloads'] == reloads
+        # прежние данные остаются доступны
+        assert client.request('count', 'french')['result'] == 1
+
+        # наблюдение продолжается: следующая корректная правка загружается
+        write_translators(data, [translator(1, "Spanish", "legal", 5, 1),
+                                 translator(2, "Spanish", "legal", 15, 1)])
+        wait_for(lambda: client.request('count', 'spanish')['result'] == 2)
+        assert client.request('stats')['result']['last_error'] is None
@@ -0,0 +1,72 @@
+"""lab81: запросы к локальному серверу вместо restcountries и flagcdn"""
+import json
+import os
+
+import pytest
+
+pytest.importorskip('requests')
+
+import lab81
+
+COUNTRIES = [
+    {"name": {"common": "India"}, "capital": ["New Delhi"], "area": 3287590,
+     "population": 1380004385, "cca2": "IN", "region": "Asia"},
+    {"name": {"common": "Bhutan"}, "capital": ["Thimphu"], "area": 38394,
+     "population": 771612, "cca2": "BT", "region": "Asia"},
+]
+
+def region_path(region):
+    return f"/region/{region}?fields={lab81.COUNTRY_FIELDS}"
+
+def test_get_countries_filters_by_population(http_server):
+    http_server.routes[region_path('asia')] = (200, {}, json.dumps(COUNTRIES).encode())
+    countries = lab81.get_countries(('asia',), base_url=http_server.url, retries=0)
+    assert [country['name'] for country in countries] == ['India']
+    assert countries[0]['cca2'] == 'in'
+
+def test_get_countries_rejects_non_json(http_server, tmp_path):
+    http_server.routes[region_path('asia')] = (200, {}, b'<html>maintenance</html>')
+    cache = lab81.HttpCache(str(tmp_path / 'cache'))
+    assert lab81.get_countries(('asia',), base_url=http_server.url, retries=0, cache=cache) == []
+    # некорректный ответ не остается в кэше
+    assert os.listdir(tmp_path / 'cache') == []
+
+def test_cache_sends_conditional_request(http_server, tmp_path):
+    body = json.dumps(COUNTRIES).encode()
+
+    def respond(headers):
+        if headers.get('If-None-Match') == '"v1"':
+            return 304, {}, b''
+        return 200, {'ETag': '"v1"'}, body
+
+    http_server.routes[region_path('asia')] = (200, {}, respond)
+    cache = lab81.HttpCache(str(tmp_path / 'cache'))
+    for _ in range(2):
+        countries = lab81.get_countries(('asia',), base_url=http_server.url, retries=0, cache=cache)
+        assert [country['name'] for country in countries] == ['India']
+    assert [headers.get('If-None-Match') for _, headers in http_server.requests] == [None, '"v1"']
+
+def test_download_flag_into_store(http_server, tmp_path):
+    http_server.routes['/in.png'] = (200, {}, b'\x89PNG fake flag')
+    session = lab81.create_session()
+    country = {'name': 'India', 'cca2': 'in'}
+    flags_dir = str(tmp_path / 'flags')
+    _, filename, written, error = lab81.download_flag(session, country, flags_dir,
+                                                      base_url=http_server.url, retries=0)
+    assert error is None and written
+    with open(filename, 'rb') as f:
+        assert f.read() == b'\x89PNG fake flag'
+    _, _, written, _ = lab81.download_flag(session, country, flags_dir,
+                                           base_url=http_server.url, retries=0)
+    assert not written
+    assert lab81.verify_flags(flags_dir) == {'corrupt': [], 'missing': [], 'bad_links': []}
+
+def test_results_json_keeps_format(http_server, tmp_path):
+    http_server.routes[region_path('asia')] = (200, {}, json.dumps(COUNTRIES).encode())
+    countries = lab81.calculate_population_density(
+        lab81.get_countries(('asia',), base_url=http_server.url, retries=0))
+    output = tmp_path / 'results.json'
+    lab81.save_to_json(countries, str(output))
+    saved = json.loads(output.read_text(encoding='utf-8'))
+    assert list(saved[0]) == ['name', 'capital', 'area', 'population', 'cca2', 'density']
+    assert countries[0]['region'] == 'Asia'
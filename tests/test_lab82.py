@@ -0,0 +1,45 @@
+"""lab82: ограничение частоты, разбор топ-листа и сбор с локального сервера"""
+import csv
+import os
+
+import pytest
+
+pytest.importorskip('requests')
+
+import lab82
+from conftest import ROOT
+
+with open(os.path.join(ROOT, 'lab08', 'fixtures', 'toplist_sample.html'), 'rb') as f:
+    SAMPLE = f.read()
+
+@pytest.mark.parametrize('rate, capacity', [(0, 1), (-1, 1), (1, 0.5)])
+def test_token_bucket_rejects_values_that_never_refill(rate, capacity):
+    with pytest.raises(ValueError):
+        lab82.TokenBucket(rate, capacity)
+
+def test_parse_args_validation(capsys):
+    for argv in (['--rate', '0'], ['--burst', '0'], ['-o', 'out.csv.gz', '--resume']):
+        with pytest.raises(SystemExit):
+            lab82.parse_args(argv)
+    assert lab82.parse_args(['-o', 'out.csv.gz']).output == 'out.csv.gz'
+
+def test_parsers_agree_on_fixture():
+    fast = lab82.extract_rows_fast(SAMPLE, '100-metres', 'men', 2024)
+    assert fast == lab82.extract_rows_bs4(SAMPLE, '100-metres', 'men', 2024)
+    assert fast[0]['athlete'] == 'Kishane THOMPSON' and fast[0]['rank'] == '1'
+
+def test_main_writes_pages_in_task_order(http_server, tmp_path):
+    for discipline in lab82.DISCIPLINES:
+        for gender in lab82.GENDERS:
+            path = f"/{discipline}/all/{gender}/senior/2024"
+            http_server.routes[path] = (200, {}, SAMPLE)
+    output = str(tmp_path / 'top.csv')
+    argv = ['--base-url', http_server.url, '--rate', '1000', '--burst', '10', '-o', output]
+    assert lab82.main(argv) is None
+    with open(output, encoding='utf-8-sig', newline='') as f:
+        rows = list(csv.DictReader(f))
+    expected = [(lab82.DISCIPLINES[discipline], gender.capitalize())
+                for discipline in lab82.DISCIPLINES for gender in lab82.GENDERS]
+    assert [(row['discipline'], row['gender']) for row in rows] == expected
+    # после полного прогона журнал не нужен
+    assert not os.path.exists(lab82.progress_path(output))
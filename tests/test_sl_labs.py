@@ -0,0 +1,23 @@
+"""sl_labs: время импорта команд (python -X importtime) и отсутствие тяжелых модулей"""
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+sys.path.insert(0, ROOT)
+import sl_labs
+
+@pytest.mark.parametrize('command', sorted(sl_labs.COMMANDS))
+def test_import_time_budget(command):
+    sl_labs.import_profile(command)  # запись .pyc не учитывается
+    profiles = [sl_labs.import_profile(command) for _ in range(3)]
+    best = min(total for total, _ in profiles)
+    loaded = {name.split('.')[0] for _, modules in profiles for name in modules}
+    heavy = sorted(loaded & set(sl_labs.HEAVY_MODULES))
+    assert not heavy, f"загружены при старте: {', '.join(heavy)}"
+    assert best / 1000 <= sl_labs.DEFAULT_BUDGET_MS
+
+def test_unknown_command_is_rejected():
+    with pytest.raises(SystemExit):
+        sl_labs.parse_args(['lab99'])